@@ -0,0 +1,12 @@
+class TimeImport:
+    def timeraw_import_pybamm(self):
+        # run in a new interpreter, so that pybamm is not already imported
+        return """
+        import pybamm
+        """
+
+    def timeraw_import_pybamm_and_plotting(self):
+        return """
+        import pybamm
+        pybamm.QuickPlot
+        """
@@ -5,7 +5,7 @@ demote_expressions_to_32bit = False
 
 # Utility classes and methods
 from .util import root_dir
-from .util import Timer, TimerTime, FuzzyDict
+from .util import Timer, TimerTime, FuzzyDict, LazyFuzzyDict
 from .util import (
     root_dir,
     load,
@@ -27,7 +27,7 @@ from .expression_tree.symbol import *
 from .expression_tree.binary_operators import *
 from .expression_tree.concatenations import *
 from .expression_tree.array import Array, linspace, meshgrid
-from .expression_tree.matrix import Matrix
+from .expression_tree.matrix import Matrix, BlockDiagonalMatrix
 from .expression_tree.unary_operators import *
 from .expression_tree.averages import *
 from .expression_tree.averages import _BaseAverage
@@ -38,6 +38,7 @@ from .expression_tree.discrete_time_sum import *
 from .expression_tree.input_parameter import InputParameter
 from .expression_tree.parameter import Parameter, FunctionParameter
 from .expression_tree.scalar import Scalar
+from .expression_tree.bound_parameter import BoundParameter
 from .expression_tree.variable import *
 from .expression_tree.coupled_variable import *
 from .expression_tree.independent_variable import *
@@ -128,6 +129,7 @@ from .parameters.parameter_sets import parameter_sets
 # Mesh and Discretisation classes
 from .discretisations.discretisation import Discretisation
 from .discretisations.discretisation import has_bc_of_form
+from .discretisations.model_cache import ModelCache, ContentHasher
 from .meshes.meshes import Mesh, SubMesh, MeshGenerator
 from .meshes.zero_dimensional_submesh import SubMesh0D
 from .meshes.one_dimensional_submeshes import (
@@ -139,13 +141,7 @@ from .meshes.one_dimensional_submeshes import (
     SpectralVolume1DSubMesh,
     SymbolicUniform1DSubMesh,
 )
-from .meshes.scikit_fem_submeshes import (
-    ScikitSubMesh2D,
-    ScikitUniform2DSubMesh,
-    ScikitExponential2DSubMesh,
-    ScikitChebyshev2DSubMesh,
-    UserSupplied2DSubMesh,
-)
+from .meshes.adaptive_mesh_refinement import AdaptiveMeshRefinement
 
 # Serialisation
 from .models.base_model import load_model
@@ -155,52 +151,83 @@ from .spatial_methods.spatial_method import SpatialMethod
 from .spatial_methods.zero_dimensional_method import ZeroDimensionalSpatialMethod
 from .spatial_methods.finite_volume import FiniteVolume
 from .spatial_methods.spectral_volume import SpectralVolume
-from .spatial_methods.scikit_finite_element import ScikitFiniteElement
 
 # Solver classes
+from .solvers.solver_statistics import SolverStatistics
 from .solvers.solution import Solution, EmptySolution, make_cycle_solution
+from .solvers.streamed_solution import StreamedSolution
 from .solvers.processed_variable_time_integral import ProcessedVariableTimeIntegral
 from .solvers.processed_variable import ProcessedVariable, process_variable
 from .solvers.processed_variable_computed import ProcessedVariableComputed
 from .solvers.summary_variable import SummaryVariables
+from .solvers.consistent_state_cache import ConsistentStateCache
 from .solvers.base_solver import BaseSolver
 from .solvers.dummy_solver import DummySolver
 from .solvers.algebraic_solver import AlgebraicSolver
 from .solvers.casadi_solver import CasadiSolver
 from .solvers.casadi_algebraic_solver import CasadiAlgebraicSolver
 from .solvers.scipy_solver import ScipySolver
-
-from .solvers.jax_solver import JaxSolver
-from .solvers.jax_bdf_solver import jax_bdf_integrate
-
-from .solvers.idaklu_jax import IDAKLUJax
 from .solvers.idaklu_solver import IDAKLUSolver, has_iree
+from .solvers.compiled_model import CompiledModel, CompiledSolution
 
 # Experiments
 from .experiment.experiment import Experiment
 from . import experiment
 from .experiment import step
 
-# Plotting
-from .plotting.quick_plot import QuickPlot, close_plots, QuickPlotAxes
-from .plotting.plot import plot
-from .plotting.plot2D import plot2D
-from .plotting.plot_voltage_components import plot_voltage_components
-from .plotting.plot_thermal_components import plot_thermal_components
-from .plotting.plot_summary_variables import plot_summary_variables
-from .plotting.dynamic_plot import dynamic_plot
-
 # Simulation
 from .simulation import Simulation, load_sim, is_notebook
 
 # Batch Study
-from .batch_study import BatchStudy
+from .batch_study import BatchStudy, BatchSolutionSummary
 
 # Callbacks, telemetry, config
 from . import callbacks, telemetry, config
 
-# Pybamm Data manager using pooch
-from .pybamm_data import DataLoader
+# Classes and functions that are slow to import, or depend on optional packages,
+# are only imported when first accessed, see `__getattr__`
+_lazy_imports = {
+    # Meshes and spatial methods using scikit-fem
+    "ScikitSubMesh2D": ".meshes.scikit_fem_submeshes",
+    "ScikitUniform2DSubMesh": ".meshes.scikit_fem_submeshes",
+    "ScikitExponential2DSubMesh": ".meshes.scikit_fem_submeshes",
+    "ScikitChebyshev2DSubMesh": ".meshes.scikit_fem_submeshes",
+    "UserSupplied2DSubMesh": ".meshes.scikit_fem_submeshes",
+    "ScikitFiniteElement": ".spatial_methods.scikit_finite_element",
+    # Jax solvers
+    "JaxSolver": ".solvers.jax_solver",
+    "JaxCompilationCache": ".solvers.jax_compilation_cache",
+    "jax_bdf_integrate": ".solvers.jax_bdf_solver",
+    "IDAKLUJax": ".solvers.idaklu_jax",
+    # Plotting
+    "QuickPlot": ".plotting.quick_plot",
+    "close_plots": ".plotting.quick_plot",
+    "QuickPlotAxes": ".plotting.quick_plot",
+    "plot": ".plotting.plot",
+    "plot2D": ".plotting.plot2D",
+    "plot_voltage_components": ".plotting.plot_voltage_components",
+    "plot_thermal_components": ".plotting.plot_thermal_components",
+    "plot_summary_variables": ".plotting.plot_summary_variables",
+    "dynamic_plot": ".plotting.dynamic_plot",
+    # Pybamm Data manager using pooch
+    "DataLoader": ".pybamm_data",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        import importlib
+
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
+
 
 # Fix Casadi import
 import os
@@ -1,8 +1,14 @@
 #
 # BatchStudy class
 #
-import pybamm
+import multiprocessing as mp
+import platform
 from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+import pybamm
 
 
 class BatchStudy:
@@ -107,27 +113,73 @@ class BatchStudy:
         starting_solution=None,
         initial_soc=None,
         t_interp=None,
+        nproc=None,
+        save_dir=None,
         **kwargs,
     ):
         """
         For more information on the parameters used in the solve,
         See :meth:`pybamm.Simulation.solve`
+
+        Parameters
+        ----------
+        nproc : int, optional
+            Number of processes to use. If None (default) or 1, the simulations are
+            solved one after another in this process and stored in ``sims``. Otherwise,
+            they are solved in a pool of ``nproc`` processes, and a
+            :class:`pybamm.BatchSolutionSummary` of each simulation is stored in
+            ``results`` instead. Each process builds each distinct simulation once,
+            and reuses it for all the solvers and output variables routed to it.
+        save_dir : str or :class:`pathlib.Path`, optional
+            Only used if ``nproc`` is greater than 1. If given, the full solution of
+            each simulation is saved in this directory, and can be loaded with
+            :meth:`pybamm.BatchSolutionSummary.load`.
         """
         self.sims = []
-        iter_func = product if self.permutations else zip
+        self.results = []
+        solve_kwargs = {
+            "t_eval": t_eval,
+            "solver": solver,
+            "save_at_cycles": save_at_cycles,
+            "calc_esoh": calc_esoh,
+            "starting_solution": starting_solution,
+            "initial_soc": initial_soc,
+            **kwargs,
+        }
+
+        if nproc is not None and nproc > 1:
+            self._solve_in_pool(nproc, solve_kwargs, save_dir)
+            return
 
-        # Instantiate items in INPUT_LIST based on the value of self.permutations
+        for indices in self._combinations():
+            sim = self._create_simulation(indices)
+            self._solve_simulation(sim, solve_kwargs)
+            self.sims.append(sim)
+
+    def _input_values(self):
+        """Instantiate items in INPUT_LIST based on the value of self.permutations"""
         inp_values = []
         for name in self.INPUT_LIST:
             if getattr(self, name):
-                inp_value = getattr(self, name).values()
+                inp_value = list(getattr(self, name).items())
             elif self.permutations:
-                inp_value = [None]
+                inp_value = [(None, None)]
             else:
-                inp_value = [None] * len(self.models)
+                inp_value = [(None, None)] * len(self.models)
             inp_values.append(inp_value)
+        return [list(self.models.items()), *inp_values]
+
+    def _combinations(self):
+        """
+        Indices into the models and each item in INPUT_LIST of the simulations to
+        run
+        """
+        iter_func = product if self.permutations else zip
+        return list(iter_func(*[range(len(values)) for values in self._input_values()]))
 
-        for (
+    def _create_simulation(self, indices):
+        values = self._input_values()
+        (
             model,
             experiment,
             geometry,
@@ -138,48 +190,93 @@ class BatchStudy:
             solver,
             output_variable,
             C_rate,
-        ) in iter_func(self.models.values(), *inp_values):
-            sim = pybamm.Simulation(
-                model,
-                experiment=experiment,
-                geometry=geometry,
-                parameter_values=parameter_value,
-                submesh_types=submesh_type,
-                var_pts=var_pt,
-                spatial_methods=spatial_method,
-                solver=solver,
-                output_variables=output_variable,
-                C_rate=C_rate,
-            )
-            # Repeat to get average solve time and integration time
-            solve_time = 0
-            integration_time = 0
-            for _ in range(self.repeats):
-                sol = sim.solve(
-                    t_eval,
-                    solver,
-                    save_at_cycles,
-                    calc_esoh,
-                    starting_solution,
-                    initial_soc,
-                    **kwargs,
+        ) = (values[i][index][1] for i, index in enumerate(indices))
+        return pybamm.Simulation(
+            model,
+            experiment=experiment,
+            geometry=geometry,
+            parameter_values=parameter_value,
+            submesh_types=submesh_type,
+            var_pts=var_pt,
+            spatial_methods=spatial_method,
+            solver=solver,
+            output_variables=output_variable,
+            C_rate=C_rate,
+        )
+
+    def _solve_simulation(self, sim, solve_kwargs):
+        # Repeat to get average solve time and integration time
+        solve_time = 0
+        integration_time = 0
+        for _ in range(self.repeats):
+            sol = sim.solve(**solve_kwargs)
+            solve_time += sol.solve_time
+            integration_time += sol.integration_time
+        sim.solution.solve_time = solve_time / self.repeats
+        sim.solution.integration_time = integration_time / self.repeats
+        return sim.solution
+
+    def _solve_in_pool(self, nproc, solve_kwargs, save_dir):
+        if save_dir is not None:
+            save_dir = Path(save_dir)
+            save_dir.mkdir(parents=True, exist_ok=True)
+
+        # Split the simulations into chunks that each use a single model, so that
+        # the simulations of a chunk can share the processes' built simulations
+        combinations = self._combinations()
+        chunk_size = max(1, -(-len(combinations) // nproc))
+        chunks = []
+        for model_index in range(len(self.models)):
+            positions = [
+                position
+                for position, indices in enumerate(combinations)
+                if indices[0] == model_index
+            ]
+            for start in range(0, len(positions), chunk_size):
+                chunk_positions = positions[start : start + chunk_size]
+                chunks.append(
+                    [(position, combinations[position]) for position in chunk_positions]
                 )
-                solve_time += sol.solve_time
-                integration_time += sol.integration_time
-            sim.solution.solve_time = solve_time / self.repeats
-            sim.solution.integration_time = integration_time / self.repeats
-            self.sims.append(sim)
+
+        context = mp.get_context(
+            pybamm.BaseSolver.get_platform_context(platform.system())
+        )
+        with context.Pool(
+            processes=nproc, initializer=_init_worker, initargs=(self,)
+        ) as pool:
+            chunk_results = pool.starmap(
+                _solve_chunk,
+                [(chunk, solve_kwargs, save_dir) for chunk in chunks],
+            )
+            pool.close()
+            pool.join()
+
+        results = [None] * len(combinations)
+        for chunk_result in chunk_results:
+            for position, summary in chunk_result:
+                results[position] = summary
+        self.results = results
 
     def plot(self, output_variables=None, **kwargs):
         """
         For more information on the parameters used in the plot,
         See :meth:`pybamm.Simulation.plot`
         """
+        self._check_sims()
         self.quick_plot = pybamm.dynamic_plot(
             self.sims, output_variables=output_variables, **kwargs
         )
         return self.quick_plot
 
+    def _check_sims(self):
+        if not hasattr(self, "sims"):
+            raise ValueError("The simulations have not been solved yet.")
+        if not self.sims and self.results:
+            raise ValueError(
+                "The simulations were solved in separate processes, so only their "
+                "summaries are available in `results`"
+            )
+
     def create_gif(self, number_of_images=80, duration=0.1, output_filename="plot.gif"):
         """
         Generates x plots over a time span of t_eval and compiles them to create
@@ -195,8 +292,7 @@ class BatchStudy:
             Name of the generated GIF file.
 
         """
-        if not hasattr(self, "sims"):
-            raise ValueError("The simulations have not been solved yet.")
+        self._check_sims()
         if self.quick_plot is None:
             self.quick_plot = pybamm.QuickPlot(self.sims)
 
@@ -205,3 +301,148 @@ class BatchStudy:
             duration=duration,
             output_filename=output_filename,
         )
+
+
+class BatchSolutionSummary:
+    """
+    A lightweight summary of the solution of one simulation of a
+    :class:`pybamm.BatchStudy` that was solved in a separate process. This is
+    returned instead of the full :class:`pybamm.Solution`, which can be large and
+    slow to send between processes.
+
+    Parameters
+    ----------
+    names : dict
+        The keys of the model and of each item in
+        :attr:`pybamm.BatchStudy.INPUT_LIST` used in the simulation (None for items
+        that were not given)
+    t : :class:`numpy.ndarray`
+        The times of the solution
+    termination : str
+        The reason for termination
+    solve_time : :class:`pybamm.TimerTime`
+        The solve time, averaged over the repeats
+    integration_time : :class:`pybamm.TimerTime`
+        The integration time, averaged over the repeats
+    variables : dict
+        The entries of the output variables of the simulation
+    summary_variables : dict, optional
+        The summary variables, if the simulation was an experiment
+    path : :class:`pathlib.Path`, optional
+        The file in which the full solution was saved
+    """
+
+    def __init__(
+        self,
+        names,
+        t,
+        termination,
+        solve_time,
+        integration_time,
+        variables,
+        summary_variables=None,
+        path=None,
+    ):
+        self.names = names
+        self.t = t
+        self.termination = termination
+        self.solve_time = solve_time
+        self.integration_time = integration_time
+        self.variables = variables
+        self.summary_variables = summary_variables
+        self.path = path
+
+    def __getitem__(self, key):
+        return self.variables[key]
+
+    def load(self):
+        """
+        Load the full solution of the simulation
+
+        Returns
+        -------
+        :class:`pybamm.Solution`
+            The solution
+        """
+        if self.path is None:
+            raise ValueError(
+                "The solution was not saved, pass `save_dir` to "
+                "`BatchStudy.solve` to save it"
+            )
+        return pybamm.load(self.path)
+
+
+# State of each process in the pool used by BatchStudy.solve
+_worker_batch_study = None
+_worker_simulations = {}
+
+
+def _init_worker(batch_study):
+    global _worker_batch_study
+    _worker_batch_study = batch_study
+    _worker_simulations.clear()
+
+
+def _solve_chunk(chunk, solve_kwargs, save_dir):
+    return [
+        (position, _solve_combination(position, indices, solve_kwargs, save_dir))
+        for position, indices in chunk
+    ]
+
+
+def _solve_combination(position, indices, solve_kwargs, save_dir):
+    batch_study = _worker_batch_study
+    values = batch_study._input_values()
+    model_index, solver_index, output_variables_index = indices[0], *indices[7:9]
+
+    # The solver and output variables don't change how the simulation is built, so
+    # a built simulation is reused by all the combinations that differ only in these
+    key = indices[:7] + indices[9:]
+    sim, sim_solver_index = _worker_simulations.get(key, (None, None))
+    if sim is None:
+        sim = batch_study._create_simulation(indices)
+    elif sim_solver_index != solver_index:
+        solver = values[7][solver_index][1] or values[0][model_index][1].default_solver
+        _set_solver(sim, solver)
+    _worker_simulations[key] = (sim, solver_index)
+
+    solution = batch_study._solve_simulation(sim, solve_kwargs)
+
+    names = {
+        name: value[index][0]
+        for name, value, index in zip(
+            ["models", *batch_study.INPUT_LIST], values, indices
+        )
+    }
+    output_variables = values[8][output_variables_index][1] or []
+    variables = {var: solution[var].entries for var in output_variables}
+    summary_variables = None
+    if solution.summary_variables is not None:
+        summary_variables = {
+            var: np.asarray(solution.summary_variables[var])
+            for var in ["Cycle number", *solution.summary_variables.all_variables]
+        }
+    path = None
+    if save_dir is not None:
+        path = save_dir / f"solution_{position}.pkl"
+        solution.save(path)
+
+    return BatchSolutionSummary(
+        names,
+        solution.t,
+        solution.termination,
+        solution.solve_time,
+        solution.integration_time,
+        variables,
+        summary_variables,
+        path,
+    )
+
+
+def _set_solver(sim, solver):
+    """Use a different solver for a simulation that has already been built"""
+    sim._solver = solver.copy()
+    if sim.steps_to_built_solvers:
+        sim.steps_to_built_solvers = {
+            step: solver.copy() for step in sim.steps_to_built_solvers
+        }
@@ -254,3 +254,43 @@ class LoggingCallback(Callback):
             f"triggered during '{operating_conditions}'. The returned solution only "
             f"contains up to step {step_num} of cycle {cycle_num}. "
         )
+
+
+class StreamingCallback(Callback):
+    """
+    Streaming callback, writes each completed cycle of an experiment to disk so that
+    the memory used by the simulation is bounded by a single cycle, however many
+    cycles the experiment has. The summary variables of every cycle are kept in
+    memory.
+
+    When this callback is passed to :meth:`pybamm.Simulation.solve`, the returned
+    solution is a :class:`pybamm.StreamedSolution`, which reads the cycles back
+    from disk when they are accessed.
+
+    Parameters
+    ----------
+    directory : str or :class:`pathlib.Path`
+        The directory in which the cycles are stored.
+    compress : bool, optional
+        Whether to compress the stored cycles. Default is False.
+    overwrite : bool, optional
+        Whether to remove the cycles already stored in `directory`, e.g. by a
+        previous experiment. Default is False, see :class:`pybamm.StreamedSolution`.
+    """
+
+    def __init__(self, directory, compress=False, overwrite=False):
+        self.directory = directory
+        self.compress = compress
+        self.overwrite = overwrite
+        self.solution = None
+
+    def on_experiment_start(self, logs):
+        self.solution = pybamm.StreamedSolution(
+            self.directory, compress=self.compress, overwrite=self.overwrite
+        )
+
+    def on_cycle_end(self, logs):
+        # there is no cycle solution if the cycle failed before any step was solved
+        if "cycle solution" in logs:
+            cycle_num = logs["cycle number"][0]
+            self.solution.append_cycle(logs["cycle solution"], cycle_num)
@@ -1,5 +1,6 @@
 import pybamm
 import os
+import re
 import warnings
 from sys import _getframe
 from pybamm.util import import_optional_dependency
@@ -30,12 +31,34 @@ class Citations:
 
     def __init__(self):
         self._check_for_bibtex()
-        # Dict mapping citations keys to BibTex entries
-        self._all_citations: dict[str, str] = dict()
-
-        self.read_citations()
+        # Dict mapping citations keys to BibTex entries, only filled in when first
+        # needed since parsing `pybamm/CITATIONS.bib` is slow
+        self._citations: dict[str, str] | None = None
+        self._citation_keys = self._read_citation_keys()
         self._reset()
 
+    @property
+    def _all_citations(self):
+        """Dict mapping citations keys to BibTex entries"""
+        if self._citations is None:
+            self._citations = dict()
+            self.read_citations()
+        return self._citations
+
+    def _read_citation_keys(self):
+        """Returns the keys of the citations in `pybamm/CITATIONS.bib`, without
+        parsing the entries"""
+        if self._module_import_error:
+            return set()
+        citations_file = os.path.join(pybamm.__path__[0], "CITATIONS.bib")
+        with open(citations_file) as f:
+            return set(re.findall(r"^@\w+\s*\{\s*([^,\s]+)\s*,", f.read(), re.M))
+
+    def _is_known_citation(self, key):
+        if self._citations is None:
+            return key in self._citation_keys
+        return key in self._citations
+
     def _check_for_bibtex(self):
         try:
             import_optional_dependency("pybtex")
@@ -115,7 +138,7 @@ class Citations:
             - A BibTeX formatted citation
         """
         # Check if citation is a known key
-        if key in self._all_citations:
+        if self._is_known_citation(key):
             self._papers_to_cite.add(key)
             # Add citation tags for the key for verbose output, but
             # don't if they already exist in _citation_tags dict
@@ -1 +1 @@
-__all__ = ['discretisation']
+__all__ = ['discretisation', 'model_cache']
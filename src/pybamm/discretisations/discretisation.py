@@ -1,6 +1,8 @@
 #
 # Interface for discretisation
 #
+import copy
+
 import pybamm
 import numpy as np
 from collections import defaultdict, OrderedDict
@@ -36,6 +38,18 @@ class Discretisation:
         (not used anywhere in the model, len(rhs)>1), then the variable
         is moved to be explicitly integrated when called by the solution object.
         Default is False.
+    reuse_discretised_symbols : bool, optional
+        If True, symbols discretised while processing a model are kept when
+        processing further models with the same discretisation, as long as the
+        state vector slices and boundary conditions they depend on are unchanged.
+        This avoids rediscretising the shared equations of several similar models,
+        such as the models for each step of an experiment. Default is False.
+    lazy_variables : bool, optional
+        If True, the variables of a model (`model.variables`) are only discretised
+        when they are first accessed, e.g. when they are first requested from a
+        solution, using the state vector slices and boundary conditions of the
+        model. This makes discretisation faster for models with many variables,
+        most of which are never used. Default is False.
     """
 
     def __init__(
@@ -44,6 +58,8 @@ class Discretisation:
         spatial_methods=None,
         check_model=True,
         remove_independent_variables_from_rhs=False,
+        reuse_discretised_symbols=False,
+        lazy_variables=False,
     ):
         self._mesh = mesh
         if mesh is None:
@@ -75,6 +91,9 @@ class Discretisation:
         self._remove_independent_variables_from_rhs_flag = (
             remove_independent_variables_from_rhs
         )
+        self._reuse_discretised_symbols_flag = reuse_discretised_symbols
+        self._lazy_variables_flag = lazy_variables
+        self._previous_boundary_conditions = {}
 
     @property
     def mesh(self):
@@ -169,8 +188,18 @@ class Discretisation:
 
         # Set the y split for variables
         pybamm.logger.verbose(f"Set variable slices for {model.name}")
+        previous_y_slices = self.y_slices
+        previous_discretised_symbols = self._discretised_symbols
         self.set_variable_slices(variables)
 
+        if self._reuse_discretised_symbols_flag:
+            pybamm.logger.verbose(
+                f"Reuse previously discretised symbols for {model.name}"
+            )
+            self._discretised_symbols = self._reusable_discretised_symbols(
+                previous_discretised_symbols, previous_y_slices, model
+            )
+
         # set boundary conditions (only need key ids for boundary_conditions)
         pybamm.logger.verbose(f"Discretise boundary conditions for {model.name}")
         self._bcs = self.process_boundary_conditions(model)
@@ -206,9 +235,24 @@ class Discretisation:
         # Discretise variables (applying boundary conditions)
         # Note that we **do not** discretise the keys of model.rhs,
         # model.initial_conditions and model.boundary_conditions
-        pybamm.logger.verbose(f"Discretise variables for {model.name}")
-
-        model_disc.variables = self.process_dict(pre_processed_variables)
+        if self._lazy_variables_flag:
+            # Discretise each variable when it is first accessed. A shallow copy of
+            # the discretisation keeps the slices, boundary conditions and
+            # discretised symbols of this model, even if other models are then
+            # processed with this discretisation
+            pybamm.logger.verbose(f"Defer discretising variables for {model.name}")
+            process_variable = copy.copy(self)._process_variable
+            if isinstance(pre_processed_variables, pybamm.LazyFuzzyDict):
+                # discretise after any processing that is still pending, e.g.
+                # setting parameter values
+                model_disc.variables = pre_processed_variables.then(process_variable)
+            else:
+                model_disc.variables = pybamm.LazyFuzzyDict(
+                    pre_processed_variables, process_variable
+                )
+        else:
+            pybamm.logger.verbose(f"Discretise variables for {model.name}")
+            model_disc.variables = self.process_dict(pre_processed_variables)
 
         # Process parabolic and elliptic equations
         pybamm.logger.verbose(f"Discretise model equations for {model.name}")
@@ -329,6 +373,76 @@ class Discretisation:
         # reset discretised_symbols
         self._discretised_symbols = {}
 
+    def _reusable_discretised_symbols(
+        self, discretised_symbols, previous_y_slices, model
+    ):
+        """
+        Find the symbols discretised for a previous model that are still valid for
+        this model, i.e. symbols that do not depend on any variable whose slices or
+        boundary conditions have changed since the previous model was discretised.
+
+        Parameters
+        ----------
+        discretised_symbols : dict
+            The symbols discretised for the previous model
+        previous_y_slices : dict
+            The variable slices of the previous model
+        model : :class:`pybamm.BaseModel`
+            The model being discretised (variable slices must already be set)
+
+        Returns
+        -------
+        dict
+            The discretised symbols that can be reused
+        """
+        boundary_conditions = {
+            key: {side: (bc[0].id, bc[1]) for side, bc in bcs.items()}
+            for key, bcs in model.boundary_conditions.items()
+        }
+        previous_boundary_conditions = self._previous_boundary_conditions
+        self._previous_boundary_conditions = boundary_conditions
+
+        # Variables are also matched by name, since concatenation variables are
+        # discretised via copies of their children with a different id
+        changed = set()
+        changed_variable_names = set()
+        for var in set(previous_y_slices) | set(self.y_slices):
+            if previous_y_slices.get(var) != self.y_slices.get(var):
+                changed.add(var.id)
+                changed_variable_names.add(var.name)
+        for key in set(previous_boundary_conditions) | set(boundary_conditions):
+            if previous_boundary_conditions.get(key) != boundary_conditions.get(key):
+                changed.add(key.id)
+                # internal boundary conditions are set on the children
+                changed.update(child.id for child in key.children)
+        if not changed:
+            return discretised_symbols
+
+        depends_on_changed = {}
+
+        def depends(symbol):
+            try:
+                return depends_on_changed[symbol.id]
+            except KeyError:
+                if isinstance(symbol, pybamm.VariableDot):
+                    result = symbol.get_variable().name in changed_variable_names
+                elif isinstance(symbol, pybamm.Variable):
+                    result = (
+                        symbol.id in changed or symbol.name in changed_variable_names
+                    )
+                else:
+                    result = symbol.id in changed or any(
+                        depends(child) for child in symbol.children
+                    )
+                depends_on_changed[symbol.id] = result
+                return result
+
+        return {
+            symbol: disc_symbol
+            for symbol, disc_symbol in discretised_symbols.items()
+            if not depends(symbol)
+        }
+
     def _get_variable_size(self, variable):
         """Helper function to determine what size a variable should be"""
         # If domain is empty then variable has size 1
@@ -691,7 +805,11 @@ class Discretisation:
             If any state variable names are already included but with
             incorrect expressions
         """
-        new_variables = {k: v for k, v in variables.items()}
+        if isinstance(variables, pybamm.LazyFuzzyDict):
+            # keep the values that are processed lazily unprocessed
+            new_variables = variables.copy()
+        else:
+            new_variables = {k: v for k, v in variables.items()}
         for var in initial_conditions.keys():
             if var.name not in new_variables:
                 new_variables[var.name] = var
@@ -748,6 +866,10 @@ class Discretisation:
             new_var_eqn_dict[eqn_key] = processed_eqn
         return new_var_eqn_dict
 
+    def _process_variable(self, name, symbol):
+        """Discretise a single entry of `model.variables`, see :meth:`process_dict`."""
+        return self.process_dict({name: symbol})[name]
+
     def process_symbol(self, symbol):
         """Discretise operators in model equations.
         If a symbol has already been discretised, the stored value is returned.
@@ -0,0 +1,344 @@
+#
+# On-disk cache of discretised models
+#
+from __future__ import annotations
+
+import copy
+import hashlib
+import numbers
+import os
+import pickle
+import types
+from pathlib import Path
+
+import numpy as np
+import platformdirs
+from scipy.sparse import issparse
+
+import pybamm
+
+# Symbol attributes (beyond name, domains and children) that change the meaning of a
+# node in the expression tree, and therefore must be part of its content hash
+_SYMBOL_ATTRIBUTES = (
+    "value",
+    "entries",
+    "block",
+    "repeats",
+    "x",
+    "y",
+    "interpolator",
+    "extrapolate",
+    "y_slices",
+    "bounds",
+    "scale",
+    "reference",
+    "expected_size",
+    "coord_sys",
+    "index",
+    "side",
+)
+
+
+class ContentHasher:
+    """
+    Computes a digest of (nested) PyBaMM objects that is stable across processes,
+    used to key the on-disk caches of PyBaMM (e.g. :class:`pybamm.ModelCache`).
+
+    :meth:`pybamm.Symbol.id` cannot be used for this purpose since it relies on the
+    builtin ``hash``, which is salted for strings in every new interpreter.
+
+    Examples
+    --------
+    >>> hasher = pybamm.ContentHasher()
+    >>> hasher.digest(2 * pybamm.Scalar(3)) == hasher.digest(2 * pybamm.Scalar(3))
+    True
+    """
+
+    def __init__(self):
+        self._symbol_digests = {}
+        self._visiting = set()
+
+    def digest(self, obj):
+        """
+        Compute the digest of an object.
+
+        Parameters
+        ----------
+        obj : object
+            The object, e.g. a symbol, or a (nested) list, tuple or dict of symbols,
+            numbers, arrays and parameter values
+
+        Returns
+        -------
+        str
+            A hexadecimal sha256 digest
+        """
+        h = hashlib.sha256()
+        self._update(h, obj)
+        return h.hexdigest()
+
+    def _update(self, h, obj):
+        if obj is None or isinstance(obj, (bool, numbers.Number, str, bytes)):
+            h.update(f"{type(obj).__name__}:{obj!r};".encode())
+        elif isinstance(obj, pybamm.Symbol):
+            h.update(self._symbol_digest(obj).encode())
+        elif isinstance(obj, np.ndarray):
+            h.update(f"ndarray:{obj.dtype}:{obj.shape};".encode())
+            h.update(np.ascontiguousarray(obj).tobytes())
+        elif issparse(obj):
+            obj = obj.tocsr()
+            h.update(f"sparse:{obj.shape};".encode())
+            for arr in (obj.data, obj.indices, obj.indptr):
+                self._update(h, arr)
+        elif isinstance(obj, dict):
+            # keys may be symbols, so sort on their digests rather than the keys
+            items = sorted(
+                (self.digest(k), self.digest(v)) for k, v in dict(obj).items()
+            )
+            h.update(f"dict:{items};".encode())
+        elif isinstance(obj, (list, tuple)):
+            h.update(f"{type(obj).__name__}:{len(obj)};".encode())
+            for item in obj:
+                self._update(h, item)
+        elif isinstance(obj, slice):
+            h.update(f"slice:{obj.start},{obj.stop},{obj.step};".encode())
+        elif isinstance(obj, pybamm.ParameterValues):
+            self._update(h, (obj._dict_items, sorted(obj.rebindable_parameters)))
+        elif isinstance(obj, pybamm.Event):
+            self._update(h, (obj.name, str(obj.event_type), obj.expression))
+        elif isinstance(obj, pybamm.SpatialMethod):
+            # the mesh is hashed separately, so only the options matter here
+            self._update(h, (type(obj), obj.options))
+        elif isinstance(obj, type):
+            h.update(f"type:{obj.__module__}.{obj.__qualname__};".encode())
+        elif isinstance(obj, types.FunctionType):
+            self._update_function(h, obj)
+        elif isinstance(obj, types.CodeType):
+            self._update_code(h, obj)
+        elif id(obj) in self._visiting:
+            # reference cycle between generic objects
+            h.update(b"cycle;")
+        else:
+            self._visiting.add(id(obj))
+            self._update(h, (type(obj), getattr(obj, "__dict__", repr(obj))))
+            self._visiting.discard(id(obj))
+
+    def _update_function(self, h, func):
+        h.update(f"function:{func.__module__}.{func.__qualname__};".encode())
+        self._update_code(h, func.__code__)
+        self._update(h, func.__defaults__)
+        if func.__closure__ is not None:
+            self._update(h, tuple(cell.cell_contents for cell in func.__closure__))
+
+    def _update_code(self, h, code):
+        h.update(code.co_code)
+        self._update(h, code.co_names)
+        self._update(h, code.co_consts)
+
+    def _symbol_digest(self, symbol):
+        key = id(symbol)
+        if key not in self._symbol_digests:
+            h = hashlib.sha256()
+            self._update(h, (type(symbol), symbol.name, symbol.domains))
+            for attr in _SYMBOL_ATTRIBUTES:
+                if attr == "entries" and isinstance(symbol, pybamm.BlockDiagonalMatrix):
+                    # the entries are built from the block and repeats
+                    continue
+                if hasattr(symbol, attr):
+                    self._update(h, (attr, getattr(symbol, attr)))
+            if isinstance(symbol, pybamm.Function) and not isinstance(
+                symbol, pybamm.Interpolant
+            ):
+                self._update(h, symbol.function)
+            for child in symbol.children:
+                h.update(self._symbol_digest(child).encode())
+            # keep a reference to the symbol so that its id is not reused
+            self._symbol_digests[key] = (h.hexdigest(), symbol)
+        return self._symbol_digests[key][0]
+
+
+class ModelCache:
+    """
+    A content-addressed, on-disk cache of discretised models.
+
+    Models are stored using pickle, keyed on the unprocessed model equations and
+    options, the parameter values, the geometry, the submesh types, the number of
+    points and the spatial methods. Every process pointing at the same cache
+    directory can then reuse a model built by any other process, skipping both
+    parameter processing and discretisation.
+
+    The equations of battery models (:class:`pybamm.BaseBatteryModel`) are built
+    from their class, options and submodels, so these models are keyed on those and
+    on the names of their equations, variables and events, rather than on the
+    expressions themselves, which are much slower to hash. If the expressions of
+    such a model are changed after it is created, use another cache directory or
+    call :meth:`ModelCache.clear`.
+
+    Parameters
+    ----------
+    cache_dir : str or :class:`pathlib.Path`, optional
+        The directory in which models are stored. Defaults to a "models" directory
+        inside the user cache directory for PyBaMM.
+
+    Examples
+    --------
+    >>> cache = pybamm.ModelCache()
+    >>> sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), model_cache=cache)
+    >>> sim.build()  # doctest: +SKIP
+    """
+
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = Path(platformdirs.user_cache_dir("pybamm")) / "models"
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def key(
+        self,
+        model,
+        parameter_values,
+        geometry,
+        submesh_types,
+        var_pts,
+        spatial_methods,
+        discretisation_kwargs=None,
+    ):
+        """
+        Compute the cache key for a model and the settings used to build it.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The unprocessed model
+        parameter_values : :class:`pybamm.ParameterValues`
+            The parameter values used to process the model
+        geometry : :class:`pybamm.Geometry`
+            The unprocessed geometry
+        submesh_types : dict
+            The types of submesh used on each subdomain
+        var_pts : dict
+            The number of points used by each spatial variable
+        spatial_methods : dict
+            The spatial method used on each domain
+        discretisation_kwargs : dict, optional
+            Any keyword arguments passed to :class:`pybamm.Discretisation`
+
+        Returns
+        -------
+        str
+            A hexadecimal digest identifying the discretised model
+        """
+        if isinstance(model, pybamm.BaseBatteryModel):
+            model_description = (
+                type(model),
+                model.name,
+                model.options,
+                [(name, type(submodel)) for name, submodel in model.submodels.items()],
+                [variable.name for variable in model.rhs],
+                [variable.name for variable in model.algebraic],
+                list(model.variables),
+                [event.name for event in model.events],
+                model.convert_to_format,
+                model.use_jacobian,
+            )
+        else:
+            model_description = (
+                type(model),
+                model.name,
+                getattr(model, "options", None),
+                model.rhs,
+                model.algebraic,
+                model.initial_conditions,
+                model.boundary_conditions,
+                model.events,
+                model.variables,
+                model.convert_to_format,
+                model.use_jacobian,
+            )
+        return ContentHasher().digest(
+            (
+                pybamm.__version__,
+                model_description,
+                parameter_values,
+                geometry,
+                submesh_types,
+                var_pts,
+                spatial_methods,
+                discretisation_kwargs or {},
+            )
+        )
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.pkl"
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    def load(self, key):
+        """
+        Load a discretised model and its mesh from the cache.
+
+        If the variables of the model are processed lazily (see
+        :class:`pybamm.LazyFuzzyDict`), only the variables that had been processed
+        when the model was stored are loaded, and the unprocessed values of the
+        others must be given with :meth:`pybamm.LazyFuzzyDict.attach` before they are
+        accessed.
+
+        Parameters
+        ----------
+        key : str
+            The cache key, see :meth:`ModelCache.key`
+
+        Returns
+        -------
+        tuple or None
+            The discretised model and the mesh it was discretised on, or None if
+            there is no entry for this key (or the entry cannot be read).
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        pybamm.logger.info(f"Loaded discretised model '{entry[0].name}' from cache")
+        return entry
+
+    def save(self, key, model, mesh=None):
+        """
+        Store a discretised model, and optionally its mesh, in the cache.
+
+        Only the variables of the model that have been processed are stored, if
+        they are processed lazily (see :meth:`pybamm.LazyFuzzyDict.detached`), so
+        that storing a model does not process all of them. The entry is written to a
+        temporary file and moved into place, so that concurrent processes never read
+        a partially written entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key, see :meth:`ModelCache.key`
+        model : :class:`pybamm.BaseModel`
+            The discretised model
+        mesh : :class:`pybamm.Mesh`, optional
+            The mesh the model was discretised on
+        """
+        if not model.is_discretised:
+            raise pybamm.ModelError("Only discretised models can be cached")
+        if isinstance(model.variables, pybamm.LazyFuzzyDict):
+            model = copy.copy(model)
+            model.variables = model.variables.detached()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((model, mesh), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.pkl"):
+                path.unlink()
@@ -1,4 +1,4 @@
-__all__ = ['array', 'averages', 'binary_operators', 'broadcasts',
+__all__ = ['array', 'averages', 'binary_operators', 'bound_parameter', 'broadcasts',
            'concatenations', 'exceptions', 'functions', 'independent_variable',
            'input_parameter', 'interpolant', 'matrix', 'operations',
            'parameter', 'printing', 'scalar', 'state_vector', 'symbol',
@@ -3,11 +3,14 @@
 #
 from __future__ import annotations
 import numpy as np
+from typing import TYPE_CHECKING
 from scipy.sparse import csr_matrix, issparse
 
 import pybamm
 from pybamm.type_definitions import DomainType, AuxiliaryDomainType, DomainsType
-import sympy
+
+if TYPE_CHECKING:  # pragma: no cover
+    import sympy
 
 
 class Array(pybamm.Symbol):
@@ -157,6 +160,8 @@ class Array(pybamm.Symbol):
 
     def to_equation(self) -> sympy.Array:
         """Returns the value returned by the node when evaluated."""
+        import sympy
+
         entries_list = self.entries.tolist()
         return sympy.Array(entries_list)
 
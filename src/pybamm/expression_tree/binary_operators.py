@@ -5,7 +5,6 @@ from __future__ import annotations
 import numbers
 
 import numpy as np
-import sympy
 from scipy.sparse import csr_matrix, issparse
 import functools
 
@@ -193,6 +192,8 @@ class BinaryOperator(pybamm.Symbol):
 
     def to_equation(self):
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
@@ -382,7 +383,10 @@ class MatrixMultiplication(BinaryOperator):
         # is a (slice of a) state vector, e.g. for discretised spatial
         # operators of the form D @ u (also catch cases of (-D) @ u)
         left, right = self.orphans
-        if isinstance(left, pybamm.Array) or (
+        if isinstance(left, pybamm.BlockDiagonalMatrix):
+            # keep the block structure
+            return left @ right_jac
+        elif isinstance(left, pybamm.Array) or (
             isinstance(left, pybamm.Negate) and isinstance(left.child, pybamm.Array)
         ):
             left = pybamm.Matrix(csr_matrix(left.evaluate()))
@@ -394,12 +398,28 @@ class MatrixMultiplication(BinaryOperator):
                 f"not {left.__class__}"
             )
 
+    def evaluate(
+        self,
+        t: float | None = None,
+        y: np.ndarray | None = None,
+        y_dot: np.ndarray | None = None,
+        inputs: dict | str | None = None,
+    ):
+        """See :meth:`pybamm.Symbol.evaluate()`."""
+        if isinstance(self.left, pybamm.BlockDiagonalMatrix):
+            # multiply by the block, without building the full matrix
+            right = self.right.evaluate(t, y, y_dot, inputs)
+            return self.left.matmul(right)
+        return super().evaluate(t, y, y_dot, inputs)
+
     def _binary_evaluate(self, left, right):
         """See :meth:`pybamm.BinaryOperator._binary_evaluate()`."""
         return left @ right
 
     def _sympy_operator(self, left, right):
         """Override :meth:`pybamm.BinaryOperator._sympy_operator`"""
+        import sympy
+
         left = sympy.Matrix(left)
         right = sympy.Matrix(right)
         return left * right
@@ -751,6 +771,8 @@ class Minimum(BinaryOperator):
 
     def _sympy_operator(self, left, right):
         """Override :meth:`pybamm.BinaryOperator._sympy_operator`"""
+        import sympy
+
         return sympy.Min(left, right)
 
 
@@ -795,6 +817,8 @@ class Maximum(BinaryOperator):
 
     def _sympy_operator(self, left, right):
         """Override :meth:`pybamm.BinaryOperator._sympy_operator`"""
+        import sympy
+
         return sympy.Max(left, right)
 
 
@@ -1093,6 +1117,35 @@ def subtract(
     return pybamm.simplify_if_constant(Subtraction(left, right))
 
 
+def _simplified_block_diagonal_multiplication(
+    left: pybamm.Symbol, right: pybamm.Symbol
+):
+    """
+    Simplify the multiplication of a block diagonal matrix by a constant number, or
+    by a constant vector that repeats with the blocks, to a block diagonal matrix.
+    Returns None if the multiplication cannot be simplified in this way.
+    """
+    if isinstance(right, pybamm.BlockDiagonalMatrix):
+        left, right = right, left
+    if not isinstance(left, pybamm.BlockDiagonalMatrix) or not right.is_constant():
+        return None
+    if right.evaluates_to_number():
+        return pybamm.BlockDiagonalMatrix(
+            left.block * np.asarray(right.evaluate()).item(), left.repeats
+        )
+    if not isinstance(right, pybamm.Vector) or right.shape[0] != left.shape[0]:
+        return None
+    rows = right.entries.reshape(left.repeats, -1)
+    if not (rows == rows[0]).all():
+        return None
+    block = left.block
+    if issparse(block):
+        block = csr_matrix(block.multiply(rows[0][:, np.newaxis]))
+    else:
+        block = rows[0][:, np.newaxis] * block
+    return pybamm.BlockDiagonalMatrix(block, left.repeats)
+
+
 def multiply(
     left: ChildSymbol,
     right: ChildSymbol,
@@ -1124,6 +1177,12 @@ def multiply(
     if pybamm.is_scalar_minus_one(left):
         return -right
 
+    # Keep the block structure of a block diagonal matrix multiplied by a constant
+    # (this must be checked before evaluating the constant)
+    out = _simplified_block_diagonal_multiplication(left, right)
+    if out is not None:
+        return out
+
     # Return constant if both sides are constant
     if left.is_constant() and right.is_constant():
         return pybamm.simplify_if_constant(Multiplication(left, right))
@@ -1236,6 +1295,12 @@ def divide(
     if right.is_constant() and not left.is_constant():
         return (1 / right) * left
 
+    # Keep the block structure of a block diagonal matrix divided by a number
+    if isinstance(left, pybamm.BlockDiagonalMatrix) and isinstance(
+        right, pybamm.Scalar
+    ):
+        return pybamm.BlockDiagonalMatrix(left.block / right.value, left.repeats)
+
     # Check for Concatenations and Broadcasts
     out = _simplified_binary_broadcast_concatenation(left, right, divide)
     if out is not None:
@@ -1303,6 +1368,15 @@ def matmul(
     if pybamm.is_matrix_zero(left) or pybamm.is_matrix_zero(right):
         return pybamm.zeros_like(MatrixMultiplication(left, right))
 
+    # The product of two block diagonal matrices with the same number of blocks is
+    # block diagonal
+    if (
+        isinstance(left, pybamm.BlockDiagonalMatrix)
+        and isinstance(right, pybamm.BlockDiagonalMatrix)
+        and left.repeats == right.repeats
+    ):
+        return pybamm.BlockDiagonalMatrix(left.block @ right.block, left.repeats)
+
     if isinstance(right, Multiplication) and left.is_constant():
         # Simplify A @ (b * c) to (A * b) @ c if (A * b) is constant
         if right.left.evaluates_to_constant_number():
@@ -0,0 +1,54 @@
+#
+# Bound parameter class
+#
+from __future__ import annotations
+from typing import Literal
+
+import pybamm
+
+
+class BoundParameter(pybamm.Scalar):
+    """
+    A node in the expression tree representing the value of a parameter that can be
+    changed after the model has been processed. These are created by
+    :class:`pybamm.ParameterValues` for the parameters listed in
+    :attr:`pybamm.ParameterValues.rebindable_parameters`, and their values are
+    changed with :meth:`pybamm.BaseModel.rebind_parameters`.
+
+    Unlike :class:`pybamm.Scalar`, a bound parameter is not treated as a constant, so
+    that it is not simplified away when the model is processed, and copies of it are
+    the same node, so that changing its value changes it everywhere in the model.
+
+    Parameters
+    ----------
+    value : numeric
+        the value returned by the node when evaluated
+    name : str
+        the name of the parameter
+    """
+
+    def __init__(self, value, name: str) -> None:
+        super().__init__(value, name=name)
+
+    def __str__(self):
+        return self.name
+
+    def set_id(self):
+        """See :meth:`pybamm.Symbol.set_id()`."""
+        # The id does not change when the value is changed, so that the model's
+        # expressions keep their ids when the parameter is rebound
+        self._id = hash((self.__class__, self.name, str(self.value)))
+
+    def create_copy(
+        self,
+        new_children=None,
+        perform_simplifications=True,
+    ):
+        """See :meth:`pybamm.Symbol.new_copy()`."""
+        if new_children is not None:
+            raise ValueError("Cannot create a copy of a scalar with new children")
+        return self
+
+    def is_constant(self) -> Literal[False]:
+        """See :meth:`pybamm.Symbol.is_constant()`."""
+        return False
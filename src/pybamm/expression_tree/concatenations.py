@@ -7,7 +7,6 @@ from collections import defaultdict
 from typing import Optional
 
 import numpy as np
-import sympy
 from scipy.sparse import issparse, vstack
 from collections.abc import Sequence
 
@@ -172,6 +171,8 @@ class Concatenation(pybamm.Symbol):
 
     def _sympy_operator(self, *children):
         """Apply appropriate SymPy operators."""
+        import sympy
+
         self.concat_latex = tuple(map(sympy.latex, children))
 
         if self.print_name is not None:
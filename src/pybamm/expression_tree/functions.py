@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import numpy as np
 from scipy import special
-import sympy
 from typing import Callable
 from collections.abc import Sequence
 from typing_extensions import TypeVar
@@ -200,6 +199,8 @@ class Function(pybamm.Symbol):
 
     def to_equation(self):
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
@@ -264,6 +265,8 @@ class SpecificFunction(Function):
 
     def _sympy_operator(self, child):
         """Apply appropriate SymPy operators."""
+        import sympy
+
         class_name = self.__class__.__name__.lower()
         sympy_function = getattr(sympy, class_name)
         return sympy_function(child)
@@ -320,6 +323,8 @@ class Arcsinh(SpecificFunction):
 
     def _sympy_operator(self, child):
         """Override :meth:`pybamm.Function._sympy_operator`"""
+        import sympy
+
         return sympy.asinh(child)
 
 
@@ -347,6 +352,8 @@ class Arctan(SpecificFunction):
 
     def _sympy_operator(self, child):
         """Override :meth:`pybamm.Function._sympy_operator`"""
+        import sympy
+
         return sympy.atan(child)
 
 
@@ -2,12 +2,15 @@
 # IndependentVariable class
 #
 from __future__ import annotations
-import sympy
 import numpy as np
+from typing import TYPE_CHECKING
 
 import pybamm
 from pybamm.type_definitions import DomainType, AuxiliaryDomainType, DomainsType
 
+if TYPE_CHECKING:  # pragma: no cover
+    import sympy
+
 KNOWN_COORD_SYS = ["cartesian", "cylindrical polar", "spherical polar"]
 
 
@@ -57,6 +60,8 @@ class IndependentVariable(pybamm.Symbol):
 
     def to_equation(self) -> sympy.Symbol:
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
@@ -112,6 +117,8 @@ class Time(IndependentVariable):
 
     def to_equation(self):
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         return sympy.Symbol("t")
 
 
@@ -3,7 +3,7 @@
 #
 from __future__ import annotations
 import numpy as np
-from scipy.sparse import csr_matrix, issparse
+from scipy.sparse import csr_matrix, eye, issparse, kron
 
 import pybamm
 from pybamm.type_definitions import DomainType, AuxiliaryDomainType, DomainsType
@@ -35,3 +35,197 @@ class Matrix(pybamm.Array):
         super().__init__(
             entries, name, domain, auxiliary_domains, domains, entries_string
         )
+
+
+class BlockDiagonalMatrix(Matrix):
+    """
+    Node in the expression tree that holds a block diagonal matrix, with `repeats`
+    copies of the same `block` on its diagonal, i.e. ``kron(eye(repeats), block)``.
+
+    Only the block is stored: the full (sparse) matrix is built when the node is
+    evaluated on its own, but is not kept. Products of this matrix with a vector are
+    evaluated as a product of the block with the vector reshaped into one column for
+    each block, by :meth:`BlockDiagonalMatrix.matmul`, :class:`pybamm.CasadiConverter`,
+    :class:`pybamm.EvaluatorPython` and :class:`pybamm.EvaluatorJax`.
+
+    Parameters
+    ----------
+    block : numpy.array or scipy.sparse matrix
+        The block repeated on the diagonal
+    repeats : int
+        The number of copies of the block
+    name : str, optional
+        The name of the node
+    domain : iterable of str, optional
+        list of domains the parameter is valid over, defaults to empty list
+    auxiliary_domains : dict, optional
+        dictionary of auxiliary domains, defaults to empty dict
+    domains : dict
+        A dictionary equivalent to {'primary': domain, auxiliary_domains}. Either
+        'domain' and 'auxiliary_domains', or just 'domains', should be provided
+        (not both).
+    entries_string : str
+        String representing the block and repeats (slow to recalculate when copying)
+    """
+
+    def __init__(
+        self,
+        block: np.ndarray | list[float] | csr_matrix,
+        repeats: int,
+        name: str | None = None,
+        domain: DomainType = None,
+        auxiliary_domains: AuxiliaryDomainType = None,
+        domains: DomainsType = None,
+        entries_string: str | None = None,
+    ) -> None:
+        if isinstance(block, list):
+            block = np.array(block)
+        if issparse(block):
+            block = csr_matrix(block)
+        self._block = block.astype(float)
+        self._repeats = int(repeats)
+        if name is None:
+            name = f"Block diagonal matrix {self.shape!s}"
+        self.entries_string = entries_string
+        pybamm.Symbol.__init__(
+            self,
+            name,
+            domain=domain,
+            auxiliary_domains=auxiliary_domains,
+            domains=domains,
+        )
+
+    @classmethod
+    def _from_json(cls, snippet: dict):
+        block = snippet["block"]
+        if isinstance(block, dict):
+            block = csr_matrix(
+                (block["data"], block["row_indices"], block["column_pointers"]),
+                shape=block["shape"],
+            )
+
+        return cls(
+            block, snippet["repeats"], name=snippet["name"], domains=snippet["domains"]
+        )
+
+    @property
+    def block(self):
+        """The block repeated on the diagonal"""
+        return self._block
+
+    @property
+    def repeats(self):
+        """The number of copies of the block"""
+        return self._repeats
+
+    @property
+    def entries(self):
+        """The full block diagonal matrix, built from the block"""
+        return csr_matrix(kron(eye(self.repeats), self.block))
+
+    @property
+    def ndim(self):
+        return 2
+
+    @property
+    def shape(self):
+        m, n = self.block.shape
+        return (self.repeats * m, self.repeats * n)
+
+    @property
+    def entries_string(self):
+        return self._entries_string
+
+    @entries_string.setter
+    def entries_string(self, value: None | tuple):
+        if value is not None:
+            self._entries_string = value
+        else:
+            block = self.block
+            if issparse(block):
+                block_string = ["shape", str(block.shape)]
+                for key in ["data", "indices", "indptr"]:
+                    block_string += [key, getattr(block, key).tobytes()]
+            else:
+                block_string = ["shape", str(block.shape), block.tobytes()]
+            self._entries_string = ("repeats", self.repeats, *block_string)
+
+    def create_copy(
+        self,
+        new_children=None,
+        perform_simplifications: bool = True,
+    ):
+        """See :meth:`pybamm.Symbol.new_copy()`."""
+        return self.__class__(
+            self.block,
+            self.repeats,
+            self.name,
+            domains=self.domains,
+            entries_string=self.entries_string,
+        )
+
+    def _base_evaluate(
+        self,
+        t: float | None = None,
+        y: np.ndarray | None = None,
+        y_dot: np.ndarray | None = None,
+        inputs: dict | str | None = None,
+    ):
+        """See :meth:`pybamm.Symbol._base_evaluate()`."""
+        return self.entries
+
+    def _evaluate_for_shape(self):
+        """See :meth:`pybamm.Symbol.evaluate_for_shape()`."""
+        # an empty sparse matrix of the right shape, to avoid building the full matrix
+        return csr_matrix(self.shape)
+
+    def matmul(self, other):
+        """
+        Multiply the block diagonal matrix by `other`, without building the full
+        matrix if `other` is a dense vector or matrix.
+
+        Parameters
+        ----------
+        other : numpy.array or scipy.sparse matrix
+            The vector or matrix to multiply, with as many rows as this matrix has
+            columns
+
+        Returns
+        -------
+        numpy.array or scipy.sparse matrix
+            The product of this matrix with `other`
+        """
+        if issparse(other) or np.ndim(other) != 2:
+            return self.entries @ other
+        m, n = self.block.shape
+        n_columns = other.shape[1]
+        # arrange the part of `other` multiplied by each block side by side, so that
+        # all the blocks are multiplied at once
+        other = other.reshape(self.repeats, n, n_columns).transpose(1, 0, 2)
+        out = self.block @ other.reshape(n, self.repeats * n_columns)
+        out = np.asarray(out).reshape(m, self.repeats, n_columns).transpose(1, 0, 2)
+        return out.reshape(self.repeats * m, n_columns)
+
+    def to_json(self):
+        """
+        Method to serialise a BlockDiagonalMatrix object into JSON.
+        """
+        if isinstance(self.block, np.ndarray):
+            block = self.block.tolist()
+        else:
+            block = {
+                "shape": self.block.shape,
+                "data": self.block.data.tolist(),
+                "row_indices": self.block.indices.tolist(),
+                "column_pointers": self.block.indptr.tolist(),
+            }
+
+        json_dict = {
+            "name": self.name,
+            "id": self.id,
+            "domains": self.domains,
+            "block": block,
+            "repeats": self.repeats,
+        }
+
+        return json_dict
@@ -11,11 +11,36 @@ from scipy import interpolate
 
 
 class CasadiConverter:
+    """
+    Converts PyBaMM expression trees to CasADi expression trees.
+
+    Converted symbols are stored, so that a subexpression that appears several times
+    (in one expression or in several expressions converted with the same converter)
+    is only converted once and becomes a single node shared by all the CasADi
+    expressions that use it.
+
+    Parameters
+    ----------
+    casadi_symbols : dict, optional
+        Previously converted symbols, to be reused by this converter
+
+    Attributes
+    ----------
+    n_reused : int
+        The number of times that a previously converted subexpression was reused
+    """
+
     def __init__(self, casadi_symbols=None):
         self._casadi_symbols = casadi_symbols or {}
+        self.n_reused = 0
 
         pybamm.citations.register("Andersson2019")
 
+    @property
+    def n_converted(self):
+        """The number of unique subexpressions that have been converted"""
+        return len(self._casadi_symbols)
+
     def convert(
         self,
         symbol: pybamm.Symbol,
@@ -47,7 +72,9 @@ class CasadiConverter:
             The converted symbol
         """
         try:
-            return self._casadi_symbols[symbol]
+            casadi_symbol = self._casadi_symbols[symbol]
+            self.n_reused += 1
+            return casadi_symbol
         except KeyError:
             # Change inputs to empty dictionary if it's None
             inputs = inputs or {}
@@ -81,6 +108,17 @@ class CasadiConverter:
 
         elif isinstance(symbol, pybamm.BinaryOperator):
             left, right = symbol.children
+            if isinstance(symbol, pybamm.MatrixMultiplication) and isinstance(
+                left, pybamm.BlockDiagonalMatrix
+            ):
+                converted_right = self.convert(right, t, y, y_dot, inputs)
+                if converted_right.shape[1] == 1:
+                    # multiply the block by the vector reshaped into one column
+                    # for each block, without building the full matrix
+                    m, n = left.block.shape
+                    converted_right = casadi.reshape(converted_right, n, left.repeats)
+                    out = casadi.mtimes(casadi.MX(left.block), converted_right)
+                    return casadi.reshape(out, m * left.repeats, 1)
             # process children
             converted_left = self.convert(left, t, y, y_dot, inputs)
             converted_right = self.convert(right, t, y, y_dot, inputs)
@@ -11,12 +11,19 @@ import scipy.sparse
 
 import pybamm
 
-if pybamm.has_jax():
-    import jax
+# jax is slow to import, so is only imported when a jax evaluator is first created
+jax = None
 
-    platform = jax.lib.xla_bridge.get_backend().platform.casefold()
-    if platform != "metal":
-        jax.config.update("jax_enable_x64", True)
+
+def _import_jax():
+    """Import jax, enabling 64-bit floats (except on Metal), if not imported yet"""
+    global jax
+    if jax is None:
+        import jax
+
+        platform = jax.lib.xla_bridge.get_backend().platform.casefold()
+        if platform != "metal":
+            jax.config.update("jax_enable_x64", True)
 
 
 class JaxCooMatrix:
@@ -47,6 +54,7 @@ class JaxCooMatrix:
             raise ModuleNotFoundError(
                 "Jax or jaxlib is not installed, please see https://docs.pybamm.org/en/latest/source/user_guide/installation/gnu-linux-mac.html#optional-jaxsolver"
             )
+        _import_jax()
 
         self.row = jax.numpy.array(row)
         self.col = jax.numpy.array(col)
@@ -105,6 +113,7 @@ def create_jax_coo_matrix(value: scipy.sparse):
     value: scipy.sparse matrix
         the sparse matrix to be converted
     """
+    _import_jax()
     scipy_coo = value.tocoo()
     row = jax.numpy.asarray(scipy_coo.row)
     col = jax.numpy.asarray(scipy_coo.col)
@@ -127,6 +136,19 @@ def id_to_python_variable(symbol_id, constant=False):
     return var_format.format(symbol_id).replace("-", "m")
 
 
+def concatenate_columns(arrays):
+    """
+    Concatenate 2D arrays vertically, broadcasting the arrays with a single column to
+    the number of columns of the others. This is used by the code generated for
+    batched evaluation, in which constant vectors have a single column and the
+    variable ones have a column for each time.
+    """
+    n_columns = max(array.shape[1] for array in arrays)
+    return np.concatenate(
+        [np.broadcast_to(array, (array.shape[0], n_columns)) for array in arrays]
+    )
+
+
 def is_scalar(arg):
     is_number = isinstance(arg, numbers.Number)
     if is_number:
@@ -140,6 +162,7 @@ def find_symbols(
     constant_symbols: OrderedDict,
     variable_symbols: OrderedDict,
     output_jax=False,
+    batched=False,
 ):
     """
     This function converts an expression tree to a dictionary of node id's and strings
@@ -171,6 +194,11 @@ def find_symbols(
         raises NotImplNotImplementedError if any SparseStack or Mat-Mat multiply
         operations are used
 
+    batched: bool
+        If True, the generated code evaluates the symbol for a matrix `y`, with one
+        column for each state, and a row vector `t`. Raises NotImplementedError if
+        any variable node evaluates to a matrix
+
     """
     # constant symbols that are not numbers are stored in a list of constants, which are
     # passed into the generated function constant symbols that are numbers are written
@@ -185,9 +213,42 @@ def find_symbols(
                 constant_symbols[symbol.id] = value
         return
 
+    if batched:
+        shape_eval = symbol.evaluate_for_shape()
+        if scipy.sparse.issparse(shape_eval) or (
+            np.ndim(shape_eval) == 2 and shape_eval.shape[1] > 1
+        ):
+            raise NotImplementedError(
+                "Batched evaluation is not implemented for symbols that evaluate to "
+                f"a matrix, such as '{symbol.name}'"
+            )
+
+    if (
+        isinstance(symbol, pybamm.MatrixMultiplication)
+        and isinstance(symbol.left, pybamm.BlockDiagonalMatrix)
+        and (output_jax or not scipy.sparse.issparse(symbol.left.block))
+    ):
+        # multiply the (dense) block by the vector reshaped into one row of blocks
+        # for each repeat, as a batched matmul. Sparse blocks are only made dense for
+        # jax, since a sparse product with the full matrix is faster with numpy
+        left, right = symbol.children
+        block = left.block
+        if scipy.sparse.issparse(block):
+            block = block.toarray()
+        block_id = pybamm.Matrix(block).id
+        constant_symbols[block_id] = block
+        find_symbols(right, constant_symbols, variable_symbols, output_jax, batched)
+        m, n = block.shape
+        variable_symbols[symbol.id] = (
+            f"np.matmul({id_to_python_variable(block_id, True)}, "
+            f"{id_to_python_variable(right.id, False)}.reshape({left.repeats}, {n}, -1)"
+            f").reshape({left.repeats * m}, -1)"
+        )
+        return
+
     # process children recursively
     for child in symbol.children:
-        find_symbols(child, constant_symbols, variable_symbols, output_jax)
+        find_symbols(child, constant_symbols, variable_symbols, output_jax, batched)
 
     # calculate the variable names that will hold the result of calculating the
     # children variables
@@ -289,7 +350,12 @@ def find_symbols(
                 children_str = child_var
             else:
                 children_str += ", " + child_var
-        if isinstance(symbol.function, np.ufunc):
+        if batched and symbol.function in (np.min, np.max):
+            # reduce over the states at each time only
+            symbol_str = (
+                f"np.{symbol.function.__name__}({children_str}, axis=0, keepdims=True)"
+            )
+        elif isinstance(symbol.function, np.ufunc):
             # write any numpy functions directly
             symbol_str = f"np.{symbol.function.__name__}({children_str})"
         else:
@@ -301,11 +367,13 @@ def find_symbols(
 
     elif isinstance(symbol, pybamm.Concatenation):
         # no need to concatenate if there is only a single child
+        # constant children have a single column, so need to be broadcast when batched
+        concatenate = "concatenate_columns" if batched else "np.concatenate"
         if isinstance(symbol, pybamm.NumpyConcatenation):
             if len(children_vars) == 1:
                 symbol_str = children_vars[0]
             else:
-                symbol_str = "np.concatenate(({}))".format(",".join(children_vars))
+                symbol_str = "{}(({}))".format(concatenate, ",".join(children_vars))
 
         elif isinstance(symbol, pybamm.SparseStack):
             if len(children_vars) == 1:
@@ -335,7 +403,7 @@ def find_symbols(
                     [v for _, v in sorted(zip(slice_starts, child_vectors))]
                 )
             if len(children_vars) > 1 or symbol.secondary_dimensions_npts > 1:
-                symbol_str = "np.concatenate(({}))".format(",".join(all_child_vectors))
+                symbol_str = "{}(({}))".format(concatenate, ",".join(all_child_vectors))
             else:
                 symbol_str = "{}".format(",".join(children_vars))
         else:
@@ -359,6 +427,11 @@ def find_symbols(
     elif isinstance(symbol, pybamm.InputParameter):
         symbol_str = f'inputs["{symbol.name}"]'
 
+    elif isinstance(symbol, pybamm.BoundParameter):
+        # the value of the parameter when the expression is converted
+        constant_symbols[symbol.id] = symbol.value
+        symbol_str = id_to_python_variable(symbol.id, True)
+
     else:
         raise NotImplementedError(
             f"Conversion to python not implemented for a symbol of type '{type(symbol)}'"
@@ -368,7 +441,7 @@ def find_symbols(
 
 
 def to_python(
-    symbol: pybamm.Symbol, debug=False, output_jax=False
+    symbol: pybamm.Symbol, debug=False, output_jax=False, batched=False
 ) -> tuple[OrderedDict, str]:
     """
     This function converts an expression tree into a dict of constant input values, and
@@ -393,11 +466,14 @@ def to_python(
         If True, only numpy and jax operations will be used in the generated code.
         Raises NotImplNotImplementedError if any SparseStack or Mat-Mat multiply
         operations are used
+    batched: bool
+        If True, the generated code evaluates the symbol for a matrix of states, with
+        one column for each time (see :func:`pybamm.find_symbols`)
 
     """
     constant_values: OrderedDict = OrderedDict()
     variable_symbols: OrderedDict = OrderedDict()
-    find_symbols(symbol, constant_values, variable_symbols, output_jax)
+    find_symbols(symbol, constant_values, variable_symbols, output_jax, batched)
 
     line_format = "{} = {}"
 
@@ -436,14 +512,29 @@ class EvaluatorPython:
     def __init__(self, symbol: pybamm.Symbol):
         constants, python_str = pybamm.to_python(symbol, debug=False)
 
+        # constants passed in as an ordered dict, convert to list
+        self._constants = list(constants.values())
+        self._result_var = id_to_python_variable(symbol.id, symbol.is_constant())
+        self._python_str = self._function_str(symbol, constants, python_str)
+        self._symbol = symbol
+        # the batched evaluator is only generated when first used
+        self._batched_constants = None
+        self._batched_python_str = None
+
+        # compile and run the generated python code,
+        compiled_function = compile(self._python_str, self._result_var, "exec")
+        exec(compiled_function)
+
+    def _function_str(self, symbol, constants, python_str, name="_evaluate"):
+        """
+        Return the code defining the function that evaluates the symbol and storing it
+        as the attribute `name`
+        """
         # extract constants in generated function
         for i, symbol_id in enumerate(constants.keys()):
             const_name = id_to_python_variable(symbol_id, True)
             python_str = f"{const_name} = constants[{i}]\n" + python_str
 
-        # constants passed in as an ordered dict, convert to list
-        self._constants = list(constants.values())
-
         # indent code
         python_str = "   " + python_str
         python_str = python_str.replace("\n", "\n   ")
@@ -455,7 +546,6 @@ class EvaluatorPython:
 
         # calculate the final variable that will output the result of calling `evaluate`
         # on `symbol`
-        result_var = id_to_python_variable(symbol.id, symbol.is_constant())
         if symbol.is_constant():
             result_value = symbol.evaluate()
 
@@ -463,18 +553,10 @@ class EvaluatorPython:
         if symbol.is_constant() and isinstance(result_value, numbers.Number):
             python_str = python_str + "\n   return " + str(result_value)
         else:
-            python_str = python_str + "\n   return " + result_var
+            python_str = python_str + "\n   return " + self._result_var
 
         # store a copy of examine_jaxpr
-        python_str = python_str + "\nself._evaluate = evaluate"
-
-        self._python_str = python_str
-        self._result_var = result_var
-        self._symbol = symbol
-
-        # compile and run the generated python code,
-        compiled_function = compile(python_str, result_var, "exec")
-        exec(compiled_function)
+        return python_str + f"\nself.{name} = evaluate"
 
     def __call__(self, t=None, y=None, inputs=None):
         """
@@ -488,12 +570,87 @@ class EvaluatorPython:
 
         return result
 
+    def evaluate_batch(self, t=None, y=None, inputs=None):
+        """
+        Evaluate the symbol at several times at once.
+
+        The code generated for the batched evaluation applies each operation (e.g.
+        sparse matrix products and elementwise operations) to all the times at once.
+        Symbols whose evaluation involves matrices that depend on `t` or `y` cannot
+        be batched in this way, and are evaluated one time at a time instead.
+
+        Parameters
+        ----------
+        t : float or array-like, size (n_times,), optional
+            The times
+        y : array-like, shape (n_states, n_times), optional
+            The states, with one column for each time
+        inputs : dict, optional
+            Any input parameters, which are the same for all the times
+
+        Returns
+        -------
+        :class:`numpy.ndarray`, shape (n_outputs, n_times)
+            The values of the symbol, with one column for each time
+        """
+        shape_eval = self._symbol.evaluate_for_shape()
+        if scipy.sparse.issparse(shape_eval) or (
+            np.ndim(shape_eval) == 2 and shape_eval.shape[1] > 1
+        ):
+            raise ValueError(
+                "Only symbols that evaluate to a vector can be evaluated in batch"
+            )
+        # the times are a row vector, so that they are broadcast to all the states
+        n_times = 1
+        if np.ndim(t) > 0:
+            t = np.reshape(t, (1, -1))
+            n_times = t.shape[1]
+        if y is not None:
+            y = np.asarray(y)
+            if y.ndim == 1:
+                y = y.reshape(-1, 1)
+            n_times = max(n_times, y.shape[1])
+
+        if self._batched_python_str is None:
+            try:
+                constants, python_str = pybamm.to_python(
+                    self._symbol, debug=False, batched=True
+                )
+            except NotImplementedError:
+                self._batched_python_str = False
+            else:
+                self._batched_constants = list(constants.values())
+                self._batched_python_str = self._function_str(
+                    self._symbol, constants, python_str, name="_evaluate_batched"
+                )
+                compiled_function = compile(
+                    self._batched_python_str, self._result_var, "exec"
+                )
+                exec(compiled_function)
+
+        if self._batched_python_str is False:
+            columns = []
+            for i in range(n_times):
+                t_i = t[0, i] if np.ndim(t) > 0 else t
+                y_i = None if y is None else y[:, i : i + 1]
+                columns.append(np.reshape(self(t_i, y_i, inputs), (-1, 1)))
+            return np.hstack(columns)
+
+        result = self._evaluate_batched(self._batched_constants, t, y, inputs)
+        # results that only depend on constants or on the time have a single column
+        # or a single row
+        result = np.atleast_2d(result)
+        if result.shape[1] != n_times:
+            result = np.repeat(result, n_times, axis=1)
+        return result
+
     def __getstate__(self):
         # Control the state of instances of EvaluatorPython
         # before pickling. Method "_evaluate" cannot be pickled.
         # See https://github.com/pybamm-team/PyBaMM/issues/1283
         state = self.__dict__.copy()
         del state["_evaluate"]
+        state.pop("_evaluate_batched", None)
         return state
 
     def __setstate__(self, state):
@@ -501,9 +658,16 @@ class EvaluatorPython:
         # compile code from "python_str"
         # Execution of bytecode (re)adds attribute
         # "_method"
+        state.setdefault("_batched_constants", None)
+        state.setdefault("_batched_python_str", None)
         self.__dict__.update(state)
         compiled_function = compile(self._python_str, self._result_var, "exec")
         exec(compiled_function)
+        if self._batched_python_str:
+            compiled_function = compile(
+                self._batched_python_str, self._result_var, "exec"
+            )
+            exec(compiled_function)
 
 
 class EvaluatorJax:
@@ -530,6 +694,7 @@ class EvaluatorJax:
             raise ModuleNotFoundError(
                 "Jax or jaxlib is not installed, please see https://docs.pybamm.org/en/latest/source/user_guide/installation/gnu-linux-mac.html#optional-jaxsolver"
             )
+        _import_jax()
 
         constants, python_str = pybamm.to_python(symbol, debug=False, output_jax=True)
 
@@ -607,6 +772,7 @@ class EvaluatorJax:
 
         if not pybamm.demote_expressions_to_32bit:
             return c
+        _import_jax()
         if isinstance(c, float):
             c = jax.numpy.float32(c)
         if isinstance(c, int):
@@ -5,12 +5,13 @@ from __future__ import annotations
 import sys
 
 import numpy as np
-from typing import Literal
-
-import sympy
+from typing import TYPE_CHECKING, Literal
 
 import pybamm
 
+if TYPE_CHECKING:  # pragma: no cover
+    import sympy
+
 
 class Parameter(pybamm.Symbol):
     """
@@ -50,6 +51,8 @@ class Parameter(pybamm.Symbol):
 
     def to_equation(self) -> sympy.Symbol:
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
@@ -222,6 +225,8 @@ class FunctionParameter(pybamm.Symbol):
 
     def to_equation(self) -> sympy.Symbol:
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
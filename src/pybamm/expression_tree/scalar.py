@@ -3,7 +3,6 @@
 #
 from __future__ import annotations
 import numpy as np
-import sympy
 from typing import Literal
 
 import pybamm
@@ -93,6 +92,8 @@ class Scalar(pybamm.Symbol):
 
     def to_equation(self):
         """Returns the value returned by the node when evaluated."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
@@ -6,7 +6,6 @@ import numbers
 import warnings
 
 import numpy as np
-import sympy
 from scipy.sparse import csr_matrix, issparse
 from functools import cached_property
 from typing import TYPE_CHECKING, cast
@@ -121,6 +120,12 @@ def is_matrix_x(expr: Symbol, x: int):
     if isinstance(expr, pybamm.Broadcast):
         return is_scalar_x(expr.child, x) or is_matrix_x(expr.child, x)
 
+    if isinstance(expr, pybamm.BlockDiagonalMatrix):
+        # only the block needs to be checked, but the entries off the blocks are zero
+        if x != 0 and expr.repeats > 1:
+            return False
+        expr = pybamm.Matrix(expr.block)
+
     if is_constant(expr):
         result = expr.evaluate_ignoring_errors(t=None)
         return (
@@ -665,6 +670,9 @@ class Symbol:
             child.is_constant() for child in self.children
         ):
             return pybamm.concatenation(*[-child for child in self.orphans])
+        elif isinstance(self, pybamm.BlockDiagonalMatrix):
+            # Keep the block structure
+            return pybamm.BlockDiagonalMatrix(-self.block, self.repeats)
         else:
             return pybamm.simplify_if_constant(pybamm.Negate(self))
 
@@ -1092,6 +1100,8 @@ class Symbol:
         self._print_name = prettify_print_name(name)
 
     def to_equation(self):
+        import sympy
+
         return sympy.Symbol(str(self.name))
 
     def to_json(self):
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import numpy as np
 from scipy.sparse import csr_matrix, issparse
-import sympy
 import pybamm
 from pybamm.util import import_optional_dependency
 from pybamm.type_definitions import DomainsType
@@ -122,6 +121,8 @@ class UnaryOperator(pybamm.Symbol):
 
     def to_equation(self):
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
@@ -733,6 +734,8 @@ class Integral(SpatialOperator):
 
     def _sympy_operator(self, child):
         """Override :meth:`pybamm.UnaryOperator._sympy_operator`"""
+        import sympy
+
         return sympy.Integral(child, sympy.Symbol("xn"))
 
 
@@ -1060,6 +1063,8 @@ class BoundaryValue(BoundaryOperator):
 
     def _sympy_operator(self, child):
         """Override :meth:`pybamm.UnaryOperator._sympy_operator`"""
+        import sympy
+
         if (
             self.child.domain[0] in ["negative particle", "positive particle"]
             and self.side == "right"
@@ -5,7 +5,6 @@ from __future__ import annotations
 import numpy as np
 import numbers
 import pybamm
-import sympy
 from pybamm.type_definitions import (
     DomainType,
     AuxiliaryDomainType,
@@ -139,6 +138,8 @@ class VariableBase(pybamm.Symbol):
 
     def to_equation(self):
         """Convert the node and its subtree into a SymPy equation."""
+        import sympy
+
         if self.print_name is not None:
             return sympy.Symbol(self.print_name)
         else:
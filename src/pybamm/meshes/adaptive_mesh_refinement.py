@@ -0,0 +1,335 @@
+#
+# Adaptive refinement of 1D submeshes
+#
+import copy
+
+import numpy as np
+from scipy.interpolate import interp1d
+
+import pybamm
+
+
+class AdaptiveMeshRefinement:
+    """
+    Refine the 1D submeshes of a simulation where the solution is least accurate.
+
+    The model is solved on the mesh given by `submesh_types` and `var_pts`, and an
+    error indicator is computed in each cell of the 1D submeshes on which the
+    `variables` are defined. The cells in which the indicator is larger than both
+    `rtol` and a fraction `mark_fraction` of the largest indicator are split in two,
+    giving a :class:`pybamm.UserSupplied1DSubMesh` with the refined edges, and the
+    model is discretised and solved again on the new mesh. This is repeated until no
+    cell needs refining, or for at most `max_iterations` refinements. Since cells
+    are only added where they are needed (e.g. near the surface of the particles, or
+    near the separator at high C-rates), the final mesh usually reaches a given
+    accuracy with far fewer points than a uniform mesh.
+
+    Two error indicators are available, both relative to the range of each variable
+    over the whole solution:
+
+    - "gradient": the largest change of the variables between the node of a cell and
+      the nodes of its neighbours, i.e. the cells are refined until the variables
+      change by less than `rtol` from one node to the next.
+    - "richardson": the difference between the solution and the solution on a mesh
+      in which every cell is split in two, averaged over each cell and divided by
+      :math:`2^p - 1` for second-order convergence (:math:`p = 2`). This estimates
+      the discretisation error in each cell, at the cost of one more solve for each
+      refinable spatial variable at each iteration, on a mesh in which only the
+      cells of that variable are split.
+
+    Parameters
+    ----------
+    model : :class:`pybamm.BaseModel`
+        The model to be simulated
+    variables : list of str
+        The names of the variables whose accuracy is used to refine the mesh
+    parameter_values : :class:`pybamm.ParameterValues`, optional
+        Parameters and their corresponding numerical values. Defaults to the default
+        parameter values of the model.
+    geometry : :class:`pybamm.Geometry`, optional
+        The geometry upon which to solve the model
+    submesh_types : dict, optional
+        The types of submesh used for the first solve. Defaults to the default
+        submesh types of the model.
+    var_pts : dict, optional
+        The number of points of each spatial variable for the first solve. Defaults
+        to the default number of points of the model.
+    spatial_methods : dict, optional
+        The spatial method used on each domain
+    solver : :class:`pybamm.BaseSolver`, optional
+        The solver to use to solve the model
+    indicator : str, optional
+        The error indicator, either "gradient" (default) or "richardson"
+    rtol : float, optional
+        The largest relative error indicator allowed in a cell (default is 1e-2)
+    mark_fraction : float, optional
+        Only the cells whose indicator is larger than this fraction of the largest
+        one are refined at each iteration (default is 0.5), so that the points are
+        added where the error is largest first
+    max_iterations : int, optional
+        The largest number of refinements (default is 5)
+    max_pts : int, optional
+        The largest number of points of each spatial variable. If refining all the
+        cells above the tolerance would exceed it, the cells with the largest error
+        indicators are refined first. Default is None (no limit).
+    spatial_variables : list of str, optional
+        The names of the spatial variables whose submeshes may be refined. Defaults
+        to all those of the 1D submeshes on which the `variables` are defined.
+
+    Examples
+    --------
+    >>> amr = pybamm.AdaptiveMeshRefinement(
+    ...     pybamm.lithium_ion.SPM(), ["Negative particle concentration [mol.m-3]"]
+    ... )
+    >>> solution = amr.solve([0, 3600])  # doctest: +SKIP
+    >>> amr.var_pts  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        model,
+        variables,
+        parameter_values=None,
+        geometry=None,
+        submesh_types=None,
+        var_pts=None,
+        spatial_methods=None,
+        solver=None,
+        indicator="gradient",
+        rtol=1e-2,
+        mark_fraction=0.5,
+        max_iterations=5,
+        max_pts=None,
+        spatial_variables=None,
+    ):
+        if indicator not in ["gradient", "richardson"]:
+            raise ValueError(
+                f"indicator must be 'gradient' or 'richardson', not '{indicator}'"
+            )
+        self.model = model
+        self.variables = list(variables)
+        self.parameter_values = parameter_values or model.default_parameter_values
+        self.geometry = geometry or model.default_geometry
+        self.spatial_methods = spatial_methods or model.default_spatial_methods
+        self.solver = solver or model.default_solver
+        self.indicator = indicator
+        self.rtol = rtol
+        self.mark_fraction = mark_fraction
+        self.max_iterations = max_iterations
+        self.max_pts = max_pts
+        self.spatial_variables = spatial_variables
+
+        self.submesh_types = dict(submesh_types or model.default_submesh_types)
+        self.var_pts = {
+            getattr(var, "name", var): pts
+            for var, pts in (var_pts or model.default_var_pts).items()
+        }
+        self.simulation = None
+        self.history = []
+
+    def _simulation(self, submesh_types, var_pts):
+        return pybamm.Simulation(
+            self.model,
+            geometry=copy.deepcopy(self.geometry),
+            parameter_values=self.parameter_values,
+            submesh_types=dict(submesh_types),
+            var_pts=dict(var_pts),
+            spatial_methods=self.spatial_methods,
+            solver=self.solver.copy(),
+        )
+
+    @staticmethod
+    def _spatial_limits(geometry, domain):
+        """The name and limits of the spatial variable of a domain"""
+        ((spatial_variable, lims),) = [
+            (var, lims) for var, lims in geometry[domain].items() if var != "tabs"
+        ]
+        return getattr(spatial_variable, "name", spatial_variable), lims
+
+    def _refinable_domains(self, simulation, solution):
+        """
+        The domains of the 1D submeshes on which the variables are defined, and the
+        name of the spatial variable of each
+        """
+        domains = {}
+        for name in self.variables:
+            for domain in solution[name].domain:
+                submesh = simulation.mesh[domain]
+                if type(submesh) not in [
+                    pybamm.Uniform1DSubMesh,
+                    pybamm.Exponential1DSubMesh,
+                    pybamm.Chebyshev1DSubMesh,
+                    pybamm.UserSupplied1DSubMesh,
+                ]:
+                    continue
+                spatial_variable, _ = self._spatial_limits(simulation.geometry, domain)
+                if (
+                    self.spatial_variables is None
+                    or spatial_variable in self.spatial_variables
+                ):
+                    domains[domain] = spatial_variable
+        return domains
+
+    def _scales(self, solution):
+        """The range of each variable over the whole solution"""
+        scales = {}
+        for name in self.variables:
+            entries = solution[name].entries
+            scales[name] = np.ptp(entries) or np.max(np.abs(entries)) or 1
+        return scales
+
+    def _node_values(self, simulation, solution, t, scales):
+        """
+        The values of each variable at the nodes of each domain, at times `t`, as
+        arrays with a row for each node, divided by the scale of the variable
+        """
+        values = {}
+        for name in self.variables:
+            processed_variable = solution[name]
+            if processed_variable.entries.ndim == 1:
+                # not defined on a mesh
+                continue
+            entries = interp1d(processed_variable.t_pts, processed_variable.entries)(t)
+            entries = entries.reshape(entries.shape[0], -1) / scales[name]
+            start = 0
+            for domain in processed_variable.domain:
+                npts = simulation.mesh[domain].npts
+                values.setdefault(domain, []).append(entries[start : start + npts])
+                start += npts
+        return {domain: np.hstack(value) for domain, value in values.items()}
+
+    @staticmethod
+    def _bisect(edges, cells=None):
+        """Split the given cells (by default all of them) of a 1D mesh in two"""
+        if cells is None:
+            cells = np.arange(len(edges) - 1)
+        midpoints = (edges[cells] + edges[cells + 1]) / 2
+        return np.sort(np.concatenate([edges, midpoints]))
+
+    def _estimate_errors(self, simulation, solution, domains, t_eval, solve_kwargs):
+        """The error indicator in each cell of each refinable domain"""
+        t = solution.t
+        scales = self._scales(solution)
+        values = self._node_values(simulation, solution, t, scales)
+        if self.indicator == "gradient":
+            errors = {}
+            for domain in domains:
+                jumps = np.max(np.abs(np.diff(values[domain], axis=0)), axis=1)
+                # the indicator of a cell is the largest jump to its neighbours
+                errors[domain] = np.maximum(np.append(jumps, 0), np.insert(jumps, 0, 0))
+            return errors
+
+        # Richardson extrapolation from the solution on a mesh with every cell split.
+        # Each spatial variable is refined in its own fine solve, so that the other
+        # dimensions of the variables (e.g. the electrode dimension of the particle
+        # concentrations) are the same on both meshes
+        errors = {}
+        for spatial_variable in dict.fromkeys(domains.values()):
+            fine_domains = [
+                domain for domain, var in domains.items() if var == spatial_variable
+            ]
+            fine_submesh_types = dict(self.submesh_types)
+            fine_var_pts = dict(self.var_pts)
+            for domain in fine_domains:
+                fine_edges = self._bisect(simulation.mesh[domain].edges)
+                fine_submesh_types[domain] = self._user_supplied(fine_edges)
+                fine_var_pts[spatial_variable] = len(fine_edges) - 1
+            fine_simulation = self._simulation(fine_submesh_types, fine_var_pts)
+            fine_solution = fine_simulation.solve(t_eval, **solve_kwargs)
+            # compare the solutions at the times where both are available
+            t_common = t[t <= fine_solution.t[-1]]
+            values = self._node_values(simulation, solution, t_common, scales)
+            fine_values = self._node_values(
+                fine_simulation, fine_solution, t_common, scales
+            )
+            for domain in fine_domains:
+                npts, n_columns = values[domain].shape
+                # average of the two halves of each cell, weighted by their volumes
+                # since the finite volume values are cell averages
+                submesh = fine_simulation.mesh[domain]
+                power = {"cartesian": 1, "cylindrical polar": 2, "spherical polar": 3}
+                volumes = np.diff(submesh.edges ** power.get(submesh.coord_sys, 1))
+                volumes = volumes.reshape(npts, 2, 1)
+                fine_average = np.sum(
+                    fine_values[domain].reshape(npts, 2, n_columns) * volumes, axis=1
+                ) / np.sum(volumes, axis=1)
+                errors[domain] = np.max(
+                    np.abs(values[domain] - fine_average), axis=1
+                ) / (2**2 - 1)
+        return errors
+
+    @staticmethod
+    def _user_supplied(edges):
+        return pybamm.MeshGenerator(
+            pybamm.UserSupplied1DSubMesh, submesh_params={"edges": edges}
+        )
+
+    def solve(self, t_eval=None, **kwargs):
+        """
+        Solve the model, refining the mesh until the error indicators are below the
+        tolerance. After solving, :attr:`var_pts` and :attr:`submesh_types` are those
+        of the final mesh, :attr:`simulation` is the simulation on the final mesh and
+        :attr:`history` contains the number of points and largest error indicator of
+        each spatial variable at each iteration.
+
+        Parameters
+        ----------
+        t_eval : numeric type, optional
+            The times at which to compute the solution, see
+            :meth:`pybamm.Simulation.solve`
+        **kwargs
+            Keyword arguments passed to :meth:`pybamm.Simulation.solve`, e.g. `inputs`
+
+        Returns
+        -------
+        :class:`pybamm.Solution`
+            The solution on the final mesh
+        """
+        self.history = []
+        for iteration in range(self.max_iterations + 1):
+            self.simulation = self._simulation(self.submesh_types, self.var_pts)
+            solution = self.simulation.solve(t_eval, **kwargs)
+            domains = self._refinable_domains(self.simulation, solution)
+            errors = self._estimate_errors(
+                self.simulation, solution, domains, t_eval, kwargs
+            )
+            self.history.append(
+                {
+                    "var_pts": {
+                        spatial_variable: self.var_pts[spatial_variable]
+                        for spatial_variable in domains.values()
+                    },
+                    "errors": {
+                        domains[domain]: float(np.max(error))
+                        for domain, error in errors.items()
+                    },
+                }
+            )
+            pybamm.logger.info(
+                f"Mesh refinement iteration {iteration}: {self.history[-1]}"
+            )
+            if iteration == self.max_iterations:
+                break
+
+            refined = False
+            for domain, spatial_variable in domains.items():
+                threshold = max(self.rtol, self.mark_fraction * np.max(errors[domain]))
+                cells = np.flatnonzero(errors[domain] > threshold)
+                if self.max_pts is not None:
+                    n_new = max(self.max_pts - self.var_pts[spatial_variable], 0)
+                    largest = np.argsort(errors[domain][cells])[::-1][:n_new]
+                    cells = np.sort(cells[largest])
+                if len(cells) == 0:
+                    continue
+                refined = True
+                edges = self._bisect(self.simulation.mesh[domain].edges, cells)
+                # the end points must match the limits of the geometry exactly
+                _, lims = self._spatial_limits(self.simulation.geometry, domain)
+                edges[0], edges[-1] = lims["min"], lims["max"]
+                self.submesh_types[domain] = self._user_supplied(edges)
+                self.var_pts[spatial_variable] = len(edges) - 1
+            if not refined:
+                break
+
+        pybamm.logger.info(f"Final mesh points: {self.var_pts}")
+        return solution
@@ -28,6 +28,10 @@ class Mesh(dict):
         # Save geometry
         self.geometry = geometry
 
+        # Operator matrices built by the spatial methods, shared by all the
+        # discretisations that use this mesh
+        self.operator_cache = {}
+
         # Preprocess var_pts
         var_pts_input = var_pts
         var_pts = {}
@@ -125,6 +129,7 @@ class Mesh(dict):
         instance = cls.__new__(cls)
         super(Mesh, instance).__init__()
 
+        instance.operator_cache = {}
         instance.submesh_pts = snippet["submesh_pts"]
         instance.base_domains = snippet["base_domains"]
 
@@ -10,6 +10,7 @@ import numpy as np
 
 import pybamm
 from pybamm.expression_tree.operations.serialise import Serialise
+from pybamm.solvers.lrudict import LRUDict
 
 
 class BaseModel:
@@ -70,6 +71,10 @@ class BaseModel:
         self._input_parameters = None
         self._parameter_info = None
         self._variables_casadi = {}
+        # a function is compiled for every set of variables observed together, so
+        # only the most recently used ones are kept
+        self._variables_casadi_fused = LRUDict(maxsize=16)
+        self._state_transfers = {}
         self._geometry = pybamm.Geometry({})
 
         # Default behaviour is to use the jacobian
@@ -213,6 +218,11 @@ class BaseModel:
 
     @variables.setter
     def variables(self, variables):
+        if isinstance(variables, pybamm.LazyFuzzyDict):
+            # variables are processed when first accessed, and were checked before
+            # processing
+            self._variables = variables
+            return
         for name, var in variables.items():
             if (
                 isinstance(var, pybamm.Variable)
@@ -665,11 +675,20 @@ class BaseModel:
                 for x in self.boundary_conditions.values()
                 for side in x.keys()
             ]
-            + list(self.variables.values())
+            + list(self._stored_variable_values())
             + [event.expression for event in self.events]
         )
         return list(all_input_parameters)
 
+    def _stored_variable_values(self):
+        """
+        The values of `model.variables`, without processing those that are processed
+        lazily, see :meth:`pybamm.LazyFuzzyDict.values_without_processing`.
+        """
+        if isinstance(self.variables, pybamm.LazyFuzzyDict):
+            return self.variables.values_without_processing()
+        return self.variables.values()
+
     def _find_symbols_by_submodel(self, typ, submodel):
         """Find all the instances of `typ` in the submodel"""
         unpacker = pybamm.SymbolUnpacker(typ)
@@ -687,6 +706,77 @@ class BaseModel:
         )
         return list(all_input_parameters)
 
+    @staticmethod
+    def _find_bound_parameters(symbols):
+        """
+        Find the :class:`pybamm.BoundParameter` nodes in a list of symbols, by name.
+        Nodes are compared by identity, since different nodes with the same name and
+        value have the same id.
+        """
+        bound_parameters = {}
+        visited = set()
+        stack = [symbol for symbol in symbols if symbol is not None]
+        while stack:
+            symbol = stack.pop()
+            if id(symbol) in visited:
+                continue
+            visited.add(id(symbol))
+            if isinstance(symbol, pybamm.BoundParameter):
+                bound_parameters.setdefault(symbol.name, []).append(symbol)
+            else:
+                stack.extend(symbol.children)
+        return bound_parameters
+
+    def rebind_parameters(self, values):
+        """
+        Change the values of parameters in a model whose parameters have already been
+        set, without processing the parameters or discretising the model again. Only
+        the parameters listed in :attr:`pybamm.ParameterValues.rebindable_parameters`
+        when the model was processed can be changed.
+
+        The values are changed in place, so copies of the model made with
+        :meth:`BaseModel.new_copy` are changed too. Solvers that have been set up for
+        the model set it up again if any of the parameters that they use have
+        changed, and the casadi functions of the variables that use the parameters
+        are discarded.
+
+        Parameters
+        ----------
+        values : dict
+            The new values of the parameters, keyed by parameter name
+        """
+        bound_parameters = self._find_bound_parameters(
+            [
+                self.concatenated_rhs,
+                self.concatenated_algebraic,
+                self.concatenated_initial_conditions,
+                *self.rhs.values(),
+                *self.algebraic.values(),
+                *self.initial_conditions.values(),
+                *self.variables_and_events.values(),
+            ]
+        )
+        for name in values:
+            if name not in bound_parameters:
+                raise pybamm.ModelError(
+                    f"'{name}' is not a rebindable parameter of model '{self.name}'"
+                )
+
+        for name, value in values.items():
+            for node in bound_parameters[name]:
+                node.value = value
+
+        # only discard the variables that depend on the rebound parameters
+        for variable in list(self._variables_casadi):
+            symbol = self.variables_and_events.get(variable)
+            if symbol is None or not values.keys().isdisjoint(
+                self._find_bound_parameters([symbol])
+            ):
+                del self._variables_casadi[variable]
+        for variables in list(self._variables_casadi_fused):
+            if not all(variable in self._variables_casadi for variable in variables):
+                del self._variables_casadi_fused[variables]
+
     def new_copy(self):
         """
         Creates a copy of the model, explicitly copying all the mutable attributes
@@ -700,6 +790,11 @@ class BaseModel:
         new_model._variables = self.variables.copy()
         new_model._events = self.events.copy()
         new_model._variables_casadi = self._variables_casadi.copy()
+        new_model._variables_casadi_fused = LRUDict(
+            maxsize=self._variables_casadi_fused.maxsize
+        )
+        new_model._variables_casadi_fused.update(self._variables_casadi_fused)
+        new_model._state_transfers = {}
         return new_model
 
     def update(self, *submodels):
@@ -855,54 +950,7 @@ class BaseModel:
         if isinstance(solution, pybamm.Solution):
             solution = solution.last_state
         for var in self.initial_conditions:
-            if isinstance(var, pybamm.Variable):
-                try:
-                    final_state = solution[var.name]
-                except KeyError as e:
-                    raise pybamm.ModelError(
-                        "To update a model from a solution, each variable in "
-                        "model.initial_conditions must appear in the solution with "
-                        "the same key as the variable name. In the solution provided, "
-                        f"'{e.args[0]}' was not found."
-                    ) from e
-                if isinstance(solution, pybamm.Solution):
-                    final_state = final_state.data
-                if final_state.ndim == 0:
-                    final_state_eval = np.array([final_state])
-                elif final_state.ndim == 1:
-                    final_state_eval = final_state[-1:]
-                elif final_state.ndim == 2:
-                    final_state_eval = final_state[:, -1]
-                elif final_state.ndim == 3:
-                    final_state_eval = final_state[:, :, -1].flatten(order="F")
-                else:
-                    raise NotImplementedError("Variable must be 0D, 1D, or 2D")
-            elif isinstance(var, pybamm.Concatenation):
-                children = []
-                for child in var.orphans:
-                    try:
-                        final_state = solution[child.name]
-                    except KeyError as e:
-                        raise pybamm.ModelError(
-                            "To update a model from a solution, each variable in "
-                            "model.initial_conditions must appear in the solution with "
-                            "the same key as the variable name. In the solution "
-                            f"provided, {e.args[0]}"
-                        ) from e
-                    if isinstance(solution, pybamm.Solution):
-                        final_state = final_state.data
-                    if final_state.ndim == 2:
-                        final_state_eval = final_state[:, -1]
-                    else:
-                        raise NotImplementedError(
-                            "Variable in concatenation must be 1D"
-                        )
-                    children.append(final_state_eval)
-                final_state_eval = np.concatenate(children)
-            else:
-                raise NotImplementedError(
-                    "Variable must have type 'Variable' or 'Concatenation'"
-                )
+            final_state_eval = self._final_state(var, solution)
 
             # If the model is already discretised, then the initial conditions must
             # be scaled and offset (otherwise, this is done when the model is
@@ -954,6 +1002,96 @@ class BaseModel:
         elif return_type == "ics":
             return initial_conditions, concatenated_initial_conditions
 
+    @staticmethod
+    def _final_state(var, solution):
+        """
+        The final state of a variable (or concatenation of variables) of the initial
+        conditions, read from a solution or dictionary by variable name
+        """
+        if isinstance(var, pybamm.Variable):
+            try:
+                final_state = solution[var.name]
+            except KeyError as e:
+                raise pybamm.ModelError(
+                    "To update a model from a solution, each variable in "
+                    "model.initial_conditions must appear in the solution with "
+                    "the same key as the variable name. In the solution provided, "
+                    f"'{e.args[0]}' was not found."
+                ) from e
+            if isinstance(solution, pybamm.Solution):
+                final_state = final_state.data
+            if final_state.ndim == 0:
+                final_state_eval = np.array([final_state])
+            elif final_state.ndim == 1:
+                final_state_eval = final_state[-1:]
+            elif final_state.ndim == 2:
+                final_state_eval = final_state[:, -1]
+            elif final_state.ndim == 3:
+                final_state_eval = final_state[:, :, -1].flatten(order="F")
+            else:
+                raise NotImplementedError("Variable must be 0D, 1D, or 2D")
+        elif isinstance(var, pybamm.Concatenation):
+            children = []
+            for child in var.orphans:
+                try:
+                    final_state = solution[child.name]
+                except KeyError as e:
+                    raise pybamm.ModelError(
+                        "To update a model from a solution, each variable in "
+                        "model.initial_conditions must appear in the solution with "
+                        "the same key as the variable name. In the solution "
+                        f"provided, {e.args[0]}"
+                    ) from e
+                if isinstance(solution, pybamm.Solution):
+                    final_state = final_state.data
+                if final_state.ndim == 2:
+                    final_state_eval = final_state[:, -1]
+                else:
+                    raise NotImplementedError("Variable in concatenation must be 1D")
+                children.append(final_state_eval)
+            final_state_eval = np.concatenate(children)
+        else:
+            raise NotImplementedError(
+                "Variable must have type 'Variable' or 'Concatenation'"
+            )
+        return final_state_eval
+
+    def initial_state_from(self, solution, inputs=None):
+        """
+        Evaluate the initial state of a discretised model from the last state of a
+        solution of another discretised model, e.g. when stepping from one step of an
+        experiment to the next. This gives the same result as evaluating the
+        concatenated initial conditions returned by
+        :meth:`BaseModel.set_initial_conditions_from`, but the states that the two
+        models share are copied by index, using a map that is computed once for each
+        pair of models.
+
+        Parameters
+        ----------
+        solution : :class:`pybamm.Solution`
+            The solution to use to initialize the model
+        inputs : dict, optional
+            Any input parameters of the model
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The initial state of the model, as a column vector
+        """
+        model_from = solution.all_models[-1]
+        if self.y_slices is None or model_from.y_slices is None:
+            # e.g. models loaded from a file, which do not store the slices
+            _, concatenated_initial_conditions = self.set_initial_conditions_from(
+                solution, return_type="ics"
+            )
+            return concatenated_initial_conditions.evaluate(0, inputs=inputs)
+        try:
+            state_transfer = self._state_transfers[model_from]
+        except KeyError:
+            state_transfer = StateTransfer(model_from, self)
+            self._state_transfers[model_from] = state_transfer
+        return state_transfer.evaluate(solution, inputs or {})
+
     def check_and_combine_dict(self, dict1, dict2):
         # check that the key ids are distinct
         ids1 = set(x for x in dict1.keys())
@@ -1550,3 +1688,134 @@ class BoundaryConditionsDict(dict):
                     )
 
         return boundary_conditions
+
+
+class StateTransfer:
+    """
+    Map from the last state of a solution of one discretised model to the initial
+    state of another. The states of the new model that are states of the old model
+    with the same name and size are copied by index (and rescaled, if the two
+    variables have different scales or references). The initial conditions of any
+    other states are read from the solution by variable name, as in
+    :meth:`BaseModel.set_initial_conditions_from`.
+
+    Parameters
+    ----------
+    model_from : :class:`pybamm.BaseModel`
+        The discretised model whose solution gives the state
+    model_to : :class:`pybamm.BaseModel`
+        The discretised model to initialize
+    """
+
+    def __init__(self, model_from, model_to):
+        states_from = {}
+        for var, slices in model_from.y_slices.items():
+            if not isinstance(var, pybamm.Variable):
+                continue
+            # only use the variables of the solution that are the state itself
+            state = var.reference + var.scale * pybamm.StateVector(
+                *slices, domains=var.domains
+            )
+            if model_from.variables_and_events.get(var.name) == state:
+                states_from[var.name] = (var, _slices_to_indices(slices))
+
+        self.len_y_from = model_from.len_rhs_and_alg
+        self.size = model_to.concatenated_initial_conditions.size
+        indices_to, indices_from = [], []
+        self._factors = {"from": [], "to": []}
+        self.all_states = []
+        self.other_states = []
+        for var in model_to.initial_conditions:
+            children = var.children if isinstance(var, pybamm.Concatenation) else [var]
+            idx_to = np.concatenate(
+                [_slices_to_indices(model_to.y_slices[child]) for child in children]
+            )
+            self.all_states.append((var, idx_to))
+            matches = [states_from.get(child.name) for child in children]
+            if (
+                any(match is None for match in matches)
+                or sum(match[1].size for match in matches) != idx_to.size
+            ):
+                self.other_states.append((var, idx_to))
+                continue
+            indices_to.append(idx_to)
+            for var_from, idx_from in matches:
+                indices_from.append(idx_from)
+                self._factors["from"].append((var_from, idx_from.size))
+            self._factors["to"].append((var, idx_to.size))
+        self.indices_to = np.concatenate(indices_to or [np.array([], dtype=int)])
+        self.indices_from = np.concatenate(indices_from or [np.array([], dtype=int)])
+
+        # the scales and references are only evaluated once if they are constant
+        self._constant_factors = {}
+        for side, factors in self._factors.items():
+            if all(
+                var.scale.is_constant() and var.reference.is_constant()
+                for var, _ in factors
+            ):
+                self._constant_factors[side] = self._evaluate_factors(factors, {})
+
+    @staticmethod
+    def _evaluate_factors(factors, inputs):
+        scales, references = [], []
+        for var, size in factors:
+            for symbol, values in [(var.scale, scales), (var.reference, references)]:
+                value = np.ravel(symbol.evaluate(0, inputs=inputs))
+                values.append(np.broadcast_to(value, size))
+        if not factors:
+            return np.array([]), np.array([])
+        return np.concatenate(scales), np.concatenate(references)
+
+    def _factors_for(self, side, inputs):
+        try:
+            return self._constant_factors[side]
+        except KeyError:
+            return self._evaluate_factors(self._factors[side], inputs)
+
+    def evaluate(self, solution, inputs):
+        """
+        Evaluate the initial state of the new model.
+
+        Parameters
+        ----------
+        solution : :class:`pybamm.Solution`
+            The solution of the old model
+        inputs : dict
+            The input parameters of the new model
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The initial state of the new model, as a column vector
+        """
+        last_state = solution.last_state
+        y_from = last_state.all_ys[-1]
+        if isinstance(y_from, casadi.DM):
+            y_from = y_from.full()
+        y_from = np.ravel(y_from)
+
+        y0 = np.empty(self.size)
+        if y_from.size == self.len_y_from:
+            scale_from, reference_from = self._factors_for(
+                "from", last_state.all_inputs[-1]
+            )
+            scale_to, reference_to = self._factors_for("to", inputs)
+            y0[self.indices_to] = (
+                reference_from + scale_from * y_from[self.indices_from] - reference_to
+            ) / scale_to
+            other_states = self.other_states
+        else:
+            # the solution does not contain the full state (e.g. it only contains
+            # the output variables), so all states are read by name
+            other_states = self.all_states
+
+        for var, idx in other_states:
+            final_state = BaseModel._final_state(var, last_state)
+            y0[idx] = (
+                final_state - np.ravel(var.reference.evaluate(0, inputs=inputs))
+            ) / np.ravel(var.scale.evaluate(0, inputs=inputs))
+        return y0[:, np.newaxis]
+
+
+def _slices_to_indices(slices):
+    return np.concatenate([np.arange(s.start, s.stop) for s in slices])
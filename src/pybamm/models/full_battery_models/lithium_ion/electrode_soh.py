@@ -2,6 +2,7 @@
 # A model to calculate electrode-specific SOH
 #
 import pybamm
+import casadi
 import numpy as np
 from functools import lru_cache
 
@@ -311,6 +312,7 @@ class ElectrodeSOHSolver:
         self._get_electrode_soh_sims_split = lru_cache()(
             self.__get_electrode_soh_sims_split
         )
+        self._batch_functions = None
 
     def __getstate__(self):
         """
@@ -319,6 +321,7 @@ class ElectrodeSOHSolver:
         result = self.__dict__.copy()
         result["_get_electrode_soh_sims_full"] = None  # Exclude LRU cache
         result["_get_electrode_soh_sims_split"] = None  # Exclude LRU cache
+        result["_batch_functions"] = None  # Exclude casadi functions
         return result
 
     def __setstate__(self, state):
@@ -419,6 +422,209 @@ class ElectrodeSOHSolver:
             sol_dict.update({"Maximum theoretical energy [W.h]": energy})
         return sol_dict
 
+    def solve_batch(self, inputs_list, tol=1e-8, max_iter=50):
+        """
+        Solve the electrode SOH problem for several sets of inputs at once.
+
+        The algebraic system is solved with a damped Newton method in which the
+        residuals, Jacobians and output variables of all the sets of inputs are
+        evaluated together, using casadi functions mapped over the batch. Any set
+        of inputs for which the batched solve does not converge is solved on its
+        own with :meth:`ElectrodeSOHSolver.solve`, which raises an informative
+        error if the problem is infeasible.
+
+        Parameters
+        ----------
+        inputs_list : list of dict
+            The inputs for each problem, in the format expected by
+            :meth:`ElectrodeSOHSolver.solve`
+        tol : float, optional
+            The tolerance on the absolute value of the residuals. Default is 1e-8.
+        max_iter : int, optional
+            The maximum number of Newton iterations. Default is 50.
+
+        Returns
+        -------
+        list of dict
+            The solution for each set of inputs, with the same keys as the
+            dictionary returned by :meth:`ElectrodeSOHSolver.solve`
+        """
+        inputs_list = list(inputs_list)
+        n_batch = len(inputs_list)
+        if n_batch == 0:
+            return []
+
+        functions = self._get_batch_functions()
+        model = functions["model"]
+        p = self._stack_inputs(functions["input_names"], inputs_list)
+
+        # Initial guesses, from the last solution or from the stoichiometry limits
+        z = np.empty((model.len_alg, n_batch))
+        for i, inputs in enumerate(inputs_list):
+            ics = self._set_up_solve(inputs)
+            for var, slices in model.y_slices.items():
+                if var.name in ics:
+                    z[slices[0], i] = np.ravel(ics[var.name])[-1]
+
+        residuals = functions["residuals"].map(n_batch)
+        residuals_and_jac = functions["residuals_and_jac"].map(n_batch)
+
+        def max_residual(F):
+            with np.errstate(invalid="ignore"):
+                return np.where(
+                    np.isfinite(F).all(axis=0), np.abs(F).max(axis=0), np.inf
+                )
+
+        converged = np.zeros(n_batch, dtype=bool)
+        for _ in range(max_iter):
+            F, J = (out.full() for out in residuals_and_jac(z, p))
+            err = max_residual(F)
+            converged = err < tol
+            if converged.all():
+                break
+            # Jacobians are stacked horizontally, one (n, n) block per problem
+            J = J.reshape(model.len_alg, n_batch, model.len_alg).transpose(1, 0, 2)
+            dz = np.full_like(z, np.nan)
+            solvable = np.isfinite(J).all(axis=(1, 2)) & (np.abs(np.linalg.det(J)) > 0)
+            dz[:, solvable] = -np.linalg.solve(
+                J[solvable], F.T[solvable][:, :, np.newaxis]
+            )[:, :, 0].T
+            # Halve the step for any problem where the residual does not decrease
+            step = np.where(converged, 0.0, 1.0)
+            for _ in range(10):
+                z_new = z + step * dz
+                err_new = max_residual(residuals(z_new, p).full())
+                decreased = (err_new < err) | converged
+                if decreased.all():
+                    break
+                step[~decreased] /= 2
+            z = np.where(decreased, z_new, z)
+
+        variables = functions["variables"].map(n_batch)(z, p).full()
+        energy_inputs = {}
+        results = []
+        for i, inputs in enumerate(inputs_list):
+            if converged[i]:
+                sol_dict = dict(zip(functions["variable_names"], variables[:, i]))
+                energy_inputs[i] = {**sol_dict, **inputs}
+            else:
+                sol_dict = self.solve(inputs)
+            results.append(sol_dict)
+
+        # Calculate theoretical energy for the problems solved in the batch
+        # TODO: energy calc for MSMR
+        if self.options["open-circuit potential"] != "MSMR" and energy_inputs:
+            energies = self._theoretical_energy_integral_batch(
+                list(energy_inputs.values())
+            )
+            for i, energy in zip(energy_inputs.keys(), energies):
+                results[i]["Maximum theoretical energy [W.h]"] = energy
+        return results
+
+    def _get_batch_functions(self):
+        """
+        Create (once) casadi functions for the residuals, Jacobian and variables of
+        the full electrode SOH model, in terms of the state and a vector of inputs.
+        """
+        if self._batch_functions is None:
+            sim = self._get_electrode_soh_sims_full()
+            sim.build()
+            model = sim.built_model
+            variable_names = list(model.variables.keys())
+            symbols = [model.concatenated_algebraic] + [
+                model.variables[name] for name in variable_names
+            ]
+            input_names = sorted(
+                {
+                    symbol.name
+                    for symbol in pybamm.SymbolUnpacker(
+                        pybamm.InputParameter
+                    ).unpack_list_of_symbols(symbols)
+                }
+            )
+            t = casadi.MX.sym("t")
+            y = casadi.MX.sym("y", model.len_alg)
+            p = casadi.MX.sym("p", len(input_names))
+            inputs = {name: p[i] for i, name in enumerate(input_names)}
+            converter = pybamm.CasadiConverter()
+            alg, *variables = [
+                converter.convert(symbol, t, y, None, inputs) for symbol in symbols
+            ]
+            alg = casadi.substitute(alg, t, 0)
+            variables = casadi.substitute(casadi.vertcat(*variables), t, 0)
+            self._batch_functions = {
+                "model": model,
+                "input_names": input_names,
+                "variable_names": variable_names,
+                "residuals": casadi.Function("residuals", [y, p], [alg]),
+                "residuals_and_jac": casadi.Function(
+                    "residuals_and_jac", [y, p], [alg, casadi.jacobian(alg, y)]
+                ),
+                "variables": casadi.Function("variables", [y, p], [variables]),
+            }
+        return self._batch_functions
+
+    @staticmethod
+    def _stack_inputs(input_names, inputs_list):
+        """Stack the inputs of each problem into the columns of an array"""
+        p = np.empty((len(input_names), len(inputs_list)))
+        for i, inputs in enumerate(inputs_list):
+            for j, name in enumerate(input_names):
+                try:
+                    p[j, i] = np.ravel(inputs[name])[0]
+                except KeyError as error:
+                    raise KeyError(f"Input parameter '{name}' not found") from error
+        return p
+
+    def _theoretical_energy_integral_batch(self, inputs_list, points=1000):
+        """
+        Vectorised version of :meth:`ElectrodeSOHSolver.theoretical_energy_integral`
+        for several sets of inputs.
+        """
+        T = self.param.T_amb_av(0)
+        x = pybamm.InputParameter("x")
+        y = pybamm.InputParameter("y")
+        ocv = self.parameter_values.process_symbol(
+            self.param.p.prim.U(y, T) - self.param.n.prim.U(x, T)
+        )
+        input_names = sorted(
+            {
+                symbol.name
+                for symbol in ocv.pre_order()
+                if isinstance(symbol, pybamm.InputParameter)
+            }
+        )
+        p = casadi.MX.sym("p", len(input_names))
+        ocv = casadi.Function(
+            "ocv",
+            [p],
+            [ocv.to_casadi(inputs={name: p[i] for i, name in enumerate(input_names)})],
+        )
+
+        values = {
+            key: np.array([inputs[key] for inputs in inputs_list], dtype=float)
+            for key in ["x_0", "y_0", "x_100", "y_100", "Q_p"]
+        }
+        x_vals = np.linspace(values["x_100"], values["x_0"], num=points, axis=-1)
+        y_vals = np.linspace(values["y_100"], values["y_0"], num=points, axis=-1)
+        grid = {"x": x_vals.flatten(), "y": y_vals.flatten()}
+        p_vals = np.empty((len(input_names), len(inputs_list) * points))
+        for j, name in enumerate(input_names):
+            if name in grid:
+                p_vals[j] = grid[name]
+            else:
+                p_vals[j] = np.repeat([inputs[name] for inputs in inputs_list], points)
+        try:
+            # scalar expressions evaluate much faster over large maps
+            ocv = ocv.expand()
+        except RuntimeError:
+            pass
+        Vs = ocv.map(p_vals.shape[1])(p_vals).full().reshape(len(inputs_list), points)
+        # Calculate dQ and integrate (converting to W-h)
+        Q = values["Q_p"] * (values["y_0"] - values["y_100"])
+        dQ = Q / (points - 1)
+        return np.trapz(Vs, dx=dQ[:, np.newaxis], axis=-1)
+
     def _set_up_solve(self, inputs):
         # Try with full sim
         sim = self._get_electrode_soh_sims_full()
@@ -61,6 +61,7 @@ class ParameterValues:
 
         # Initialise empty _processed_symbols dict (for caching)
         self._processed_symbols = {}
+        self._rebindable_parameters = set()
 
         # save citations
         if "citations" in self._dict_items:
@@ -222,8 +223,25 @@ class ParameterValues:
         """Returns a copy of the parameter values. Makes sure to copy the internal
         dictionary."""
         new_copy = ParameterValues(self._dict_items.copy())
+        new_copy.rebindable_parameters = self.rebindable_parameters
         return new_copy
 
+    @property
+    def rebindable_parameters(self):
+        """
+        The names of the parameters whose values can be changed after a model has
+        been processed, using :meth:`pybamm.BaseModel.rebind_parameters`. These must
+        have numeric values, which are kept as :class:`pybamm.BoundParameter` nodes
+        rather than being simplified into the model's expressions. Parameters that
+        are used to build the geometry or mesh cannot be rebound.
+        """
+        return self._rebindable_parameters
+
+    @rebindable_parameters.setter
+    def rebindable_parameters(self, names):
+        self._rebindable_parameters = set(names)
+        self._processed_symbols = {}
+
     def search(self, key, print_values=True):
         """
         Search dictionary for keys containing 'key'.
@@ -441,7 +459,7 @@ class ParameterValues:
 
         return values
 
-    def process_model(self, unprocessed_model, inplace=True):
+    def process_model(self, unprocessed_model, inplace=True, lazy_variables=False):
         """Assign parameter values to a model.
         Currently inplace, could be changed to return a new model.
 
@@ -452,6 +470,13 @@ class ParameterValues:
         inplace: bool, optional
             If True, replace the parameters in the model in place. Otherwise, return a
             new model with parameter values set. Default is True.
+        lazy_variables : bool, optional
+            If True, the parameters of the variables of the model (`model.variables`)
+            are only replaced when they are first accessed, using the parameter values
+            at the time the model was processed (see :class:`pybamm.LazyFuzzyDict`).
+            The input parameters and interpolants that the parameter values introduce
+            in the variables are still found when the model is processed. Default is
+            False.
 
         Raises
         ------
@@ -503,11 +528,21 @@ class ParameterValues:
 
         model.boundary_conditions = self.process_boundary_conditions(unprocessed_model)
 
-        new_variables = {}
-        for variable, equation in unprocessed_model.variables.items():
-            pybamm.logger.verbose(f"Processing parameters for {variable!r} (variables)")
-            new_variables[variable] = self.process_symbol(equation)
-        model.variables = new_variables
+        if lazy_variables:
+            pybamm.logger.verbose(
+                f"Defer processing parameters for variables of {model.name}"
+            )
+            model.variables = self._process_variables_lazily(
+                unprocessed_model.variables
+            )
+        else:
+            new_variables = {}
+            for variable, equation in unprocessed_model.variables.items():
+                pybamm.logger.verbose(
+                    f"Processing parameters for {variable!r} (variables)"
+                )
+                new_variables[variable] = self.process_symbol(equation)
+            model.variables = new_variables
 
         new_events = []
         for event in unprocessed_model.events:
@@ -533,6 +568,49 @@ class ParameterValues:
 
         return model
 
+    def _process_variables_lazily(self, variables):
+        """
+        Return a :class:`pybamm.LazyFuzzyDict` that replaces the parameters of each
+        variable when it is first accessed.
+        """
+        # process with a copy of the parameter values, so that later updates do not
+        # change the variables, sharing the processed symbols so that the subtrees
+        # shared with the equations are not processed again
+        parameter_values = self.copy()
+        parameter_values._processed_symbols = self._processed_symbols
+
+        if isinstance(variables, pybamm.LazyFuzzyDict):
+            values = variables.values_without_processing()
+        else:
+            values = variables.values()
+        # The processed parameters, together with the other leaves of the variables,
+        # contain the same input parameters and interpolants as the processed
+        # variables, and are much cheaper to find
+        deferred_symbols = []
+        visited = set()
+        stack = list(values)
+        while stack:
+            symbol = stack.pop()
+            if id(symbol) in visited:
+                continue
+            visited.add(id(symbol))
+            if isinstance(symbol, (pybamm.Parameter, pybamm.FunctionParameter)):
+                deferred_symbols.append(self.process_symbol(symbol))
+            elif not symbol.children:
+                deferred_symbols.append(symbol)
+            stack.extend(symbol.children)
+
+        if isinstance(variables, pybamm.LazyFuzzyDict):
+            return variables.then(parameter_values._process_variable, deferred_symbols)
+        return pybamm.LazyFuzzyDict(
+            variables, parameter_values._process_variable, deferred_symbols
+        )
+
+    def _process_variable(self, name, symbol):
+        """Process a single entry of `model.variables`, see :meth:`process_symbol`."""
+        pybamm.logger.verbose(f"Processing parameters for {name!r} (variables)")
+        return self.process_symbol(symbol)
+
     def _get_interpolant_events(self, model):
         """Add events for functions that have been defined as parameters"""
         # Define events to catch extrapolation. In these events the sign is
@@ -659,8 +737,15 @@ class ParameterValues:
                 # Check not NaN (parameter in csv file but no value given)
                 if np.isnan(value):
                     raise ValueError(f"Parameter '{symbol.name}' not found")
+                if symbol.name in self._rebindable_parameters:
+                    return pybamm.BoundParameter(value, name=symbol.name)
                 # Scalar inherits name
                 return pybamm.Scalar(value, name=symbol.name)
+            elif symbol.name in self._rebindable_parameters:
+                raise TypeError(
+                    f"Parameter '{symbol.name}' cannot be rebound as its value is "
+                    "not a number"
+                )
             elif isinstance(value, pybamm.Symbol):
                 new_value = self.process_symbol(value)
                 new_value.copy_domains(symbol)
@@ -727,7 +812,15 @@ class ParameterValues:
                     )
                 # If the "function" is provided is actually a scalar, return a Scalar
                 # object instead of throwing an error.
-                function = pybamm.Scalar(function_name, name=symbol.name)
+                if symbol.name in self._rebindable_parameters:
+                    function = pybamm.BoundParameter(function_name, name=symbol.name)
+                else:
+                    function = pybamm.Scalar(function_name, name=symbol.name)
+            elif symbol.name in self._rebindable_parameters:
+                raise TypeError(
+                    f"Parameter '{symbol.name}' cannot be rebound as its value is "
+                    "not a number"
+                )
             elif callable(function_name):
                 # otherwise evaluate the function to create a new PyBaMM object
                 function = function_name(*new_children)
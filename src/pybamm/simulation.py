@@ -1,4 +1,5 @@
 from __future__ import annotations
+import os
 import pickle
 import pybamm
 import numpy as np
@@ -10,6 +11,7 @@ import pybamm.telemetry
 from pybamm.util import import_optional_dependency
 
 from pybamm.expression_tree.operations.serialise import Serialise
+from pybamm.solvers.streamed_solution import detach_state
 
 
 def is_notebook():
@@ -62,6 +64,18 @@ class Simulation:
     discretisation_kwargs: dict (optional)
         Any keyword arguments to pass to the Discretisation class.
         See :class:`pybamm.Discretisation` for details.
+    model_cache: :class:`pybamm.ModelCache` or str (optional)
+        An on-disk cache of discretised models. If given, :meth:`Simulation.build`
+        loads the discretised model from the cache when an identical model has
+        already been built (by this or any other process), and stores it otherwise.
+        If a string is passed, it is used as the cache directory.
+    lazy_variables: bool (optional)
+        If True (default), the parameters of the variables of the model
+        (`model.variables`) are only set, and the variables only discretised, when
+        they are first accessed, e.g. when they are first requested from a solution.
+        This makes :meth:`Simulation.build` faster and the built model smaller, since
+        most variables are usually never used. If False, all the variables are
+        processed when the model is built.
     """
 
     def __init__(
@@ -77,6 +91,8 @@ class Simulation:
         output_variables=None,
         C_rate=None,
         discretisation_kwargs=None,
+        model_cache=None,
+        lazy_variables=True,
     ):
         self._parameter_values = parameter_values or model.default_parameter_values
         self._unprocessed_parameter_values = self._parameter_values
@@ -121,6 +137,10 @@ class Simulation:
         self._solver = solver or self._model.default_solver
         self._output_variables = output_variables
         self._discretisation_kwargs = discretisation_kwargs or {}
+        if isinstance(model_cache, (str, os.PathLike)):
+            model_cache = pybamm.ModelCache(model_cache)
+        self._model_cache = model_cache
+        self._lazy_variables = lazy_variables
 
         # Initialize empty built states
         self._model_with_set_params = None
@@ -131,6 +151,7 @@ class Simulation:
         self._mesh = None
         self._disc = None
         self._solution = None
+        self._step_statistics = []
         self.quick_plot = None
 
         # Initialise instances of Simulation class with the same random seed
@@ -269,7 +290,9 @@ class Simulation:
             return
 
         self._model_with_set_params = self._parameter_values.process_model(
-            self._unprocessed_model, inplace=False
+            self._unprocessed_model,
+            inplace=False,
+            lazy_variables=self._lazy_variables,
         )
         self._parameter_values.process_geometry(self._geometry)
         self._model = self._model_with_set_params
@@ -339,18 +362,112 @@ class Simulation:
         elif self._model.is_discretised:
             self._model_with_set_params = self._model
             self._built_model = self._model
+        elif self._model_cache is not None:
+            self._build_with_cache()
         else:
             self._set_parameters()
             self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
-            self._disc = pybamm.Discretisation(
-                self._mesh, self._spatial_methods, **self._discretisation_kwargs
-            )
+            self._disc = self._create_discretisation()
             self._built_model = self._disc.process_model(
                 self._model_with_set_params, inplace=False
             )
             # rebuilt model so clear solver setup
             self._solver._model_set_up = {}
 
+    def _create_discretisation(self):
+        return pybamm.Discretisation(
+            self._mesh,
+            self._spatial_methods,
+            **{"lazy_variables": self._lazy_variables, **self._discretisation_kwargs},
+        )
+
+    def _build_with_cache(self):
+        """
+        Build the model, loading the discretised model from the model cache if an
+        identical model has already been built, and storing it otherwise.
+
+        When the model is loaded from the cache, the mesh is loaded with it and the
+        geometry is processed, but the parameters are only set when the parameterised
+        model (:attr:`Simulation.model_with_set_params`) is first accessed. The
+        variables that were not processed when the model was stored are processed
+        when they are first accessed, as in a normal build.
+        """
+        key = self._model_cache.key(
+            self._unprocessed_model,
+            self._parameter_values,
+            self._geometry,
+            self._submesh_types,
+            self._var_pts,
+            self._spatial_methods,
+            self._discretisation_kwargs,
+        )
+        entry = self._model_cache.load(key)
+        if entry is not None:
+            self._built_model, self._mesh = entry
+            self._parameter_values.process_geometry(self._geometry)
+            self._disc = self._create_discretisation()
+            variables = self._built_model.variables
+            if isinstance(variables, pybamm.LazyFuzzyDict) and variables.is_detached:
+                model = self._unprocessed_model
+                unprocessed = {var.name: var for var in [*model.rhs, *model.algebraic]}
+                unprocessed.update(model.variables)
+                variables = variables.attach(
+                    unprocessed, self._loaded_variable_processor()
+                )
+                if not self._lazy_variables:
+                    variables.process_all()
+                self._built_model.variables = variables
+        else:
+            self._set_parameters()
+            self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
+            self._disc = self._create_discretisation()
+            self._built_model = self._disc.process_model(
+                self._model_with_set_params, inplace=False
+            )
+            if isinstance(self._unprocessed_model.variables, pybamm.LazyFuzzyDict):
+                # the processing steps of the unprocessed variables cannot be given
+                # again when the model is loaded, so they are all processed
+                self._built_model.variables = pybamm.FuzzyDict(
+                    self._built_model.variables
+                )
+            self._model_cache.save(key, self._built_model, self._mesh)
+        # rebuilt model so clear solver setup
+        self._solver._model_set_up = {}
+
+    def _loaded_variable_processor(self):
+        """
+        Return a function that sets the parameters of, and discretises, a variable of
+        a model loaded from the model cache, see :meth:`Simulation._build_with_cache`.
+
+        The state vector slices and boundary conditions of the discretisation are
+        keyed on symbols, whose ids are hashes that differ between processes, so
+        they are set up again from the unprocessed model when the first variable is
+        processed, rather than loaded with the model.
+        """
+        model = self._unprocessed_model
+        parameter_values = self._parameter_values.copy()
+        disc = self._disc
+
+        def process_variable(name, symbol):
+            if not disc.y_slices:
+                disc.set_variable_slices(
+                    [
+                        parameter_values.process_symbol(var)
+                        for var in [*model.rhs, *model.algebraic]
+                    ]
+                )
+                # only the boundary conditions of the model are needed
+                model_bcs = pybamm.BaseModel()
+                model_bcs.boundary_conditions = (
+                    parameter_values.process_boundary_conditions(model)
+                )
+                disc.bcs = disc.process_boundary_conditions(model_bcs)
+                disc.set_internal_boundary_conditions(model_bcs)
+            symbol = parameter_values.process_symbol(symbol)
+            return disc.process_dict({name: symbol})[name]
+
+        return process_variable
+
     def build_for_experiment(self, initial_soc=None, inputs=None, solve_kwargs=None):
         """
         Similar to :meth:`Simulation.build`, but for the case of simulating an
@@ -367,10 +484,13 @@ class Simulation:
             # Can process geometry with default parameter values (only electrical
             # parameters change between parameter values)
             self._parameter_values.process_geometry(self._geometry)
-            # Only needs to set up mesh and discretisation once
+            # Only needs to set up mesh and discretisation once. The equations that
+            # are shared between steps are only discretised for the first step.
             self._mesh = pybamm.Mesh(self._geometry, self._submesh_types, self._var_pts)
             self._disc = pybamm.Discretisation(
-                self._mesh, self._spatial_methods, **self._discretisation_kwargs
+                self._mesh,
+                self._spatial_methods,
+                **{"reuse_discretised_symbols": True, **self._discretisation_kwargs},
             )
             # Process all the different models
             self.steps_to_built_models = {}
@@ -544,6 +664,20 @@ class Simulation:
             )
 
         elif self.operating_mode == "with experiment":
+            # If a streaming callback is used, completed cycles are written to disk
+            # and only the states needed to continue the experiment are kept
+            streaming_callback = next(
+                (
+                    callback
+                    for callback in callbacks
+                    if isinstance(callback, pybamm.callbacks.StreamingCallback)
+                ),
+                None,
+            )
+            if streaming_callback is not None and starting_solution is not None:
+                raise ValueError(
+                    "starting_solution cannot be used with a StreamingCallback"
+                )
             callbacks.on_experiment_start(logs)
             self.build_for_experiment(
                 initial_soc=initial_soc, inputs=inputs, solve_kwargs=kwargs
@@ -563,6 +697,7 @@ class Simulation:
             esoh_solver = self.get_esoh_solver(calc_esoh)
 
             if starting_solution is None:
+                self._step_statistics = []
                 starting_solution_cycles = []
                 starting_solution_summary_variables = []
                 starting_solution_first_states = []
@@ -680,6 +815,7 @@ class Simulation:
                     num_cycles + cycle_offset,
                 )
                 logs["elapsed time"] = timer.time()
+                logs.pop("cycle solution", None)
                 callbacks.on_cycle_start(logs)
 
                 steps = []
@@ -807,6 +943,17 @@ class Simulation:
                             step_solution += step_solution_with_rest
 
                     steps.append(step_solution)
+                    if isinstance(step_solution, pybamm.Solution):
+                        self._step_statistics.append(
+                            {
+                                "cycle": cycle_num + cycle_offset,
+                                "step": step_num,
+                                "operating conditions": step_str,
+                                "termination": step_solution.termination,
+                                "total_time": step_solution.statistics.total_time,
+                                **step_solution.statistics.as_dict(),
+                            }
+                        )
 
                     # If there haven't been any successful steps yet in this cycle, then
                     # carry the solution over from the previous cycle (but
@@ -856,7 +1003,9 @@ class Simulation:
                         # Increment index for next iteration, then continue
                         idx += 1
 
-                if save_this_cycle or feasible is False:
+                if streaming_callback is None and (
+                    save_this_cycle or feasible is False
+                ):
                     self._solution = self._solution + cycle_solution
 
                 # At the final step of the inner loop we save the cycle
@@ -893,6 +1042,9 @@ class Simulation:
                     all_first_states.append(cycle_first_state)
 
                     logs["summary variables"] = cycle_sum_vars
+                    logs["cycle solution"] = (
+                        cycle_solution if save_this_cycle or not feasible else None
+                    )
 
                 # Calculate capacity_start using the first cycle
                 if cycle_num == 1:
@@ -920,6 +1072,18 @@ class Simulation:
 
                 callbacks.on_cycle_end(logs)
 
+                if streaming_callback is not None and len(steps) > 0:
+                    # The cycle is now on disk, so release it from memory
+                    current_solution = detach_state(current_solution.last_state)
+                    cycle_sum_vars.first_state = detach_state(
+                        cycle_sum_vars.first_state
+                    )
+                    cycle_sum_vars.last_state = detach_state(cycle_sum_vars.last_state)
+                    all_cycle_solutions[-1] = None
+                    all_first_states[-1] = detach_state(all_first_states[-1])
+                    cycle_solution = cycle_sol = steps = step_solution = None
+                    logs.pop("cycle solution")
+
                 # Break if stopping conditions are met
                 # Logging is done in the callbacks
                 if capacity_stop is not None:
@@ -934,7 +1098,13 @@ class Simulation:
                 if not feasible:
                     break
 
-            if self._solution is not None and len(all_cycle_solutions) > 0:
+            if streaming_callback is not None:
+                self._solution = streaming_callback.solution
+                self._solution.last_state = current_solution
+                if len(all_summary_variables) > 0:
+                    self._solution.all_first_states = all_first_states
+                    self._solution.update_summary_variables(all_summary_variables)
+            elif self._solution is not None and len(all_cycle_solutions) > 0:
                 self._solution.cycles = all_cycle_solutions
                 self._solution.update_summary_variables(all_summary_variables)
                 self._solution.all_first_states = all_first_states
@@ -946,6 +1116,132 @@ class Simulation:
 
         return self._solution
 
+    def slowest_steps(self, n=10):
+        """
+        Report the steps of the last experiment solved that took the longest, with
+        the statistics of the solver for each step (see
+        :class:`pybamm.SolverStatistics`).
+
+        Parameters
+        ----------
+        n : int, optional
+            The number of steps to report. If None, all the steps are reported.
+            Default is 10.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            One row for each step, with its cycle and step numbers (starting from 1),
+            operating conditions, termination reason and solver statistics, sorted by
+            decreasing total time
+        """
+        import pandas as pd
+
+        if not self._step_statistics:
+            raise ValueError(
+                "No step statistics available, solve the simulation with an "
+                "experiment first"
+            )
+        steps = pd.DataFrame(self._step_statistics).sort_values(
+            "total_time", ascending=False, kind="stable"
+        )
+        if n is not None:
+            steps = steps.head(n)
+        return steps.reset_index(drop=True)
+
+    def sweep(
+        self,
+        t_eval,
+        inputs,
+        output_variables=None,
+        input_names=None,
+        t_interp=None,
+        nproc=None,
+        chunk_size=None,
+        solver=None,
+    ):
+        """
+        Solve the simulation for every row of a table of input parameters, building
+        the model only once. See :meth:`pybamm.BaseSolver.sweep` for details of the
+        parameters.
+
+        Parameters
+        ----------
+        t_eval : list or :class:`numpy.ndarray`
+            The times (in seconds) at which to return the output variables
+        inputs : :class:`numpy.ndarray`, dict or :class:`pandas.DataFrame`
+            The table of input parameters, with one row per set of inputs
+        output_variables : list of str, optional
+            The variables to return. Defaults to the output variables of the
+            simulation.
+        input_names : list of str, optional
+            The names of the columns of ``inputs``, if it is an array
+        t_interp : list or :class:`numpy.ndarray`, optional
+            The times (in seconds) at which to interpolate the output variables,
+            for solvers that support interpolation
+        nproc : int, optional
+            Number of processes to use. Default is None, which solves the sweep in
+            this process.
+        chunk_size : int, optional
+            Number of rows solved by each process at a time
+        solver : :class:`pybamm.BaseSolver`, optional
+            The solver to use. Defaults to the solver of the simulation.
+
+        Returns
+        -------
+        dict
+            The entries of each output variable, as an array whose first axis is the
+            row of the table and whose last axis is time
+        """
+        if self.operating_mode == "with experiment":
+            raise NotImplementedError("Sweeps are not implemented for experiments")
+        self.build()
+        solver = solver or self._solver
+        return solver.sweep(
+            self._built_model,
+            t_eval,
+            inputs,
+            output_variables or self.output_variables,
+            input_names=input_names,
+            t_interp=t_interp,
+            nproc=nproc,
+            chunk_size=chunk_size,
+        )
+
+    def rebind_parameters(self, values):
+        """
+        Change the values of parameters of the built model(s) without building the
+        simulation again. The parameters must be listed in
+        :attr:`pybamm.ParameterValues.rebindable_parameters` of the simulation's
+        parameter values. See :meth:`pybamm.BaseModel.rebind_parameters`.
+
+        The parameter values of the simulation are updated too, so that the new
+        values are kept if the model is built again (e.g. for a different initial
+        state of charge).
+
+        Parameters
+        ----------
+        values : dict
+            The new values of the parameters, keyed by parameter name
+        """
+        if self._built_model is None and not self.steps_to_built_models:
+            raise ValueError(
+                "The simulation must be built before its parameters can be rebound"
+            )
+        models = []
+        if self._built_model is not None:
+            models.append(self._built_model)
+        if self.steps_to_built_models:
+            models.extend(self.steps_to_built_models.values())
+        for model in models:
+            model.rebind_parameters(values)
+
+        # copy the parameter values, which may be shared with the user
+        for attr in ["_parameter_values", "_unprocessed_parameter_values"]:
+            parameter_values = getattr(self, attr).copy()
+            parameter_values.update(values)
+            setattr(self, attr, parameter_values)
+
     def run_padding_rest(self, kwargs, rest_time, step_solution, inputs):
         model = self.steps_to_built_models["Rest for padding"]
         solver = self.steps_to_built_solvers["Rest for padding"]
@@ -1089,12 +1385,20 @@ class Simulation:
             output_filename=output_filename,
         )
 
+    def _set_deferred_parameters(self):
+        # a model loaded from the model cache is built without setting the
+        # parameters, which are only set if the parameterised model is accessed
+        if self._built_model is not None and self._model_with_set_params is None:
+            self._set_parameters()
+
     @property
     def model(self):
+        self._set_deferred_parameters()
         return self._model
 
     @property
     def model_with_set_params(self):
+        self._set_deferred_parameters()
         return self._model_with_set_params
 
     @property
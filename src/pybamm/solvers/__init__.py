@@ -1,5 +1,8 @@
 __all__ = ['algebraic_solver', 'base_solver', 'c_solvers',
-           'casadi_algebraic_solver', 'casadi_solver', 'dummy_solver',
-           'idaklu_jax', 'idaklu_solver', 'jax_bdf_solver', 'jax_solver',
+           'casadi_algebraic_solver', 'casadi_solver', 'compiled_model',
+           'consistent_state_cache', 'dummy_solver',
+           'idaklu_jax', 'idaklu_solver', 'jax_bdf_solver',
+           'jax_compilation_cache', 'jax_solver',
            'lrudict', 'processed_variable', 'processed_variable_computed',
-           'scipy_solver', 'solution', 'processed_variable_time_integral']
+           'scipy_solver', 'solution', 'processed_variable_time_integral',
+           'solver_statistics', 'streamed_solution']
@@ -60,6 +60,7 @@ class BaseSolver:
         self.extrap_tol = extrap_tol or -1e-10
         self.output_variables = [] if output_variables is None else output_variables
         self._model_set_up = {}
+        self.consistent_state_cache = None
 
         # Defaults, can be overwritten by specific solver
         self.name = "Base solver"
@@ -86,6 +87,23 @@ class BaseSolver:
     def root_method(self):
         return self._root_method
 
+    @property
+    def consistent_state_cache(self):
+        """
+        The :class:`pybamm.ConsistentStateCache` used to warm-start the calculation
+        of consistent initial conditions, or None (default) to always start from the
+        algebraic states of the initial conditions.
+        """
+        return self._consistent_state_cache
+
+    @consistent_state_cache.setter
+    def consistent_state_cache(self, cache):
+        if not (cache is None or isinstance(cache, pybamm.ConsistentStateCache)):
+            raise TypeError(
+                "consistent_state_cache must be a pybamm.ConsistentStateCache or None"
+            )
+        self._consistent_state_cache = cache
+
     @property
     def supports_parallel_solve(self):
         return False
@@ -277,6 +295,14 @@ class BaseSolver:
                 return_jacp_stacked=True,
             )
 
+        if model.convert_to_format == "casadi":
+            casadi_converter = vars_for_processing["casadi_converter"]
+            pybamm.logger.verbose(
+                f"Converted {casadi_converter.n_converted} unique subexpressions of "
+                f"{model.name} to CasADi, reusing them {casadi_converter.n_reused} "
+                "times"
+            )
+
         pybamm.logger.info("Finish solver set-up")
 
     def _set_initial_conditions(self, model, time, inputs):
@@ -411,8 +437,12 @@ class BaseSolver:
                 else:
                     p_casadi[name] = casadi.MX.sym(name, value.shape[0])
             p_casadi_stacked = casadi.vertcat(*[p for p in p_casadi.values()])
+            # set up converter object, for re-use of converted subexpressions
+            # between all the expressions of the model
+            casadi_converter = pybamm.CasadiConverter()
             vars_for_processing.update(
                 {
+                    "casadi_converter": casadi_converter,
                     "t_casadi": t_casadi,
                     "y_diff": y_diff,
                     "y_alg": y_alg,
@@ -641,7 +671,9 @@ class BaseSolver:
     def calculate_consistent_state(self, model, time=0, inputs=None):
         """
         Calculate consistent state for the algebraic equations through
-        root-finding. model.y0 is used as the initial guess for rootfinding
+        root-finding. model.y0 is used as the initial guess for rootfinding, unless
+        :attr:`BaseSolver.consistent_state_cache` holds a close enough state of the
+        same model, whose algebraic states are then used instead
 
         Parameters
         ----------
@@ -662,17 +694,86 @@ class BaseSolver:
         pybamm.logger.debug("Start calculating consistent states")
         if self.root_method is None:
             return model.y0
+
+        cache = self.consistent_state_cache
+        if cache is None or model.y0.shape[0] != model.len_rhs_and_alg:
+            # no cache, or the initial conditions include sensitivities
+            return self._find_consistent_state(model, time, inputs)
+
+        y0 = model.y0
+        y0_flat = (y0.full() if isinstance(y0, casadi.DM) else np.asarray(y0)).ravel()
+        y_diff = y0_flat[: model.len_rhs]
+        # only compare the differential states that the algebraic equations
+        # depend on (e.g. not the discharge and throughput capacities)
+        y_diff_key = y_diff[self._algebraic_dependencies(model)]
+        y_alg_guess = cache.lookup(model, y_diff_key, inputs)
+        y0_consistent = None
+        if y_alg_guess is not None:
+            y0_guess = np.concatenate([y_diff, y_alg_guess])
+            if isinstance(y0, casadi.DM):
+                y0_guess = casadi.DM(y0_guess)
+            else:
+                y0_guess = y0_guess.reshape(y0.shape)
+            try:
+                y0_consistent = self._find_consistent_state(
+                    model, time, inputs, y0_guess
+                )
+            except pybamm.SolverError:
+                pybamm.logger.debug(
+                    "Could not find consistent states from the cached state, "
+                    "retrying from the initial conditions"
+                )
+        if y0_consistent is None:
+            y0_consistent = self._find_consistent_state(model, time, inputs)
+
+        if isinstance(y0_consistent, casadi.DM):
+            y_alg = y0_consistent.full().ravel()[model.len_rhs :]
+        else:
+            y_alg = np.asarray(y0_consistent).ravel()[model.len_rhs :]
+        cache.store(model, y_diff_key, y_alg, inputs)
+        return y0_consistent
+
+    def _algebraic_dependencies(self, model):
+        """
+        Return a mask of the differential states that the algebraic equations of a
+        model depend on. All the differential states are included unless the model
+        has been set up with a casadi algebraic function.
+        """
+        set_up = self._model_set_up.get(model, {})
+        mask = set_up.get("algebraic dependencies")
+        if mask is None:
+            algebraic = getattr(model, "casadi_algebraic", None)
+            if isinstance(algebraic, casadi.Function):
+                depends = algebraic.which_depends(
+                    algebraic.name_in(1), algebraic.name_out(), 1, False
+                )
+                mask = np.array(depends[: model.len_rhs], dtype=bool)
+            else:
+                mask = np.ones(model.len_rhs, dtype=bool)
+            if model in self._model_set_up:
+                set_up["algebraic dependencies"] = mask
+        return mask
+
+    def _find_consistent_state(self, model, time, inputs, y0_guess=None):
+        """
+        Run the root-finding for :meth:`BaseSolver.calculate_consistent_state`,
+        starting from `y0_guess` if given and from model.y0 otherwise.
+        """
+        y0 = model.y0
+        if y0_guess is not None:
+            model.y0 = y0_guess
         try:
             root_sol = self.root_method._integrate(model, np.array([time]), inputs)
         except pybamm.SolverError as e:
             raise pybamm.SolverError(
                 f"Could not find consistent states: {e.args[0]}"
             ) from e
+        finally:
+            model.y0 = y0
         pybamm.logger.debug("Found consistent states")
 
         self.check_extrapolation(root_sol, model.events)
-        y0 = root_sol.all_ys[0]
-        return y0
+        return root_sol.all_ys[0]
 
     def _solve_process_calculate_sensitivities_arg(
         inputs, model, calculate_sensitivities
@@ -825,11 +926,8 @@ class BaseSolver:
                 )
 
         # if any setup configuration has changed, we need to re-set up
-        if sensitivities_have_changed:
-            self._model_set_up.pop(model, None)
-            # CasadiSolver caches its integrators using model, so delete this too
-            if isinstance(self, pybamm.CasadiSolver):
-                self.integrators.pop(model, None)
+        if sensitivities_have_changed or self._parameters_rebound(model):
+            self._clear_model_set_up(model)
 
         # save sensitivity parameters so we can identify them later on
         # (FYI: this is used in the Solution class)
@@ -853,7 +951,12 @@ class BaseSolver:
             # See https://github.com/pybamm-team/PyBaMM/pull/1261
             self.set_up(model, model_inputs_list[0], t_eval)
             self._model_set_up.update(
-                {model: {"initial conditions": model.concatenated_initial_conditions}}
+                {
+                    model: {
+                        "initial conditions": model.concatenated_initial_conditions,
+                        "bound parameters": self._bound_parameter_values(model),
+                    }
+                }
             )
         elif (
             self._model_set_up[model]["initial conditions"]
@@ -876,7 +979,9 @@ class BaseSolver:
             self._set_initial_conditions(model, t_eval[0], model_inputs_list[0])
 
         # Solve for the consistent initialization
+        consistent_timer = pybamm.Timer()
         self._set_consistent_initialization(model, t_eval[0], model_inputs_list[0])
+        consistent_initialisation_time = consistent_timer.time()
 
         set_up_time = timer.time()
         timer.reset()
@@ -952,12 +1057,14 @@ class BaseSolver:
                 # rootfinder)
                 model.y0 = last_state
                 if len(model.algebraic) > 0:
+                    consistent_timer.reset()
                     model.y0 = self.calculate_consistent_state(
                         model, t_eval[end_index], model_inputs_list[0]
                     )
-        solve_time = timer.time()
+                    consistent_initialisation_time += consistent_timer.time()
 
         for i, solution in enumerate(solutions):
+            post_processing_timer = pybamm.Timer()
             # Check if extrapolation occurred
             self.check_extrapolation(solution, model.events)
             # Identify the event that caused termination and update the solution to
@@ -965,11 +1072,18 @@ class BaseSolver:
             solutions[i], termination = self.get_termination_reason(
                 solution, model.events
             )
+            solutions[i]._statistics.add(
+                consistent_initialisation_time=consistent_initialisation_time,
+                post_processing_time=post_processing_timer.time(),
+            )
+        solve_time = timer.time()
+
+        for solution in solutions:
             # Assign times
-            solutions[i].set_up_time = set_up_time
+            solution.set_up_time = set_up_time
             # all solutions get the same solve time, but their integration time
             # will be different (see https://github.com/pybamm-team/PyBaMM/pull/1261)
-            solutions[i].solve_time = solve_time
+            solution.solve_time = solve_time
 
         # Restore old y0
         model.y0 = old_y0
@@ -1162,6 +1276,154 @@ class BaseSolver:
 
         return t_interp
 
+    def sweep(
+        self,
+        model,
+        t_eval,
+        inputs,
+        output_variables,
+        input_names=None,
+        t_interp=None,
+        nproc=None,
+        chunk_size=None,
+    ):
+        """
+        Solve a model for every row of a table of input parameters, returning only
+        the requested output variables. The rows are split into chunks, which are
+        solved in a pool of processes that each hold a set up copy of the model, so
+        that the model is not sent to the processes for every chunk. Only the output
+        variables of each chunk are returned, so large sweeps do not keep every
+        :class:`pybamm.Solution` in memory.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The discretised model to solve
+        t_eval : list or :class:`numpy.ndarray`
+            The times (in seconds) at which to return the output variables. If the
+            solver supports interpolation and ``t_interp`` is given, only the first
+            and last values are used.
+        inputs : :class:`numpy.ndarray`, dict or :class:`pandas.DataFrame`
+            The table of input parameters, with one row per set of inputs. Either a
+            2D array with a column for each entry of ``input_names``, a dictionary of
+            1D arrays of equal length, or a data frame whose columns are the names of
+            the input parameters.
+        output_variables : list of str
+            The variables to return
+        input_names : list of str, optional
+            The names of the columns of ``inputs``, if it is an array
+        t_interp : list or :class:`numpy.ndarray`, optional
+            The times (in seconds) at which to interpolate the output variables,
+            for solvers that support interpolation. Defaults to ``t_eval``.
+        nproc : int, optional
+            Number of processes to use. If None (default) or 1, the chunks are solved
+            in this process.
+        chunk_size : int, optional
+            Number of rows in each chunk. Defaults to splitting the rows evenly
+            between the processes, with at most 1000 rows in each chunk.
+
+        Returns
+        -------
+        dict
+            The entries of each output variable, as an array whose first axis is the
+            row of the table and whose last axis is time. Entries after a row's
+            solution terminated (e.g. due to an event), and all the entries of rows
+            that could not be solved, are NaN.
+        """
+        if not output_variables:
+            raise ValueError("At least one output variable must be given")
+        input_names, table = self._sweep_table(inputs, input_names)
+        for input_param in model.input_parameters:
+            if input_param.name not in input_names:
+                raise pybamm.SolverError(
+                    f"No value provided for input '{input_param.name}'"
+                )
+        t_output = np.asarray(t_eval if t_interp is None else t_interp, dtype=float)
+        if self.supports_interp:
+            solve_kwargs = {"t_eval": [t_eval[0], t_eval[-1]], "t_interp": t_output}
+        else:
+            solve_kwargs = {"t_eval": t_output}
+
+        n_rows = table.shape[0]
+        nproc = nproc or 1
+        if chunk_size is None:
+            chunk_size = min(1000, max(1, -(-n_rows // nproc)))
+        chunks = [
+            table[start : start + chunk_size] for start in range(0, n_rows, chunk_size)
+        ]
+
+        args = (self, model, input_names, output_variables, t_output, solve_kwargs)
+        if nproc == 1:
+            _sweep_init_worker(*args)
+            chunk_outputs = map(_sweep_chunk, chunks)
+            pool = None
+        else:
+            pool = mp.get_context(self._mp_context).Pool(
+                processes=nproc, initializer=_sweep_init_worker, initargs=args
+            )
+            chunk_outputs = pool.imap(_sweep_chunk, chunks)
+
+        # copy each chunk into the output arrays as soon as it is ready. The shape of
+        # an output is only known once a row has been solved, so each array is
+        # allocated (filled with NaN) from the first chunk with a solved row
+        outputs = dict.fromkeys(output_variables)
+        n_failed = 0
+        start = 0
+        try:
+            for chunk, (chunk_output, chunk_failed) in zip(chunks, chunk_outputs):
+                for var, data in chunk_output.items():
+                    if data is None:
+                        # no row of the chunk could be solved
+                        continue
+                    if outputs[var] is None:
+                        outputs[var] = np.full((n_rows, *data.shape[1:]), np.nan)
+                    outputs[var][start : start + len(chunk)] = data
+                start += len(chunk)
+                n_failed += chunk_failed
+        finally:
+            if pool is None:
+                _sweep_worker.clear()
+            else:
+                pool.close()
+                pool.join()
+
+        for var, data in outputs.items():
+            if data is None:
+                # no row could be solved, so the shape of the output is unknown
+                outputs[var] = np.full((n_rows, t_output.size), np.nan)
+
+        if n_failed > 0:
+            warnings.warn(
+                f"{n_failed} of {n_rows} sets of inputs could not be solved, so their "
+                "outputs are NaN",
+                pybamm.SolverWarning,
+                stacklevel=2,
+            )
+        return outputs
+
+    @staticmethod
+    def _sweep_table(inputs, input_names):
+        """Convert a table of input parameters to a list of names and a 2D array"""
+        if isinstance(inputs, dict):
+            input_names = list(inputs.keys())
+            table = np.column_stack(
+                [np.asarray(v, dtype=float) for v in inputs.values()]
+            )
+        elif hasattr(inputs, "columns"):
+            # pandas DataFrame
+            input_names = [str(name) for name in inputs.columns]
+            table = inputs.to_numpy(dtype=float)
+        else:
+            table = np.asarray(inputs, dtype=float)
+            if table.ndim == 1:
+                table = table[:, np.newaxis]
+            if input_names is None or len(input_names) != table.shape[1]:
+                raise ValueError(
+                    "'input_names' must give the name of each column of 'inputs'"
+                )
+            input_names = list(input_names)
+        return input_names, table
+
     def step(
         self,
         old_solution,
@@ -1283,6 +1545,9 @@ class BaseSolver:
             )
         )
 
+        if self._parameters_rebound(model):
+            self._clear_model_set_up(model)
+
         first_step_this_model = model not in self._model_set_up
         if first_step_this_model or sensitivities_have_changed:
             if len(self._model_set_up) > 0:
@@ -1294,7 +1559,12 @@ class BaseSolver:
                 )
             self.set_up(model, model_inputs)
             self._model_set_up.update(
-                {model: {"initial conditions": model.concatenated_initial_conditions}}
+                {
+                    model: {
+                        "initial conditions": model.concatenated_initial_conditions,
+                        "bound parameters": self._bound_parameter_values(model),
+                    }
+                }
             )
 
         if (
@@ -1317,10 +1587,7 @@ class BaseSolver:
                 model.y0S = tuple(full_sens[:, i] for i in range(full_sens.shape[1]))
 
         else:
-            _, concatenated_initial_conditions = model.set_initial_conditions_from(
-                old_solution, return_type="ics"
-            )
-            model.y0 = concatenated_initial_conditions.evaluate(0, inputs=model_inputs)
+            model.y0 = model.initial_state_from(old_solution, inputs=model_inputs)
             if using_sensitivities:
                 model.y0S = self._set_sens_initial_conditions_from(old_solution, model)
 
@@ -1343,10 +1610,12 @@ class BaseSolver:
                     y0_list.append(s[model.len_rhs :])
             model.y0 = casadi.vertcat(*y0_list)
 
-        set_up_time = timer.time()
-
         # (Re-)calculate consistent initialization
+        consistent_timer = pybamm.Timer()
         self._set_consistent_initialization(model, t_start_shifted, model_inputs)
+        consistent_initialisation_time = consistent_timer.time()
+
+        set_up_time = timer.time()
 
         # Check consistent initialization doesn't violate events
         self._check_events_with_initialization(t_eval, model, model_inputs)
@@ -1361,16 +1630,21 @@ class BaseSolver:
             solution = solutions[0]
         else:
             solution = self._integrate(model, t_eval, model_inputs, t_interp)
-        solution.solve_time = timer.time()
 
+        post_processing_timer = pybamm.Timer()
         # Check if extrapolation occurred
         self.check_extrapolation(solution, model.events)
 
         # Identify the event that caused termination and update the solution to
         # include the event time and state
         solution, termination = self.get_termination_reason(solution, model.events)
+        solution._statistics.add(
+            consistent_initialisation_time=consistent_initialisation_time,
+            post_processing_time=post_processing_timer.time(),
+        )
 
-        # Assign setup time
+        # Assign times
+        solution.solve_time = timer.time()
         solution.set_up_time = set_up_time
 
         # Report times
@@ -1538,7 +1812,44 @@ class BaseSolver:
                 "Cannot simulate an empty model, use `pybamm.DummySolver` instead"
             )
 
-    def get_platform_context(self, system_type: str):
+    def _bound_parameter_values(self, model):
+        """
+        The bound parameters that are used by the functions set up for the model,
+        with their values, so that the model can be set up again if they are rebound.
+        See :meth:`pybamm.BaseModel.rebind_parameters`.
+        """
+        bound_parameters = model._find_bound_parameters(
+            [
+                model.concatenated_rhs,
+                model.concatenated_algebraic,
+                model.concatenated_initial_conditions,
+            ]
+            + [event.expression for event in model.events]
+            + [model.variables_and_events[name] for name in self.output_variables]
+        )
+        return [
+            (node, node.value) for nodes in bound_parameters.values() for node in nodes
+        ]
+
+    def _parameters_rebound(self, model):
+        """Whether any of the parameters used by the set up model have changed"""
+        set_up = self._model_set_up.get(model, {})
+        return any(
+            node.value != value for node, value in set_up.get("bound parameters", [])
+        )
+
+    def _clear_model_set_up(self, model):
+        self._model_set_up.pop(model, None)
+        # CasadiSolver caches its integrators using model, so delete this too
+        if isinstance(self, pybamm.CasadiSolver):
+            self.integrators.pop(model, None)
+        # JaxSolver caches its compiled solves using model
+        if isinstance(self, pybamm.JaxSolver):
+            self._cached_solves.pop(model, None)
+            self._cached_batched_solves.pop(model, None)
+
+    @staticmethod
+    def get_platform_context(system_type: str):
         # Set context for parallel processing depending on the platform
         if system_type.lower() in ["linux", "darwin"]:
             return "fork"
@@ -1680,7 +1991,9 @@ def process(
         ]
         # Process with CasADi
         report(f"Converting {name} to CasADi")
-        casadi_expression = symbol.to_casadi(t_casadi, y_casadi, inputs=p_casadi)
+        casadi_expression = vars_for_processing["casadi_converter"].convert(
+            symbol, t_casadi, y_casadi, None, p_casadi
+        )
         # Add sensitivity vectors to the rhs and algebraic equations
         jacp = None
         if calculate_sensitivities_explicit:
@@ -1796,3 +2109,92 @@ def process(
         )
 
     return func, jac, jacp, jac_action
+
+
+# State of each process solving the chunks of BaseSolver.sweep
+_sweep_worker = {}
+
+
+def _sweep_init_worker(
+    solver, model, input_names, output_variables, t_output, solve_kwargs
+):
+    # each process sets up its own copy of the solver for the model once
+    # Solvers that accept a list of inputs use the same initial conditions for all
+    # of them, so the rows are solved one by one if the initial conditions depend
+    # on the inputs
+    solve_list = solver.supports_parallel_solve and not any(
+        isinstance(symbol, pybamm.InputParameter)
+        for symbol in model.concatenated_initial_conditions.pre_order()
+    )
+    _sweep_worker.update(
+        solver=solver.copy(),
+        solve_list=solve_list,
+        model=model,
+        input_names=input_names,
+        output_variables=output_variables,
+        t_output=t_output,
+        solve_kwargs=solve_kwargs,
+    )
+
+
+def _sweep_chunk(chunk):
+    """Solve a chunk of the rows of BaseSolver.sweep, returning the outputs"""
+    solver = _sweep_worker["solver"]
+    model = _sweep_worker["model"]
+    t_output = _sweep_worker["t_output"]
+    inputs_list = [dict(zip(_sweep_worker["input_names"], row)) for row in chunk]
+
+    if _sweep_worker["solve_list"]:
+        try:
+            solutions = solver.solve(
+                model, inputs=inputs_list, **_sweep_worker["solve_kwargs"]
+            )
+            if isinstance(solutions, pybamm.Solution):
+                solutions = [solutions]
+        except pybamm.SolverError:
+            # solve the rows one by one so that a failed row does not fail the chunk
+            solutions = [_sweep_solve_row(inputs) for inputs in inputs_list]
+    else:
+        solutions = [_sweep_solve_row(inputs) for inputs in inputs_list]
+
+    outputs = {}
+    for var in _sweep_worker["output_variables"]:
+        rows = [
+            None if solution is None else _entries_at(solution, var, t_output)
+            for solution in solutions
+        ]
+        shape = next((row.shape for row in rows if row is not None), None)
+        if shape is None:
+            # every row failed, so the shape is left to BaseSolver.sweep
+            outputs[var] = None
+            continue
+        outputs[var] = np.stack(
+            [np.full(shape, np.nan) if row is None else row for row in rows]
+        )
+    n_failed = sum(solution is None for solution in solutions)
+    return outputs, n_failed
+
+
+def _sweep_solve_row(inputs):
+    try:
+        return _sweep_worker["solver"].solve(
+            _sweep_worker["model"], inputs=inputs, **_sweep_worker["solve_kwargs"]
+        )
+    except pybamm.SolverError:
+        return None
+
+
+def _entries_at(solution, var, t_output):
+    """
+    Entries of a variable at the output times, with NaN after the end of the
+    solution
+    """
+    entries = np.asarray(solution[var].entries, dtype=float)
+    t = solution.t
+    if t.size == t_output.size and np.array_equal(t, t_output):
+        return entries
+    flat = entries.reshape(-1, t.size)
+    values = np.array(
+        [np.interp(t_output, t, row, left=np.nan, right=np.nan) for row in flat]
+    )
+    return values.reshape(*entries.shape[:-1], t_output.size)
@@ -27,6 +27,7 @@ class CasadiAlgebraicSolver(pybamm.BaseSolver):
         self.name = "CasADi algebraic solver"
         self._algebraic_solver = True
         self.extra_options = extra_options or {}
+        self._rootfinders = {}
         pybamm.citations.register("Andersson2019")
 
     @property
@@ -37,6 +38,67 @@ class CasadiAlgebraicSolver(pybamm.BaseSolver):
     def tol(self, value):
         self._tol = value
 
+    def _get_rootfinder(self, model, len_rhs, len_alg, len_inputs):
+        """
+        Create the rootfinder for the algebraic equations of a model, with the time,
+        the differential states and the inputs as parameters, or reuse the one created
+        by a previous call with the same model and settings.
+        """
+        settings = (
+            model.casadi_algebraic,
+            len_rhs,
+            len_alg,
+            len_inputs,
+            self.tol,
+            dict(self.extra_options),
+        )
+        try:
+            cached_settings, roots = self._rootfinders[model]
+        except KeyError:
+            pass
+        else:
+            # the model's casadi functions change if it is set up again
+            if (
+                cached_settings[0] is settings[0]
+                and cached_settings[1:] == settings[1:]
+            ):
+                return roots
+
+        t_sym = casadi.MX.sym("t")
+        y_diff_sym = casadi.MX.sym("y_diff", len_rhs)
+        inputs_sym = casadi.MX.sym("inputs", len_inputs)
+        y_alg_sym = casadi.MX.sym("y_alg", len_alg)
+        y_sym = casadi.vertcat(y_diff_sym, y_alg_sym)
+
+        alg = model.casadi_algebraic(t_sym, y_sym, inputs_sym)
+
+        # Set constraints vector in the casadi format
+        # Constrain the unknowns. 0 (default): no constraint on ui, 1: ui >= 0.0,
+        # -1: ui <= 0.0, 2: ui > 0.0, -2: ui < 0.0.
+        constraints = np.zeros_like(model.bounds[0], dtype=int)
+        # If the lower bound is positive then the variable must always be positive
+        constraints[model.bounds[0] >= 0] = 1
+        # If the upper bound is negative then the variable must always be negative
+        constraints[model.bounds[1] <= 0] = -1
+
+        # Set up rootfinder
+        roots = casadi.rootfinder(
+            "roots",
+            "newton",
+            dict(
+                x=y_alg_sym,
+                p=casadi.vertcat(t_sym, y_diff_sym, inputs_sym),
+                g=alg,
+            ),
+            {
+                **self.extra_options,
+                "abstol": self.tol,
+                "constraints": list(constraints[len_rhs:]),
+            },
+        )
+        self._rootfinders[model] = (settings, roots)
+        return roots
+
     def _integrate(self, model, t_eval, inputs_dict=None, t_interp=None):
         """
         Calculate the solution of the algebraic equations through root-finding
@@ -77,33 +139,8 @@ class CasadiAlgebraicSolver(pybamm.BaseSolver):
 
         y_alg = None
 
-        # Set up
-        t_sym = casadi.MX.sym("t")
-        y_alg_sym = casadi.MX.sym("y_alg", y0_alg.shape[0])
-        y_sym = casadi.vertcat(y0_diff, y_alg_sym)
-
-        alg = model.casadi_algebraic(t_sym, y_sym, inputs)
-
-        # Set constraints vector in the casadi format
-        # Constrain the unknowns. 0 (default): no constraint on ui, 1: ui >= 0.0,
-        # -1: ui <= 0.0, 2: ui > 0.0, -2: ui < 0.0.
-        constraints = np.zeros_like(model.bounds[0], dtype=int)
-        # If the lower bound is positive then the variable must always be positive
-        constraints[model.bounds[0] >= 0] = 1
-        # If the upper bound is negative then the variable must always be negative
-        constraints[model.bounds[1] <= 0] = -1
-
-        # Set up rootfinder
-        roots = casadi.rootfinder(
-            "roots",
-            "newton",
-            dict(x=y_alg_sym, p=t_sym, g=alg),
-            {
-                **self.extra_options,
-                "abstol": self.tol,
-                "constraints": list(constraints[len_rhs:]),
-            },
-        )
+        roots = self._get_rootfinder(model, len_rhs, y0_alg.shape[0], inputs.shape[0])
+        p = casadi.vertcat(y0_diff, inputs)
 
         timer = pybamm.Timer()
         integration_time = 0
@@ -111,7 +148,7 @@ class CasadiAlgebraicSolver(pybamm.BaseSolver):
             # Solve
             try:
                 timer.reset()
-                y_alg_sol = roots(y0_alg, t)
+                y_alg_sol = roots(y0_alg, casadi.vertcat(t, p))
                 integration_time += timer.time()
                 success = True
                 message = None
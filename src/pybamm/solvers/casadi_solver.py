@@ -3,6 +3,7 @@ import pybamm
 import numpy as np
 import warnings
 from scipy.interpolate import interp1d
+from scipy.optimize import brentq
 from .lrudict import LRUDict
 
 
@@ -69,6 +70,25 @@ class CasadiSolver(pybamm.BaseSolver):
         The maximum number of integrators that the solver will retain before
         ejecting past integrators using an LRU methodology. A value of 0 or
         None leaves the number of integrators unbound. Default is 100.
+    integrators_maxbytes : int, optional
+        The memory budget, in bytes, of the integrators that the solver retains. The
+        memory used by the integrators of each model is estimated from the size of
+        the model's CasADi functions, and the least recently used integrators are
+        ejected when the estimate exceeds the budget. A value of 0 or None (default)
+        leaves the memory of the integrators unbound. See
+        :attr:`CasadiSolver.integrator_stats`.
+    event_location : str, optional
+        How to locate an event once the step in which it is crossed is known (default
+        is "grid"):
+
+            - "grid": integrate the step again on a dense grid, with a new \
+            integrator, and interpolate linearly between the two grid points \
+            on either side of the event.
+            - "interpolation": find the root of the event on a cubic Hermite \
+            interpolant of the states over the step, integrate up to that time \
+            with the integrator without grid (created once for each model), and \
+            repeat on the reduced step until the event time converges. Falls back \
+            to "grid" if the event cannot be located this way.
     """
 
     def __init__(
@@ -86,6 +106,8 @@ class CasadiSolver(pybamm.BaseSolver):
         return_solution_if_failed_early=False,
         perturb_algebraic_initial_conditions=None,
         integrators_maxcount=100,
+        event_location="grid",
+        integrators_maxbytes=None,
     ):
         super().__init__(
             "problem dependent",
@@ -103,6 +125,12 @@ class CasadiSolver(pybamm.BaseSolver):
                 "'fast', for solving quickly without events, or 'safe without grid' or "
                 "'fast with events' (both experimental)"
             )
+        if event_location not in ["grid", "interpolation"]:
+            raise ValueError(
+                f"invalid event_location '{event_location}'. Must be 'grid' or "
+                "'interpolation'"
+            )
+        self.event_location = event_location
         self.max_step_decrease_count = max_step_decrease_count
         self.dt_max = dt_max or 600
 
@@ -127,9 +155,15 @@ class CasadiSolver(pybamm.BaseSolver):
 
         # Initialize
         self.integrators_maxcount = integrators_maxcount
-        self.integrators = LRUDict(maxsize=self.integrators_maxcount)
+        self.integrators_maxbytes = integrators_maxbytes
+        self.integrators = LRUDict(
+            maxsize=self.integrators_maxcount, maxbytes=self.integrators_maxbytes
+        )
         self.integrator_specs = LRUDict(maxsize=self.integrators_maxcount)
+        self._integrator_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._functions_nbytes = {}
         self.y_sols = {}
+        self._state_derivatives = LRUDict(maxsize=self.integrators_maxcount)
 
         pybamm.citations.register("Andersson2019")
 
@@ -427,7 +461,34 @@ class CasadiSolver(pybamm.BaseSolver):
             coarse_solution.termination = "final time"
             return coarse_solution
 
-        # If events have been triggered, we solve for a dense window in the interval
+        event_location_timer = pybamm.Timer()
+        if (
+            self.event_location == "interpolation"
+            and model.len_rhs > 0
+            and not model.calculate_sensitivities
+        ):
+            try:
+                t_event, y_event, closest_event_idx, integration_time, statistics = (
+                    self._locate_event(coarse_solution, event_idx_lower)
+                )
+            except pybamm.SolverError as error:
+                pybamm.logger.debug(
+                    f"Could not locate the event by interpolation ({error}), "
+                    "integrating on a dense grid instead"
+                )
+            else:
+                return self._truncate_at_event(
+                    coarse_solution,
+                    event_idx_lower,
+                    t_event,
+                    y_event,
+                    closest_event_idx,
+                    coarse_solution.integration_time + integration_time,
+                    statistics,
+                    event_location_timer.time(),
+                )
+
+        # Otherwise, we solve for a dense window in the interval
         # where the event was triggered, then find the precise location of the event
         # Solve again with a more dense idx_window, starting from the start of the
         # window where the event was triggered
@@ -466,6 +527,35 @@ class CasadiSolver(pybamm.BaseSolver):
             t_event = coarse_solution.t[event_idx_lower + 1]
             y_event = coarse_solution.y[:, event_idx_lower + 1].full().flatten()
 
+        return self._truncate_at_event(
+            coarse_solution,
+            event_idx_lower,
+            t_event,
+            y_event,
+            closest_event_idx,
+            coarse_solution.integration_time + dense_step_sol.integration_time,
+            dense_step_sol._statistics,
+            event_location_timer.time(),
+        )
+
+    def _truncate_at_event(
+        self,
+        coarse_solution,
+        event_idx_lower,
+        t_event,
+        y_event,
+        closest_event_idx,
+        integration_time,
+        event_location_statistics,
+        event_location_time,
+    ):
+        """
+        Return the solution truncated at the first coarse time before the event, with
+        the event time and state as its final point, and the statistics of both the
+        coarse solution and the event location.
+        """
+        model = coarse_solution.all_models[-1]
+        inputs_dict = coarse_solution.all_inputs[-1]
         # Return solution truncated at the first coarse event time
         # Also assign t_event
         t_sol = coarse_solution.t[: event_idx_lower + 1]
@@ -480,14 +570,175 @@ class CasadiSolver(pybamm.BaseSolver):
             "event",
             all_sensitivities=False,
         )
-        solution.integration_time = (
-            coarse_solution.integration_time + dense_step_sol.integration_time
-        )
+        solution.integration_time = integration_time
+        solution._statistics = coarse_solution._statistics + event_location_statistics
+        solution._statistics.add(event_location_time=event_location_time)
 
         solution.closest_event_idx = closest_event_idx
 
         return solution
 
+    def _locate_event(self, coarse_solution, event_idx_lower, max_iterations=10):
+        """
+        Locate the first event crossed between two consecutive times of a solution,
+        without creating a new integrator (see the "interpolation" option of
+        `event_location`).
+
+        Each iteration finds the earliest root of the crossed events on a cubic
+        Hermite interpolant of the differential states (using the time derivatives at
+        both ends of the interval) and a linear interpolant of the algebraic states,
+        integrates from the start of the interval up to that time, and replaces the
+        end of the interval on the same side of the event by the new time. This stops
+        when two successive estimates of the event time agree.
+
+        Returns
+        -------
+        t_event : float
+            The time of the event
+        y_event : :class:`numpy.ndarray`
+            The state at the event
+        closest_event_idx : int
+            The index of the event in `model.terminate_events_eval`
+        integration_time : float
+            The time spent integrating
+        statistics : :class:`pybamm.SolverStatistics`
+            The statistics of the integrator calls
+        """
+        model = coarse_solution.all_models[-1]
+        inputs_dict = coarse_solution.all_inputs[-1]
+        inputs = casadi.vertcat(*[x for x in inputs_dict.values()])
+
+        def event_values(t, y):
+            # as in `find_t_event`, 1e-5 is taken away for events that sit on zero
+            return (
+                np.concatenate(
+                    [
+                        np.ravel(np.asarray(event(t, y, inputs), dtype=float))
+                        for event in model.terminate_events_eval
+                    ]
+                )
+                - 1e-5
+            )
+
+        state_derivative = self._get_state_derivative(model, inputs.shape[0])
+
+        def rhs(t, y):
+            return state_derivative(t, y, inputs).full().ravel()
+
+        def state(y):
+            return (y.full() if isinstance(y, casadi.DM) else np.asarray(y)).ravel()
+
+        t_a = coarse_solution.t[event_idx_lower]
+        t_b = coarse_solution.t[event_idx_lower + 1]
+        y_a = state(coarse_solution.y[:, event_idx_lower])
+        y_b = state(coarse_solution.y[:, event_idx_lower + 1])
+        crossed = np.where(~(event_values(t_b, y_b) > 0))[0]
+        if len(crossed) == 0:
+            raise pybamm.SolverError("no event is crossed in the interval")
+        f_a = rhs(t_a, y_a)
+        f_b = rhs(t_b, y_b)
+
+        # the integrator without grid is only created once for each model
+        self.create_integrator(model, inputs)
+
+        integration_time = 0
+        statistics = pybamm.SolverStatistics()
+        t_event = None
+        # The change between two estimates bounds the error of the first one. The
+        # second one is interpolated from a state integrated within that distance of
+        # the event, so is much more accurate
+        t_tol = 1e-3 * (t_b - t_a)
+        for _ in range(max_iterations):
+            h = t_b - t_a
+
+            def interpolant(t, t_a=t_a, y_a=y_a, f_a=f_a, y_b=y_b, f_b=f_b, h=h):
+                s = (t - t_a) / h
+                return (
+                    (2 * s**3 - 3 * s**2 + 1) * y_a
+                    + (s**3 - 2 * s**2 + s) * h * f_a
+                    + (-2 * s**3 + 3 * s**2) * y_b
+                    + (s**3 - s**2) * h * f_b
+                )
+
+            # earliest root of the crossed events on the interpolant
+            t_roots = []
+            for i in crossed:
+                try:
+                    t_roots.append(
+                        brentq(
+                            lambda t, i=i: event_values(t, interpolant(t))[i],
+                            t_a,
+                            t_b,
+                        )
+                    )
+                except ValueError:
+                    t_roots.append(np.nan)
+            if np.all(np.isnan(t_roots)):
+                raise pybamm.SolverError("no root of the events on the interpolant")
+            t_previous = t_event
+            t_event = np.nanmin(t_roots)
+            closest_event_idx = crossed[np.nanargmin(t_roots)]
+
+            # integrate up to the estimated event time
+            sol = self._run_integrator(
+                model,
+                casadi.DM(y_a),
+                inputs_dict,
+                inputs,
+                np.array([t_a, t_event]),
+                use_grid=False,
+                extract_sensitivities_in_solution=False,
+            )
+            integration_time += sol.integration_time
+            statistics += sol._statistics
+            y_event = state(sol.all_ys[-1][:, -1])
+
+            if t_previous is not None and abs(t_event - t_previous) <= t_tol:
+                break
+
+            # reduce the interval
+            if np.all(event_values(t_event, y_event)[crossed] > 0):
+                t_a, y_a, f_a = t_event, y_event, rhs(t_event, y_event)
+            else:
+                t_b, y_b, f_b = t_event, y_event, rhs(t_event, y_event)
+
+        return t_event, y_event, closest_event_idx, integration_time, statistics
+
+    def _get_state_derivative(self, model, len_inputs):
+        """
+        Create a casadi function that returns the time derivative of all the states of
+        a model, or reuse the one created for the same model. The derivative of the
+        algebraic states z is found by differentiating the algebraic equations
+        g(t, x, z) = 0 in time, i.e. by solving g_z dz/dt = -(g_x dx/dt + g_t).
+        """
+        try:
+            casadi_rhs, state_derivative = self._state_derivatives[model]
+        except KeyError:
+            pass
+        else:
+            # the model's casadi functions change if it is set up again
+            if casadi_rhs is model.casadi_rhs:
+                return state_derivative
+
+        len_rhs = model.len_rhs
+        t = casadi.MX.sym("t")
+        y = casadi.MX.sym("y", model.len_rhs_and_alg)
+        p = casadi.MX.sym("p", len_inputs)
+        dxdt = model.casadi_rhs(t, y, p)
+        if model.len_alg == 0:
+            dydt = dxdt
+        else:
+            alg = model.casadi_algebraic(t, y, p)
+            jac = casadi.jacobian(alg, y)
+            dzdt = -casadi.solve(
+                jac[:, len_rhs:],
+                casadi.mtimes(jac[:, :len_rhs], dxdt) + casadi.jacobian(alg, t),
+            )
+            dydt = casadi.vertcat(dxdt, dzdt)
+        state_derivative = casadi.Function("state_derivative", [t, y, p], [dydt])
+        self._state_derivatives[model] = (model.casadi_rhs, state_derivative)
+        return state_derivative
+
     def create_integrator(self, model, inputs, t_eval=None, use_event_switch=False):
         """
         Method to create a casadi integrator object.
@@ -501,16 +752,23 @@ class CasadiSolver(pybamm.BaseSolver):
         if use_grid is True:
             t_eval_shifted = t_eval - t_eval[0]
             t_eval_shifted_rounded = np.round(t_eval_shifted, decimals=12).tobytes()
-        # Only set up problem once
-        if model in self.integrators:
+        # Only set up problem once (a problem without grid may have to be set up for a
+        # model that already has integrators with a grid, and vice versa)
+        if model in self.integrators and (
+            "no grid" in self.integrators[model]
+            if use_grid is False
+            else model in self.integrator_specs
+        ):
             # If we're not using the grid, we don't need to change the integrator
             if use_grid is False:
+                self._integrator_stats["hits"] += 1
                 return self.integrators[model]["no grid"]
             # Otherwise, create new integrator with an updated grid
             # We don't need to update the grid if reusing the same t_eval
             # (up to a shift by a constant)
             else:
                 if t_eval_shifted_rounded in self.integrators[model]:
+                    self._integrator_stats["hits"] += 1
                     return self.integrators[model][t_eval_shifted_rounded]
                 else:
                     method, problem, options, time_args = self.integrator_specs[model]
@@ -518,7 +776,7 @@ class CasadiSolver(pybamm.BaseSolver):
                     integrator = casadi.integrator(
                         "F", method, problem, *time_args, options
                     )
-                    self.integrators[model][t_eval_shifted_rounded] = integrator
+                    self._store_integrator(model, t_eval_shifted_rounded, integrator)
                     return integrator
         else:
             rhs = model.casadi_rhs
@@ -584,14 +842,108 @@ class CasadiSolver(pybamm.BaseSolver):
                     }
                 )
             integrator = casadi.integrator("F", method, problem, *time_args, options)
-            self.integrator_specs[model] = method, problem, options, time_args
             if use_grid is False:
-                self.integrators[model] = {"no grid": integrator}
+                key = "no grid"
             else:
-                self.integrators[model] = {t_eval_shifted_rounded: integrator}
+                # only the problem with a grid is reused, to create integrators with
+                # a different grid
+                self.integrator_specs[model] = method, problem, options, time_args
+                key = t_eval_shifted_rounded
+            self._store_integrator(model, key, integrator)
 
             return integrator
 
+    @property
+    def integrator_stats(self):
+        """
+        Statistics of the integrators retained by the solver, as a dictionary with
+        the number of integrators that were reused ("hits"), created ("misses") and
+        ejected ("evictions"), the number of "models" and "integrators" currently
+        retained, and the estimated memory of these integrators in bytes ("nbytes").
+        """
+        return {
+            **self._integrator_stats,
+            "models": len(self.integrators),
+            "integrators": self._integrator_count(),
+            "nbytes": self.integrators.nbytes,
+        }
+
+    def _integrator_count(self):
+        return sum(len(integrators) for integrators in self.integrators.values())
+
+    def _integrators_nbytes(self, model, count):
+        """
+        Estimate the memory used by `count` integrators of a model. Each integrator
+        holds its own copy of the model's CasADi functions, and the first one also
+        holds their Jacobian and the solver memory, which take about 8 times as much
+        (measured for SPM and DFN models with different meshes). The size of the
+        functions is estimated by the size of their serialization.
+        """
+        try:
+            functions_nbytes = self._functions_nbytes[model]
+        except KeyError:
+            functions_nbytes = sum(
+                len(function.serialize())
+                for function in [model.casadi_rhs, model.casadi_algebraic]
+                if isinstance(function, casadi.Function)
+            )
+            self._functions_nbytes[model] = functions_nbytes
+        return functions_nbytes * (8 + count)
+
+    def _store_integrator(self, model, key, integrator):
+        """
+        Retain an integrator of a model, and eject the least recently used
+        integrators if the solver is over its count or memory budget.
+        """
+        self._integrator_stats["misses"] += 1
+        count_before = self._integrator_count()
+        if model in self.integrators:
+            integrators = self.integrators[model]
+            integrators[key] = integrator
+        else:
+            integrators = LRUDict()
+            integrators[key] = integrator
+            self.integrators[model] = integrators
+        self.integrators.set_nbytes(
+            model, self._integrators_nbytes(model, len(integrators))
+        )
+        # if this model alone is over the memory budget, eject its own least
+        # recently used integrators
+        maxbytes = self.integrators.maxbytes
+        while maxbytes and self.integrators.nbytes > maxbytes and len(integrators) > 1:
+            integrators.popitem(last=False)
+            self.integrators.set_nbytes(
+                model, self._integrators_nbytes(model, len(integrators))
+            )
+        self._integrator_stats["evictions"] += (
+            count_before + 1 - self._integrator_count()
+        )
+
+        # forget the problems of the models whose integrators were all ejected
+        for cache in [
+            self.integrator_specs,
+            self._state_derivatives,
+            self._functions_nbytes,
+        ]:
+            for other_model in list(cache.keys()):
+                if other_model not in self.integrators:
+                    cache.pop(other_model)
+
+    @staticmethod
+    def _integrator_statistics(integrator):
+        """
+        Return the statistics of the last call of a casadi integrator as keyword
+        arguments of :class:`pybamm.SolverStatistics`.
+        """
+        stats = integrator.stats()
+        return {
+            "n_steps": stats.get("nsteps"),
+            "n_rhs_evaluations": stats.get("nfevals"),
+            "n_jacobian_evaluations": stats.get("n_call_jacF"),
+            "n_nonlinear_iterations": stats.get("nniters"),
+            "n_error_test_failures": stats.get("netfails"),
+        }
+
     def _run_integrator(
         self,
         model,
@@ -684,6 +1036,7 @@ class CasadiSolver(pybamm.BaseSolver):
                 raise pybamm.SolverError(error.args[0]) from error
             pybamm.logger.debug("Finished casadi integrator")
             integration_time = timer.time()
+            statistics = self._integrator_statistics(integrator)
             # Manually add initial conditions and concatenate
             x_sol = casadi.horzcat(y0_diff, casadi_sol["xf"])
             if len_alg > 0:
@@ -700,9 +1053,12 @@ class CasadiSolver(pybamm.BaseSolver):
                 check_solution=False,
             )
             sol.integration_time = integration_time
+            sol._statistics.add(**statistics)
             return sol
         else:
             # Repeated calls to the integrator
+            statistics = pybamm.SolverStatistics()
+            integration_time = 0
             x = y0_diff
             z = y0_alg_exact
             y_diff = x
@@ -720,7 +1076,8 @@ class CasadiSolver(pybamm.BaseSolver):
                     # If it doesn't work raise error
                     pybamm.logger.debug(f"Casadi integrator failed with error {error}")
                     raise pybamm.SolverError(error.args[0]) from error
-                integration_time = timer.time()
+                integration_time += timer.time()
+                statistics.add(**self._integrator_statistics(integrator))
                 x = casadi_sol["xf"]
                 z = casadi_sol["zf"]
                 y_diff = casadi.horzcat(y_diff, x)
@@ -740,4 +1097,5 @@ class CasadiSolver(pybamm.BaseSolver):
                 check_solution=False,
             )
             sol.integration_time = integration_time
+            sol._statistics = statistics
             return sol
@@ -0,0 +1,363 @@
+#
+# Models compiled ahead of time into shared libraries
+#
+from __future__ import annotations
+
+import json
+import os
+import shlex
+import subprocess
+from pathlib import Path
+
+import casadi
+import numpy as np
+import scipy.sparse.linalg
+import pybammsolvers.idaklu as idaklu
+
+import pybamm
+
+
+class CompiledSolution:
+    """
+    The solution of a :class:`pybamm.CompiledModel`. Since a compiled model does not
+    keep the symbolic model, this holds the raw arrays returned by the solver rather
+    than a full :class:`pybamm.Solution`.
+
+    Parameters
+    ----------
+    t : :class:`numpy.ndarray`
+        The times of the solution
+    y : :class:`numpy.ndarray` or None
+        The states of the solution, with time along the last axis. None if the model
+        was compiled with output variables.
+    variables : dict
+        The data of the output variables, with time along the last axis
+    sensitivities : dict
+        The sensitivities of the states (or of the output variables, keyed by the
+        name of the variable) with respect to each input parameter
+    termination : str
+        The reason for termination
+    inputs : dict
+        The input parameters used to solve the model
+    """
+
+    def __init__(self, t, y, variables, sensitivities, termination, inputs):
+        self.t = t
+        self.y = y
+        self.variables = variables
+        self.sensitivities = sensitivities
+        self.termination = termination
+        self.inputs = inputs
+
+    def __getitem__(self, key):
+        try:
+            return self.variables[key]
+        except KeyError as error:
+            raise KeyError(
+                f"'{key}' is not an output variable of the compiled model"
+            ) from error
+
+
+class CompiledModel:
+    """
+    A model compiled ahead of time by :meth:`pybamm.IDAKLUSolver.compile`. The
+    functions used by the solver are loaded from a shared library, so the model can
+    be solved with the IDAKLU solver without building, discretising or setting up
+    the symbolic model.
+
+    Parameters
+    ----------
+    directory : str or :class:`pathlib.Path`
+        The directory containing the compiled model
+    """
+
+    library_name = "model.so"
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        with open(self.directory / "metadata.json") as f:
+            self._metadata = json.load(f)
+        library = str(self.directory / self.library_name)
+        self._functions = {
+            key: casadi.external(name, library)
+            for key, name in self._metadata["functions"].items()
+        }
+        self._solver = None
+
+    @classmethod
+    def generate(cls, directory, functions, metadata, compiler=None, flags=None):
+        """
+        Generate C code for a set of casadi functions, compile it into a shared
+        library and write the metadata of the model. This is called by
+        :meth:`pybamm.IDAKLUSolver.compile`.
+
+        Parameters
+        ----------
+        directory : str or :class:`pathlib.Path`
+            The directory in which to write the compiled model
+        functions : dict
+            The casadi functions to compile
+        metadata : dict
+            Information needed to create the solver for the model
+        compiler : str, optional
+            The C compiler to use. Defaults to the ``CC`` environment variable, or
+            ``cc`` if it is not set.
+        flags : list of str, optional
+            Flags passed to the compiler. Default is ``["-O2"]``.
+
+        Returns
+        -------
+        :class:`pybamm.CompiledModel`
+            The compiled model
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # the functions call other functions (e.g. "rhs_algebraic" is also the name
+        # of the function inside the residuals), so the exported functions are
+        # renamed to avoid clashes
+        names = {}
+        generator = casadi.CodeGenerator("model.c", {"with_header": False})
+        for key, function in functions.items():
+            names[key] = f"pybamm_compiled_{key}"
+            args = function.mx_in()
+            generator.add(
+                casadi.Function(
+                    names[key],
+                    args,
+                    function.call(args),
+                    function.name_in(),
+                    function.name_out(),
+                )
+            )
+        generator.generate(str(directory) + os.sep)
+
+        compiler = compiler or os.environ.get("CC", "cc")
+        flags = ["-O2"] if flags is None else flags
+        command = [
+            *shlex.split(compiler),
+            "-shared",
+            "-fPIC",
+            *flags,
+            str(directory / "model.c"),
+            "-o",
+            str(directory / cls.library_name),
+            "-lm",
+        ]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise pybamm.SolverError(f"Failed to compile model:\n{result.stderr}")
+
+        with open(directory / "metadata.json", "w") as f:
+            json.dump({**metadata, "functions": names}, f, indent=2)
+
+        return cls(directory)
+
+    @property
+    def name(self):
+        return self._metadata["name"]
+
+    @property
+    def input_names(self):
+        """The names of the input parameters of the model"""
+        return list(self._metadata["inputs"])
+
+    @property
+    def output_variables(self):
+        """The names of the output variables of the model"""
+        return list(self._metadata["output_variables"])
+
+    @property
+    def sensitivity_names(self):
+        """The input parameters for which sensitivities are computed"""
+        return self._metadata["sensitivity_names"]
+
+    def _idaklu_function(self, key):
+        return idaklu.generate_function(self._functions[key].serialize())
+
+    def _create_solver(self):
+        metadata = self._metadata
+        n_vars = len(metadata["output_variables"])
+        if self.sensitivity_names:
+            sens = self._idaklu_function("sensfn")
+            dvar_dy_fcns = [
+                self._idaklu_function(f"dvar_dy_{i}") for i in range(n_vars)
+            ]
+            dvar_dp_fcns = [
+                self._idaklu_function(f"dvar_dp_{i}") for i in range(n_vars)
+            ]
+        else:
+            sens = idaklu.generate_function(
+                casadi.Function("sensfn", [], []).serialize()
+            )
+            dvar_dy_fcns = []
+            dvar_dp_fcns = []
+
+        return idaklu.create_casadi_solver_group(
+            number_of_states=metadata["number_of_states"],
+            number_of_parameters=len(self.sensitivity_names),
+            rhs_alg=self._idaklu_function("rhs_algebraic"),
+            jac_times_cjmass=self._idaklu_function("jac_times_cjmass"),
+            jac_times_cjmass_colptrs=np.array(
+                metadata["jac_times_cjmass_colptrs"], dtype=np.int64
+            ),
+            jac_times_cjmass_rowvals=np.array(
+                metadata["jac_times_cjmass_rowvals"], dtype=np.int64
+            ),
+            jac_times_cjmass_nnz=metadata["jac_times_cjmass_nnz"],
+            jac_bandwidth_lower=metadata["jac_bandwidth_lower"],
+            jac_bandwidth_upper=metadata["jac_bandwidth_upper"],
+            jac_action=self._idaklu_function("jac_rhs_algebraic_action"),
+            mass_action=self._idaklu_function("mass_action"),
+            sens=sens,
+            events=self._idaklu_function("rootfn"),
+            number_of_events=len(metadata["event_names"]),
+            rhs_alg_id=np.array(metadata["ids"]),
+            atol=np.array(metadata["atol"]),
+            rtol=metadata["rtol"],
+            inputs=sum(metadata["inputs"].values()),
+            var_fcns=[self._idaklu_function(f"var_{i}") for i in range(n_vars)],
+            dvar_dy_fcns=dvar_dy_fcns,
+            dvar_dp_fcns=dvar_dp_fcns,
+            options=metadata["options"],
+        )
+
+    def _stack_inputs(self, inputs):
+        arrays = []
+        for name, size in self._metadata["inputs"].items():
+            if name not in inputs:
+                raise pybamm.SolverError(f"No value provided for input '{name}'")
+            value = np.asarray(inputs[name], dtype=float).reshape(-1)
+            if value.size != size:
+                raise pybamm.SolverError(
+                    f"Input '{name}' should have size {size}, not {value.size}"
+                )
+            arrays.append(value)
+        return np.concatenate(arrays) if arrays else np.array([])
+
+    def _consistent_algebraic_states(self, t0, y0, p, max_iterations=100):
+        """
+        Solve for the algebraic states with the differential states fixed, using
+        Newton's method with the compiled Jacobian
+        """
+        len_rhs = int(np.sum(self._metadata["ids"]))
+        if len_rhs == y0.size:
+            return y0
+        y0 = y0.copy()
+        for _ in range(max_iterations):
+            residuals = self._functions["rhs_algebraic"](t0, y0, p).full().flatten()
+            residuals = residuals[len_rhs:]
+            if np.max(np.abs(residuals)) < self._metadata["root_tol"]:
+                return y0
+            # with cj = 0, this is the Jacobian of the residuals
+            jac = self._functions["jac_times_cjmass"](t0, y0, p, 0).sparse()
+            y0[len_rhs:] -= scipy.sparse.linalg.spsolve(
+                jac[len_rhs:, len_rhs:].tocsc(), residuals
+            )
+        raise pybamm.SolverError(
+            "Could not find consistent states for the algebraic variables"
+        )
+
+    def _initial_conditions(self, t0, p):
+        """Initial states and their time derivatives, including sensitivities"""
+        initial_conditions = self._functions["initial_conditions"]
+        y_zero = np.zeros(initial_conditions.size1_in(1))
+        y0 = initial_conditions(t0, y_zero, p).full().flatten()
+        y0 = self._consistent_algebraic_states(t0, y0, p)
+        ydot0 = self._functions["ydot0"](t0, y0, p).full().flatten()
+        if not self.sensitivity_names:
+            return y0, ydot0
+        y0S = self._functions["initial_conditions_sensitivities"](t0, y_zero, p)
+        if isinstance(y0S, casadi.DM):
+            y0S = (y0S,)
+        y0S = [x.full().flatten() for x in y0S]
+        y0full = np.concatenate([y0, *y0S])
+        ydot0full = np.concatenate([ydot0, *[np.zeros_like(x) for x in y0S]])
+        return y0full, ydot0full
+
+    def solve(self, t_eval, inputs=None, t_interp=None):
+        """
+        Solve the compiled model.
+
+        Parameters
+        ----------
+        t_eval : list or :class:`numpy.ndarray`
+            The start and end times of the integration (in seconds)
+        inputs : dict or list of dict, optional
+            The values of the input parameters. If a list is given, the model is
+            solved for each set of inputs, in parallel if the model was compiled with
+            the ``num_solvers`` option greater than 1.
+        t_interp : list or :class:`numpy.ndarray`, optional
+            The times (in seconds) at which to interpolate the solution. Defaults to
+            None, which returns the adaptive time-stepping times.
+
+        Returns
+        -------
+        :class:`pybamm.CompiledSolution` or list of :class:`pybamm.CompiledSolution`
+            The solution, or a list of solutions if a list of inputs was given
+        """
+        if self._solver is None:
+            self._solver = self._create_solver()
+
+        inputs_list = inputs if isinstance(inputs, list) else [inputs or {}]
+        t_eval = np.asarray(t_eval, dtype=float)
+        t_interp = np.empty(0) if t_interp is None else np.asarray(t_interp, float)
+
+        ps = [self._stack_inputs(inputs_dict) for inputs_dict in inputs_list]
+        initial_conditions = [self._initial_conditions(t_eval[0], p) for p in ps]
+        y0full = np.vstack([y0 for y0, _ in initial_conditions])
+        ydot0full = np.vstack([ydot0 for _, ydot0 in initial_conditions])
+        stacked_inputs = np.vstack(ps) if ps[0].size > 0 else np.array([[]])
+
+        solns = self._solver.solve(t_eval, t_interp, y0full, ydot0full, stacked_inputs)
+        solutions = [
+            self._post_process_solution(soln, p, inputs_dict)
+            for soln, p, inputs_dict in zip(solns, ps, inputs_list)
+        ]
+        return solutions if isinstance(inputs, list) else solutions[0]
+
+    def _post_process_solution(self, sol, p, inputs_dict):
+        n_t = sol.t.size
+        output_variables = self._metadata["output_variables"]
+        if sol.flag == 2:
+            # find the event closest to zero at the final state (the final state is
+            # only returned separately when output variables are returned)
+            if output_variables:
+                y_term = sol.y_term[: self._metadata["number_of_states"]]
+            else:
+                y_term = sol.y.reshape((n_t, -1))[-1]
+            events = self._functions["rootfn"](sol.t[-1], y_term, p)
+            event = self._metadata["event_names"][int(np.argmin(np.abs(events)))]
+            termination = f"event: {event}"
+        elif sol.flag >= 0:
+            termination = "final time"
+        else:
+            raise pybamm.SolverError(
+                f"FAILURE {pybamm.IDAKLUSolver._solver_flag(sol.flag)}"
+            )
+
+        variables = {}
+        sensitivities = {}
+        if output_variables:
+            y = None
+            data = sol.y.reshape((n_t, -1))
+            start = 0
+            for var, size in output_variables.items():
+                variables[var] = data[:, start : start + size].T
+                if self.sensitivity_names:
+                    sensitivities[var] = {
+                        name: sol.yS[:, start : start + size, k].T
+                        for k, name in enumerate(self.sensitivity_names)
+                    }
+                start += size
+        else:
+            y = sol.y.reshape((n_t, -1)).T
+            # yS is (n_p, n_t, n_y)
+            sensitivities = {
+                name: sol.yS[k].reshape((n_t, -1)).T
+                for k, name in enumerate(self.sensitivity_names)
+            }
+
+        return CompiledSolution(
+            sol.t, y, variables, sensitivities, termination, inputs_dict
+        )
@@ -0,0 +1,116 @@
+#
+# Cache of consistent algebraic states, used to warm-start consistent initialisation
+#
+import numpy as np
+
+from .lrudict import LRUDict
+
+
+class ConsistentStateCache:
+    """
+    A cache of the consistent algebraic states found by a solver, used to warm-start
+    the root-finding that makes the initial conditions of a DAE model consistent.
+
+    Before calculating a consistent state, the solver looks for a cached state of the
+    same model, with the same input parameters, whose differential states are close
+    to the current ones (only the differential states that the algebraic equations
+    depend on are compared, when these are known). If there is one, its algebraic
+    states are used as the initial guess for the root-finding instead of the
+    algebraic states of the current initial conditions. In an experiment each step
+    type has its own model, so each step is seeded from the consistent state found at
+    the start of the last step of the same type, which is usually much closer than
+    the state at the end of the previous step (e.g. the potentials change abruptly
+    when the current changes).
+    The root-finding is still carried out, so the cache only changes the number of
+    iterations, not the result.
+
+    Parameters
+    ----------
+    tol : float, optional
+        The relative tolerance, in the 2-norm, on the differential states for a cached
+        state to be used as the initial guess (default is 1e-2).
+    maxsize : int, optional
+        The maximum number of states that are kept. The least recently used states
+        are discarded first (default is 64).
+
+    Examples
+    --------
+    >>> solver = pybamm.IDAKLUSolver()
+    >>> solver.consistent_state_cache = pybamm.ConsistentStateCache(tol=1e-3)
+    """
+
+    def __init__(self, tol=1e-2, maxsize=64):
+        self.tol = tol
+        self.maxsize = maxsize
+        self._states = LRUDict(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._states)
+
+    def clear(self):
+        """Remove all the cached states and reset the hit and miss counters."""
+        self._states.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _inputs_key(inputs):
+        return tuple(
+            (name, np.asarray(value, dtype=float).tobytes())
+            for name, value in sorted((inputs or {}).items())
+        )
+
+    def lookup(self, model, y_diff, inputs=None):
+        """
+        Find the algebraic states of the closest cached consistent state.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model whose consistent state is being calculated
+        y_diff : :class:`numpy.ndarray`
+            The differential states of the current initial conditions
+        inputs : dict, optional
+            Any input parameters of the model
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or None
+            The cached algebraic states, or None if no cached state is close enough
+        """
+        inputs_key = self._inputs_key(inputs)
+        max_distance = self.tol * np.linalg.norm(y_diff)
+        best_key = None
+        for key, (cached_y_diff, _) in self._states.items():
+            if key[0] is not model or key[1] != inputs_key:
+                continue
+            distance = np.linalg.norm(y_diff - cached_y_diff)
+            if distance <= max_distance:
+                best_key = key
+                max_distance = distance
+        if best_key is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._states[best_key][1]
+
+    def store(self, model, y_diff, y_alg, inputs=None):
+        """
+        Add a consistent state to the cache.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model the state belongs to
+        y_diff : :class:`numpy.ndarray`
+            The differential states
+        y_alg : :class:`numpy.ndarray`
+            The consistent algebraic states
+        inputs : dict, optional
+            Any input parameters of the model
+        """
+        y_diff = np.array(y_diff, dtype=float)
+        key = (model, self._inputs_key(inputs), y_diff.tobytes())
+        self._states[key] = (y_diff, np.array(y_alg, dtype=float))
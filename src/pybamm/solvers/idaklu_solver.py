@@ -11,16 +11,6 @@ import pybammsolvers.idaklu as idaklu
 import warnings
 
 
-if pybamm.has_jax():
-    import jax
-    from jax import numpy as jnp
-
-    try:
-        import iree.compiler
-    except ImportError:  # pragma: no cover
-        pass
-
-
 def has_iree():
     try:
         import iree.compiler  # noqa: F401
@@ -435,7 +425,17 @@ class IDAKLUSolver(pybamm.BaseSolver):
 
         rtol = self.rtol
 
+        casadi_fcns = None
         if model.convert_to_format == "casadi":
+            # keep the casadi functions so that they can be compiled (see `compile`)
+            casadi_fcns = {
+                "rhs_algebraic": rhs_algebraic,
+                "jac_times_cjmass": jac_times_cjmass,
+                "jac_rhs_algebraic_action": jac_rhs_algebraic_action,
+                "mass_action": mass_action,
+                "sensfn": sensfn,
+                "rootfn": rootfn,
+            }
             # Serialize casadi functions
             idaklu_solver_fcn = idaklu.create_casadi_solver_group
             rhs_algebraic = idaklu.generate_function(rhs_algebraic.serialize())
@@ -450,6 +450,10 @@ class IDAKLUSolver(pybamm.BaseSolver):
             model.convert_to_format == "jax"
             and self._options["jax_evaluator"] == "iree"
         ):
+            # jax and iree are slow to import, so are only imported when needed
+            import iree.compiler
+            from jax import numpy as jnp
+
             # Convert Jax functions to MLIR (also, demote to single precision)
             idaklu_solver_fcn = idaklu.create_iree_solver_group
             pybamm.demote_expressions_to_32bit = True
@@ -638,6 +642,8 @@ class IDAKLUSolver(pybamm.BaseSolver):
             "var_idaklu_fcns": self.var_idaklu_fcns,
             "dvar_dy_idaklu_fcns": self.dvar_dy_idaklu_fcns,
             "dvar_dp_idaklu_fcns": self.dvar_dp_idaklu_fcns,
+            "casadi_fcns": casadi_fcns,  # dict
+            "atol": atol,  # array
         }
 
         solver = self._setup["solver_function"](
@@ -670,6 +676,9 @@ class IDAKLUSolver(pybamm.BaseSolver):
         return base_set_up_return
 
     def _make_iree_function(self, fcn, *args, sparse_index=False):
+        import jax
+        import jax.flatten_util
+
         # Initialise IREE function object
         iree_fcn = idaklu.IREEBaseFunctionType()
         # Get sparsity pattern index outputs as needed
@@ -786,10 +795,17 @@ class IDAKLUSolver(pybamm.BaseSolver):
         )
         integration_time = timer.time()
 
-        return [
-            self._post_process_solution(soln, model, integration_time, inputs_dict)
-            for soln, inputs_dict in zip(solns, inputs_list)
-        ]
+        solutions = []
+        for soln, inputs_dict in zip(solns, inputs_list):
+            timer.reset()
+            solution = self._post_process_solution(
+                soln, model, integration_time, inputs_dict
+            )
+            # the counters of the IDAS solver are only printed (see the
+            # "print_stats" option), so only the times are known
+            solution._statistics.add(post_processing_time=timer.time())
+            solutions.append(solution)
+        return solutions
 
     def _post_process_solution(self, sol, model, integration_time, inputs_dict):
         number_of_sensitivity_parameters = self._setup[
@@ -1080,6 +1096,144 @@ class IDAKLUSolver(pybamm.BaseSolver):
         )
         return obj
 
+    def compile(
+        self,
+        model,
+        directory,
+        inputs=None,
+        calculate_sensitivities=False,
+        compiler=None,
+        compiler_flags=None,
+    ):
+        """
+        Compile a discretised model ahead of time. C code is generated for all of the
+        functions used by the solver (residuals, Jacobian, events, initial conditions
+        and output variables) and built into a shared library, which can be loaded
+        with :class:`pybamm.CompiledModel` and solved without building, discretising
+        or setting up the model again, e.g. in another process.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The discretised model to compile. The model must have
+            ``convert_to_format = "casadi"``, and must not have any discontinuity
+            events.
+        directory : str or :class:`pathlib.Path`
+            The directory in which to write the generated code, the shared library and
+            the metadata of the compiled model
+        inputs : dict, optional
+            Example values of the input parameters of the model. The compiled model
+            must be solved with values for the same input parameters, of the same
+            sizes.
+        calculate_sensitivities : list of str or bool, optional
+            The input parameters for which the compiled model computes sensitivities.
+            If True, sensitivities are computed for all input parameters. Default is
+            False.
+        compiler : str, optional
+            The C compiler to use. Defaults to the ``CC`` environment variable, or
+            ``cc`` if it is not set.
+        compiler_flags : list of str, optional
+            Flags passed to the compiler. Default is ``["-O2"]``.
+
+        Returns
+        -------
+        :class:`pybamm.CompiledModel`
+            The compiled model, loaded from ``directory``
+        """
+        if model.convert_to_format != "casadi":
+            raise pybamm.SolverError(
+                "Only models with convert_to_format = 'casadi' can be compiled"
+            )
+        model_inputs = self._set_up_model_inputs(model, inputs)
+        pybamm.BaseSolver._solve_process_calculate_sensitivities_arg(
+            model_inputs, model, calculate_sensitivities
+        )
+        self.set_up(model, model_inputs)
+        self._model_set_up.pop(model, None)
+
+        if model.discontinuity_events_eval:
+            raise pybamm.SolverError(
+                "Models with discontinuity events cannot be compiled"
+            )
+        for var in self.output_variables:
+            if isinstance(model.variables_and_events[var], pybamm.ExplicitTimeIntegral):
+                raise pybamm.SolverError(
+                    f"Output variable '{var}' is an explicit time integral, which "
+                    "cannot be compiled"
+                )
+
+        # time derivatives of the differential states for consistent initialisation
+        # (see `_rhs_dot_consistent_initialization`)
+        casadi_fcns = self._setup["casadi_fcns"]
+        rhs_algebraic = casadi_fcns["rhs_algebraic"]
+        t_casadi = casadi.MX.sym("t")
+        y_casadi = casadi.MX.sym("y", model.len_rhs_and_alg)
+        p_casadi = casadi.MX.sym("p", rhs_algebraic.size1_in(2))
+        ydot0 = casadi.MX.zeros(model.len_alg)
+        if model.len_rhs > 0:
+            rhs0 = rhs_algebraic(t_casadi, y_casadi, p_casadi)[: model.len_rhs]
+            ydot0 = casadi.vertcat(
+                casadi.DM(model.mass_matrix_inv.entries) @ rhs0, ydot0
+            )
+
+        functions = {
+            **casadi_fcns,
+            "initial_conditions": model.initial_conditions_eval,
+            "ydot0": casadi.Function(
+                "ydot0", [t_casadi, y_casadi, p_casadi], [casadi.densify(ydot0)]
+            ),
+        }
+        sensitivities = self._setup["number_of_sensitivity_parameters"] > 0
+        if sensitivities:
+            functions["initial_conditions_sensitivities"] = (
+                model.jacp_initial_conditions_eval
+            )
+        else:
+            # the empty sensitivity function is created when the model is loaded
+            del functions["sensfn"]
+        for i, var in enumerate(self.output_variables):
+            functions[f"var_{i}"] = self.computed_var_fcns[var]
+            if sensitivities:
+                functions[f"dvar_dy_{i}"] = self.computed_dvar_dy_fcns[var]
+                functions[f"dvar_dp_{i}"] = self.computed_dvar_dp_fcns[var]
+
+        metadata = {
+            "name": model.name,
+            "pybamm_version": pybamm.__version__,
+            "number_of_states": int(model.len_rhs_and_alg),
+            "inputs": {
+                name: int(np.size(value)) for name, value in model_inputs.items()
+            },
+            "sensitivity_names": list(self._setup["sensitivity_names"]),
+            "jac_times_cjmass_colptrs": self._setup[
+                "jac_times_cjmass_colptrs"
+            ].tolist(),
+            "jac_times_cjmass_rowvals": self._setup[
+                "jac_times_cjmass_rowvals"
+            ].tolist(),
+            "jac_times_cjmass_nnz": int(self._setup["jac_times_cjmass_nnz"]),
+            "jac_bandwidth_lower": int(self._setup["jac_bandwidth_lower"]),
+            "jac_bandwidth_upper": int(self._setup["jac_bandwidth_upper"]),
+            "ids": self._setup["ids"].tolist(),
+            "event_names": [
+                event.name
+                for event in model.events
+                if event.event_type == pybamm.EventType.TERMINATION
+            ],
+            "atol": self._setup["atol"].tolist(),
+            "rtol": self.rtol,
+            "root_tol": self.root_tol,
+            "options": self._options,
+            "output_variables": {
+                var: self.computed_var_fcns[var].sparsity_out(0).nnz()
+                for var in self.output_variables
+            },
+        }
+
+        return pybamm.CompiledModel.generate(
+            directory, functions, metadata, compiler, compiler_flags
+        )
+
     @staticmethod
     def _solver_flag(flag):
         flags = {
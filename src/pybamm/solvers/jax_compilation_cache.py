@@ -0,0 +1,251 @@
+#
+# Persistent cache of the compiled solves of the JaxSolver
+#
+from __future__ import annotations
+
+import json
+import os
+import warnings
+from pathlib import Path
+
+import numpy as np
+import platformdirs
+
+import pybamm
+
+if pybamm.has_jax():
+    import jax
+
+
+class JaxCompilationCache:
+    """
+    A persistent cache of the functions compiled by :class:`pybamm.JaxSolver`, shared
+    between processes.
+
+    The compiled executables are stored by JAX's persistent compilation cache, which
+    this class points at `cache_dir`. Since JAX identifies its entries by a hash of
+    the lowered program, this class also keeps an index of the solves that have been
+    compiled, keyed on the discretised model equations, the solver method and
+    tolerances and the shape of `t_eval`, together with the JAX entries created when
+    each one was first compiled. This makes it possible to tell whether a solve will
+    be loaded from the cache, and to remove the entries of a given solve.
+
+    The times at which the solution is computed are an argument of the compiled
+    solves, so solves with different values of `t_eval` of the same shape share the
+    same entry.
+
+    Parameters
+    ----------
+    cache_dir : str or :class:`pathlib.Path`, optional
+        The directory in which the compiled functions are stored. Defaults to a "jax"
+        directory inside the user cache directory for PyBaMM.
+    min_compile_time_secs : float, optional
+        The minimum time taken to compile a function for it to be stored (default is
+        0, i.e. all the compiled solves are stored).
+
+    Examples
+    --------
+    >>> cache = pybamm.JaxCompilationCache()  # doctest: +SKIP
+    >>> solver = pybamm.JaxSolver(compilation_cache=cache)  # doctest: +SKIP
+    """
+
+    index_filename = "pybamm_index.json"
+
+    def __init__(self, cache_dir=None, min_compile_time_secs=0):
+        if cache_dir is None:
+            cache_dir = Path(platformdirs.user_cache_dir("pybamm")) / "jax"
+        self.cache_dir = Path(cache_dir)
+        self.min_compile_time_secs = min_compile_time_secs
+        self.hits = 0
+        self.misses = 0
+
+    def enable(self):
+        """
+        Point JAX's persistent compilation cache at the cache directory. This is
+        called when the cache is passed to a :class:`pybamm.JaxSolver`, and must
+        happen before JAX compiles any function for which the cache is used.
+
+        This changes the global JAX configuration of the process (the
+        ``jax_compilation_cache_dir``, ``jax_persistent_cache_min_compile_time_secs``
+        and ``jax_persistent_cache_min_entry_size_bytes`` options), so a warning is
+        raised if the persistent compilation cache is already set to another
+        directory.
+        """
+        if not pybamm.has_jax():  # pragma: no cover
+            raise ModuleNotFoundError(
+                "Jax or jaxlib is not installed, please see https://docs.pybamm.org/en/latest/source/user_guide/installation/gnu-linux-mac.html#optional-jaxsolver"
+            )
+        current_dir = jax.config.jax_compilation_cache_dir
+        if current_dir is not None and Path(current_dir) != self.cache_dir:
+            warnings.warn(
+                f"The JAX persistent compilation cache directory '{current_dir}' "
+                f"is replaced by '{self.cache_dir}'",
+                stacklevel=2,
+            )
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        jax.config.update("jax_compilation_cache_dir", str(self.cache_dir))
+        jax.config.update(
+            "jax_persistent_cache_min_compile_time_secs", self.min_compile_time_secs
+        )
+        jax.config.update("jax_persistent_cache_min_entry_size_bytes", 0)
+
+    def key(self, model, solver, t_eval, batch_size=None):
+        """
+        Compute the cache key for a solve of a model.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The discretised model, set up by the solver
+        solver : :class:`pybamm.JaxSolver`
+            The solver
+        t_eval : :class:`numpy.array`, size (k,)
+            The times at which the solution is computed
+        batch_size : int, optional
+            The (rounded) number of inputs of a batched solve, see
+            :meth:`pybamm.JaxSolver.get_batched_solve`
+
+        Returns
+        -------
+        str
+            A hexadecimal digest identifying the compiled solve
+        """
+        mass_matrix = getattr(model, "mass_matrix", None)
+        model_description = (
+            model.concatenated_rhs,
+            model.concatenated_algebraic,
+            model.concatenated_initial_conditions,
+            None if mass_matrix is None else mass_matrix.entries,
+            np.asarray(model.y0, dtype=float),
+        )
+        return pybamm.ContentHasher().digest(
+            (
+                pybamm.__version__,
+                jax.__version__ if pybamm.has_jax() else None,
+                model_description,
+                solver.method,
+                solver.rtol,
+                solver.atol,
+                solver.extra_options,
+                np.shape(t_eval),
+                batch_size,
+            )
+        )
+
+    def _index_path(self):
+        return self.cache_dir / self.index_filename
+
+    def entries(self):
+        """
+        The solves in the cache.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping the key of each solve to a description of it (the
+            model name, solver method and tolerances, shape of `t_eval` and batch
+            size) and the names of the JAX cache files created when it was compiled.
+        """
+        try:
+            with open(self._index_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_entries(self, entries):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._index_path()
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entries, f, indent=1)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, key):
+        return key in self.entries()
+
+    def __len__(self):
+        return len(self.entries())
+
+    def _files(self):
+        if not self.cache_dir.exists():
+            return set()
+        return {
+            path.name
+            for path in self.cache_dir.iterdir()
+            if path.is_file()
+            and path.name != self.index_filename
+            and not path.name.endswith(".tmp")
+        }
+
+    @property
+    def nbytes(self):
+        """The total size of the compiled functions in the cache, in bytes"""
+        return sum((self.cache_dir / name).stat().st_size for name in self._files())
+
+    def track(self, key, solve, description=None):
+        """
+        Count a cache hit or miss for a compiled solve and, if it is not in the
+        index yet, record the JAX cache entries created by its first call.
+
+        Parameters
+        ----------
+        key : str
+            The cache key, see :meth:`JaxCompilationCache.key`
+        solve : function
+            The jitted solve
+        description : dict, optional
+            A description of the solve, stored in the index
+
+        Returns
+        -------
+        function
+            The solve, wrapped to record its cache entries when first called
+        """
+        if key in self:
+            self.hits += 1
+            return solve
+        self.misses += 1
+        first_call = True
+
+        def tracked_solve(*args):
+            nonlocal first_call
+            if not first_call:
+                return solve(*args)
+            first_call = False
+            files_before = self._files()
+            out = solve(*args)
+            entries = self.entries()
+            entries[key] = {
+                **(description or {}),
+                "files": sorted(self._files() - files_before),
+            }
+            self._write_entries(entries)
+            return out
+
+        return tracked_solve
+
+    def clear(self, key=None):
+        """
+        Remove entries from the cache. Removing all the entries also resets the hit
+        and miss counters.
+
+        Parameters
+        ----------
+        key : str, optional
+            The key of the solve to remove. If None (default), all the entries are
+            removed, including any JAX entries not recorded in the index.
+        """
+        if key is None:
+            names = self._files() | {self.index_filename}
+            for name in names:
+                (self.cache_dir / name).unlink(missing_ok=True)
+            self.hits = 0
+            self.misses = 0
+            return
+        entries = self.entries()
+        entry = entries.pop(key, None)
+        if entry is None:
+            return
+        for name in entry["files"]:
+            (self.cache_dir / name).unlink(missing_ok=True)
+        self._write_entries(entries)
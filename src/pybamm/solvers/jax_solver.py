@@ -44,6 +44,17 @@ class JaxSolver(pybamm.BaseSolver):
         Please consult `JAX documentation
         <https://github.com/jax-ml/jax/blob/master/jax/experimental/ode.py>`_
         for details.
+    vmap_inputs : bool, optional
+        Whether to solve for a list of inputs with a single call of the solve
+        vectorised over the inputs with `jax.vmap` (see :meth:`get_batched_solve`),
+        rather than one call for each set of inputs. If None (default), the
+        vectorised solve is used on GPU and TPU platforms, and separate calls
+        (running concurrently) on CPU.
+    compilation_cache : :class:`pybamm.JaxCompilationCache`, optional
+        A persistent cache of the compiled solves, so that the solves compiled by one
+        process are reused by the others. Passing a cache points JAX's persistent
+        compilation cache, which is global to the process, at its directory (see
+        :meth:`pybamm.JaxCompilationCache.enable`).
     """
 
     def __init__(
@@ -54,6 +65,8 @@ class JaxSolver(pybamm.BaseSolver):
         atol=1e-6,
         extrap_tol=None,
         extra_options=None,
+        vmap_inputs=None,
+        compilation_cache=None,
     ):
         if not pybamm.has_jax():
             raise ModuleNotFoundError(
@@ -70,8 +83,13 @@ class JaxSolver(pybamm.BaseSolver):
             raise ValueError(f"method must be one of {method_options}")
         self._ode_solver = method == "RK45"
         self.extra_options = extra_options or {}
+        self.vmap_inputs = vmap_inputs
+        self.compilation_cache = compilation_cache
+        if compilation_cache is not None:
+            compilation_cache.enable()
         self.name = f"JAX solver ({method})"
         self._cached_solves = dict()
+        self._cached_batched_solves = dict()
         pybamm.citations.register("jax2018")
 
     def get_solve(self, model, t_eval):
@@ -98,7 +116,9 @@ class JaxSolver(pybamm.BaseSolver):
                     "Model is not set up for solving, run`solver.solve(model)` first"
                 )
 
-            self._cached_solves[model] = self.create_solve(model, t_eval)
+            self._cached_solves[model] = self._track_compilation(
+                self.create_solve(model, t_eval), model, t_eval
+            )
 
         return self._cached_solves[model]
 
@@ -151,7 +171,9 @@ class JaxSolver(pybamm.BaseSolver):
                 [model.rhs_eval(t, y, inputs), model.algebraic_eval(t, y, inputs)]
             )
 
-        def solve_model_rk45(inputs):
+        # t_eval is an argument of the compiled function rather than a constant, so
+        # that the compiled function only depends on its shape
+        def solve_model_rk45(t_eval, inputs):
             y = odeint(
                 rhs_ode,
                 y0,
@@ -163,7 +185,7 @@ class JaxSolver(pybamm.BaseSolver):
             )
             return jnp.transpose(y)
 
-        def solve_model_bdf(inputs):
+        def solve_model_bdf(t_eval, inputs):
             y = pybamm.jax_bdf_integrate(
                 rhs_dae,
                 y0,
@@ -177,9 +199,96 @@ class JaxSolver(pybamm.BaseSolver):
             return jnp.transpose(y)
 
         if self.method == "RK45":
-            return jax.jit(solve_model_rk45)
+            solve = jax.jit(solve_model_rk45)
         else:
-            return jax.jit(solve_model_bdf)
+            solve = jax.jit(solve_model_bdf)
+        t_eval = jnp.asarray(t_eval)
+
+        def solve_model(inputs):
+            return solve(t_eval, inputs)
+
+        return solve_model
+
+    def _track_compilation(self, solve, model, t_eval, batch_size=None):
+        """Record a compiled solve of a model in the compilation cache, if any."""
+        if self.compilation_cache is None:
+            return solve
+        key = self.compilation_cache.key(model, self, t_eval, batch_size)
+        description = {
+            "model": model.name,
+            "method": self.method,
+            "rtol": self.rtol,
+            "atol": self.atol,
+            "t_eval_shape": list(onp.shape(t_eval)),
+            "batch_size": batch_size,
+        }
+        return self.compilation_cache.track(key, solve, description)
+
+    def get_batched_solve(self, model, t_eval, batch_size):
+        """
+        Return a compiled JAX function that solves an ode model for a batch of input
+        arguments at once, by vectorising the solve of :meth:`create_solve` over the
+        inputs with `jax.vmap`.
+
+        The function is compiled for a number of inputs rounded up to the next power
+        of two, and cached for each model, `t_eval` and rounded batch size, so that
+        batches of similar sizes reuse the same compiled function.
+
+        Parameters
+        ----------
+        model : :class:`pybamm.BaseModel`
+            The model whose solution to calculate.
+        t_eval : :class:`numpy.array`, size (k,)
+            The times at which to compute the solution
+        batch_size : int
+            The number of sets of inputs to solve for
+
+        Returns
+        -------
+        function
+            A function with signature `f(inputs)`, where inputs is a dict containing
+            the stacked values of the input parameters, with the batch along the first
+            axis, which returns the stacked solutions, with shape
+            (batch, number of states, number of times). The batch size of the inputs
+            must be the rounded batch size (see :meth:`batch_bucket`).
+
+        """
+        if model not in self._model_set_up:
+            raise RuntimeError(
+                "Model is not set up for solving, run`solver.solve(model)` first"
+            )
+        key = (onp.asarray(t_eval).tobytes(), self.batch_bucket(batch_size))
+        batched_solves = self._cached_batched_solves.setdefault(model, {})
+        if key not in batched_solves:
+            batched_solve = jax.jit(jax.vmap(self.create_solve(model, t_eval)))
+            batched_solves[key] = self._track_compilation(
+                batched_solve, model, t_eval, key[1]
+            )
+        return batched_solves[key]
+
+    @staticmethod
+    def batch_bucket(batch_size):
+        """
+        The batch size for which the batched solve of `batch_size` sets of inputs is
+        compiled, i.e. `batch_size` rounded up to the next power of two.
+        """
+        return 1 << (int(batch_size) - 1).bit_length()
+
+    def _solve_batch(self, model, t_eval, inputs):
+        """
+        Solve a model for a list of inputs with the batched solve, padding the
+        batch up to its rounded size by repeating the last inputs.
+        """
+        batch_size = len(inputs)
+        bucket = self.batch_bucket(batch_size)
+        padded_inputs = inputs + [inputs[-1]] * (bucket - batch_size)
+        # convert inputs (array of dict) to a dict of arrays for vmap
+        inputs_v = {
+            key: jnp.stack([jnp.asarray(dic[key]) for dic in padded_inputs])
+            for key in inputs[0]
+        }
+        y = self.get_batched_solve(model, t_eval, batch_size)(inputs_v)
+        return list(y[:batch_size])
 
     @property
     def supports_parallel_solve(self):
@@ -213,12 +322,27 @@ class JaxSolver(pybamm.BaseSolver):
             inputs = [inputs]
         timer = pybamm.Timer()
         if model not in self._cached_solves:
-            self._cached_solves[model] = self.create_solve(model, t_eval)
+            self._cached_solves[model] = self._track_compilation(
+                self.create_solve(model, t_eval), model, t_eval
+            )
 
         y = []
         platform = jax.lib.xla_bridge.get_backend().platform.casefold()
-        if len(inputs) <= 1 or platform.startswith("cpu"):
-            # cpu execution runs faster when multithreaded
+        vmap_inputs = self.vmap_inputs
+        if vmap_inputs is None:
+            # gpu execution runs faster when parallelised with vmap
+            vmap_inputs = (
+                platform.startswith("gpu")
+                or platform.startswith("tpu")
+                or platform.startswith("metal")
+            )
+        if len(inputs) > 1 and inputs[0] and vmap_inputs:
+            # (see also comment below regarding single-program multiple-data
+            #  execution (SPMD) using pmap on multiple XLAs)
+            y = self._solve_batch(model, t_eval, inputs)
+        elif len(inputs) <= 1 or not vmap_inputs or platform.startswith("cpu"):
+            # cpu execution runs faster when multithreaded, and inputs that are not
+            # vmapped are solved concurrently on any platform
             async def solve_model_for_inputs():
                 async def solve_model_async(inputs_v):
                     return self._cached_solves[model](inputs_v)
@@ -229,20 +353,6 @@ class JaxSolver(pybamm.BaseSolver):
                 return await asyncio.gather(*coro)
 
             y = asyncio.run(solve_model_for_inputs())
-        elif (
-            platform.startswith("gpu")
-            or platform.startswith("tpu")
-            or platform.startswith("metal")
-        ):
-            # gpu execution runs faster when parallelised with vmap
-            # (see also comment below regarding single-program multiple-data
-            #  execution (SPMD) using pmap on multiple XLAs)
-
-            # convert inputs (array of dict) to a dict of arrays for vmap
-            inputs_v = {
-                key: jnp.array([dic[key] for dic in inputs]) for key in inputs[0]
-            }
-            y.extend(jax.vmap(self._cached_solves[model])(inputs_v))
         else:
             # Unknown platform, use serial execution as fallback
             print(
@@ -282,6 +392,7 @@ class JaxSolver(pybamm.BaseSolver):
         #         y.extend(jax.pmap(self._cached_solves[model])(inputs_v))
 
         integration_time = timer.time()
+        timer.reset()
 
         # convert to a normal numpy array
         y = onp.array(y)
@@ -305,4 +416,9 @@ class JaxSolver(pybamm.BaseSolver):
             sol.integration_time = integration_time
             solutions.append(sol)
 
+        # the jitted solves only return the states, so only the times are known
+        post_processing_time = timer.time()
+        for sol in solutions:
+            sol._statistics.add(post_processing_time=post_processing_time)
+
         return solutions
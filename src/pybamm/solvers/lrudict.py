@@ -4,18 +4,25 @@ from collections import OrderedDict
 class LRUDict(OrderedDict):
     """LRU extension of a dictionary"""
 
-    def __init__(self, maxsize=None):
-        """maxsize limits the item count based on an LRU strategy
+    def __init__(self, maxsize=None, maxbytes=None):
+        """maxsize limits the item count based on an LRU strategy, and maxbytes
+        limits the total size of the items, as declared with `set_nbytes` (an item
+        counts as 0 bytes until its size is set). The most recently used item is
+        never evicted because of its size.
 
-        The dictionary remains unbound when maxsize = 0 | None
+        The dictionary remains unbound when maxsize = 0 | None and
+        maxbytes = 0 | None
         """
         super().__init__()
         self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.evictions = 0
+        self._item_nbytes = {}
 
     def __setitem__(self, key, value):
         super().__setitem__(key, value)
-        while self.maxsize and self.__len__() > self.maxsize:
-            self.popitem(last=False)
+        self._evict()
 
     def __getitem__(self, key):
         try:
@@ -24,9 +31,43 @@ class LRUDict(OrderedDict):
             pass  # Allow parent to handle exception
         return super().__getitem__(key)
 
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.nbytes -= self._item_nbytes.pop(key, 0)
+
     def get(self, key):
         try:
             self.move_to_end(key, last=True)
         except KeyError:
             pass  # Allow parent to handle exception
         return super().get(key)
+
+    def pop(self, key, *args):
+        value = super().pop(key, *args)
+        self.nbytes -= self._item_nbytes.pop(key, 0)
+        return value
+
+    def popitem(self, last=True):
+        key, value = super().popitem(last=last)
+        self.nbytes -= self._item_nbytes.pop(key, 0)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._item_nbytes.clear()
+        self.nbytes = 0
+
+    def set_nbytes(self, key, nbytes):
+        """Set the size in bytes of an item, mark it as the most recently used and
+        evict the least recently used items if the dictionary is over its budget"""
+        self.move_to_end(key, last=True)
+        self.nbytes += nbytes - self._item_nbytes.get(key, 0)
+        self._item_nbytes[key] = nbytes
+        self._evict()
+
+    def _evict(self):
+        while (self.maxsize and self.__len__() > self.maxsize) or (
+            self.maxbytes and self.nbytes > self.maxbytes and self.__len__() > 1
+        ):
+            self.popitem(last=False)
+            self.evictions += 1
@@ -3,7 +3,6 @@ import casadi
 import numpy as np
 import pybamm
 from scipy.integrate import cumulative_trapezoid
-import xarray as xr
 import bisect
 from pybammsolvers import idaklu
 
@@ -78,11 +77,19 @@ class ProcessedVariable:
         self._entries_for_interp_raw = None
         self._coords_raw = None
 
-    def initialise(self):
+    def initialise(self, entries=None):
+        """
+        Evaluate the variable at the solution time points, unless the raw entries are
+        given (e.g. when several variables are observed together, see
+        :meth:`pybamm.Solution.update`).
+        """
         if self.entries_raw_initialized:
             return
 
-        entries = self.observe_raw()
+        if entries is None:
+            entries = self.observe_raw()
+        else:
+            entries = self._observe_postfix(entries, self.t_pts)
 
         t = self.t_pts
         entries_for_interp, coords = self._interp_setup(entries, t)
@@ -307,6 +314,8 @@ class ProcessedVariable:
         Evaluate the variable at arbitrary *dimensional* t (and x, r, y, z and/or R),
         using interpolation
         """
+        import xarray as xr
+
         if observe_raw:
             if not self.xr_array_raw_initialized:
                 self._xr_array_raw = xr.DataArray(entries_for_interp, coords=coords)
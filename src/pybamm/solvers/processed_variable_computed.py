@@ -6,7 +6,6 @@ import casadi
 import numpy as np
 import pybamm
 from scipy.integrate import cumulative_trapezoid
-import xarray as xr
 
 
 class ProcessedVariableComputed:
@@ -191,6 +190,8 @@ class ProcessedVariableComputed:
             raise NotImplementedError(f"Unsupported data dimension: {self.dimensions}")
 
     def initialise_0D(self):
+        import xarray as xr
+
         entries = self.unroll_0D()
 
         if self.cumtrapz_ic is not None:
@@ -205,6 +206,8 @@ class ProcessedVariableComputed:
         self.dimensions = 0
 
     def initialise_1D(self):
+        import xarray as xr
+
         entries = self.unroll_1D()
 
         # Get node and edge values
@@ -265,6 +268,8 @@ class ProcessedVariableComputed:
         """
         Initialise a 2D object that depends on x and r, x and z, x and R, or R and r.
         """
+        import xarray as xr
+
         first_dim_nodes = self.mesh.nodes
         first_dim_edges = self.mesh.edges
         second_dim_nodes = self.base_variables[0].secondary_mesh.nodes
@@ -396,6 +401,8 @@ class ProcessedVariableComputed:
         )
 
     def initialise_2D_scikit_fem(self):
+        import xarray as xr
+
         y_sol = self.mesh.edges["y"]
         len_y = len(y_sol)
         z_sol = self.mesh.edges["z"]
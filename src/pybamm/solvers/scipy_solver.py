@@ -6,6 +6,7 @@ import pybamm
 
 import scipy.integrate as it
 import numpy as np
+from scipy.sparse import csc_matrix
 
 
 class ScipySolver(pybamm.BaseSolver):
@@ -47,6 +48,19 @@ class ScipySolver(pybamm.BaseSolver):
         self.name = f"Scipy solver ({method})"
         pybamm.citations.register("Virtanen2020")
 
+    def _get_jacobian_colouring(self, model):
+        """
+        Get the colouring of the columns of the Jacobian of the rhs of a model, which
+        only depends on its sparsity pattern so is calculated once for each model.
+        """
+        set_up = self._model_set_up[model]
+        if "jacobian colouring" not in set_up:
+            sparsity = model.rhs_eval.sparsity_jac(1, 0)
+            set_up["jacobian colouring"] = JacobianColouring(
+                *sparsity.get_triplet(), sparsity.shape
+            )
+        return set_up["jacobian colouring"]
+
     def _integrate(self, model, t_eval, inputs_dict=None, t_interp=None):
         """
         Solve a model defined by dydt with initial conditions y0.
@@ -82,16 +96,6 @@ class ScipySolver(pybamm.BaseSolver):
             y0 = y0.full()
         y0 = y0.flatten()
 
-        # check for user-supplied Jacobian
-        implicit_methods = ["Radau", "BDF", "LSODA"]
-        if np.any([self.method in implicit_methods]):
-            if model.jac_rhs_eval:
-
-                def jacobian(t, y):
-                    return model.jac_rhs_eval(t, y, inputs)
-
-                extra_options.update({"jac": jacobian})
-
         # rhs equation
         if model.convert_to_format == "casadi":
 
@@ -103,6 +107,50 @@ class ScipySolver(pybamm.BaseSolver):
             def rhs(t, y):
                 return model.rhs_eval(t, y, inputs).reshape(-1)
 
+        # check for user-supplied Jacobian
+        implicit_methods = ["Radau", "BDF", "LSODA"]
+        sparse_methods = ["Radau", "BDF"]
+        if np.any([self.method in implicit_methods]):
+            if model.jac_rhs_eval:
+                if (
+                    model.convert_to_format == "casadi"
+                    and self.method in sparse_methods
+                ):
+                    # pass the Jacobian as a sparse matrix, so that the solver uses a
+                    # sparse LU decomposition
+                    def jacobian(t, y):
+                        return model.jac_rhs_eval(t, y, inputs).sparse()
+
+                else:
+
+                    def jacobian(t, y):
+                        return model.jac_rhs_eval(t, y, inputs)
+
+                extra_options.update({"jac": jacobian})
+            elif (
+                model.convert_to_format == "casadi"
+                and self.method in sparse_methods
+                and "jac" not in extra_options
+            ):
+                # approximate the Jacobian by finite differences, perturbing the
+                # states that do not appear in the same equations together
+                extra_options.update(
+                    {"jac": self._get_jacobian_colouring(model).jacobian(rhs)}
+                )
+            elif (
+                model.convert_to_format == "python"
+                and self.method in sparse_methods
+                and "vectorized" not in extra_options
+            ):
+                # approximate the Jacobian by finite differences with a single batched
+                # evaluation of the model for all the perturbed states
+                def rhs(t, y):
+                    if y.shape[1] == 1:
+                        return model.rhs_eval(t, y, inputs)
+                    return model.rhs_eval.evaluate_batch(t, y, inputs)
+
+                extra_options.update({"vectorized": True})
+
         # make events terminal so that the solver stops when they are reached
         if model.terminate_events_eval:
 
@@ -129,6 +177,13 @@ class ScipySolver(pybamm.BaseSolver):
         integration_time = timer.time()
 
         if sol.success:
+            post_processing_timer = pybamm.Timer()
+            statistics = {
+                # the dense output has one interpolant for each step
+                "n_steps": len(sol.sol.ts) - 1,
+                "n_rhs_evaluations": sol.nfev,
+                "n_jacobian_evaluations": sol.njev,
+            }
             # Set the reason for termination
             if sol.message == "A termination event occurred.":
                 termination = "event"
@@ -153,6 +208,88 @@ class ScipySolver(pybamm.BaseSolver):
                 all_sensitivities=bool(model.calculate_sensitivities),
             )
             sol.integration_time = integration_time
+            sol._statistics.add(
+                **statistics, post_processing_time=post_processing_timer.time()
+            )
             return sol
         else:
             raise pybamm.SolverError(sol.message)
+
+
+class JacobianColouring:
+    """
+    A colouring of the columns of a sparse Jacobian such that no two columns of the
+    same colour have a nonzero in the same row. All the columns of a colour can then
+    be approximated by finite differences with a single evaluation of the function,
+    so that the whole Jacobian takes as many evaluations as there are colours (see
+    e.g. Curtis, Powell and Reid, 1974), rather than one for each column.
+
+    Parameters
+    ----------
+    rows : array_like
+        The rows of the nonzeros of the Jacobian
+    cols : array_like
+        The columns of the nonzeros of the Jacobian
+    shape : tuple
+        The shape of the Jacobian
+    """
+
+    def __init__(self, rows, cols, shape):
+        self.shape = shape
+        jac = csc_matrix(
+            (np.ones(len(rows)), (np.asarray(rows), np.asarray(cols))), shape=shape
+        )
+        jac.sum_duplicates()
+        jac.sort_indices()
+        self._indices = jac.indices
+        self._indptr = jac.indptr
+        # the row and column of each nonzero, in compressed column order
+        self._rows = jac.indices
+        self._cols = np.repeat(np.arange(shape[1]), np.diff(jac.indptr))
+
+        # greedy colouring, taking the columns in order
+        rows_of_col = np.split(jac.indices, jac.indptr[1:-1])
+        jac_csr = jac.tocsr()
+        cols_of_row = np.split(jac_csr.indices, jac_csr.indptr[1:-1])
+        colours = np.full(shape[1], -1)
+        for col in range(shape[1]):
+            forbidden = {
+                colours[other_col]
+                for row in rows_of_col[col]
+                for other_col in cols_of_row[row]
+            }
+            colour = 0
+            while colour in forbidden:
+                colour += 1
+            colours[col] = colour
+        self.colours = colours
+        self.n_colours = colours.max() + 1 if shape[1] > 0 else 0
+        # the columns and nonzeros of each colour
+        self._colour_cols = [np.where(colours == c)[0] for c in range(self.n_colours)]
+        self._colour_nonzeros = [
+            np.where(colours[self._cols] == c)[0] for c in range(self.n_colours)
+        ]
+
+    def jacobian(self, fun):
+        """
+        Return a function of (t, y) that approximates the Jacobian of `fun(t, y)` with
+        respect to y by forward differences, as a sparse matrix.
+        """
+        step_factor = np.sqrt(np.finfo(float).eps)
+
+        def jacobian(t, y):
+            f0 = fun(t, y)
+            h = step_factor * np.maximum(1, np.abs(y))
+            # make the steps exactly representable
+            h = (y + h) - y
+            data = np.empty(len(self._rows))
+            for cols, nonzeros in zip(self._colour_cols, self._colour_nonzeros):
+                y_perturbed = y.copy()
+                y_perturbed[cols] += h[cols]
+                df = fun(t, y_perturbed) - f0
+                data[nonzeros] = df[self._rows[nonzeros]] / h[self._cols[nonzeros]]
+            return csc_matrix(
+                (data, self._indices, self._indptr), shape=self.shape, copy=False
+            )
+
+        return jacobian
@@ -8,11 +8,16 @@ import numbers
 import numpy as np
 import pickle
 import pybamm
-import pandas as pd
 from scipy.io import savemat
 from functools import cached_property
 
 
+# Number of time points evaluated by each call of a mapped casadi function. Creating
+# a mapped function gets slower as the number of time points grows, so long
+# solutions are evaluated in blocks.
+_MAP_SIZE = 64
+
+
 class NumpyEncoder(json.JSONEncoder):
     """
     Numpy serialiser helper class that converts numpy arrays to a list.
@@ -137,6 +142,8 @@ class Solution:
         self.set_up_time = None
         self.solve_time = None
         self.integration_time = None
+        # Solver statistics other than the times above
+        self._statistics = pybamm.SolverStatistics()
 
         # initialize empty variables and data
         self._variables = pybamm.FuzzyDict()
@@ -542,6 +549,21 @@ class Solution:
     def total_time(self):
         return self.set_up_time + self.solve_time
 
+    @property
+    def statistics(self):
+        """
+        A :class:`pybamm.SolverStatistics` with the statistics of the solver calls
+        that produced this solution, summed over all the sub-solutions (e.g. the steps
+        of an experiment).
+        """
+        statistics = self._statistics.copy()
+        statistics.add(
+            set_up_time=self.set_up_time,
+            solve_time=self.solve_time,
+            integration_time=self.integration_time,
+        )
+        return statistics
+
     @property
     def cycles(self):
         return self._cycles
@@ -570,7 +592,11 @@ class Solution:
         )
 
     def update(self, variables):
-        """Add ProcessedVariables to the dictionary of variables in the solution"""
+        """
+        Add ProcessedVariables to the dictionary of variables in the solution. When
+        several variables are given, they are evaluated together with a single
+        casadi function per model, which is cached by the model.
+        """
         # make sure that sensitivities are extracted if required
         if isinstance(self._all_sensitivities, bool) and self._all_sensitivities:
             self.extract_explicit_sensitivities()
@@ -583,6 +609,11 @@ class Solution:
         for variable in variables:
             self._update_variable(variable)
 
+        # Observe several variables together, so that the expressions they share are
+        # only evaluated once
+        if len(variables) > 1 and not self.variables_returned:
+            self._observe_variables(variables)
+
     def _update_variable(self, variable):
         time_integral = None
         pybamm.logger.debug(f"Post-processing {variable}")
@@ -637,6 +668,105 @@ class Solution:
 
         self._variables[variable] = var
 
+    def _observe_variables(self, variables):
+        """
+        Evaluate several processed variables at the solution time points, using one
+        casadi function per model that returns all of the variables, mapped over
+        blocks of time points. The functions are keyed on the sorted names of the
+        variables, so that the order in which they are given does not matter.
+        """
+        variables = sorted(set(variables))
+        processed_variables = [self._variables[variable] for variable in variables]
+        sizes = [int(var.base_eval_size) for var in processed_variables]
+        entries = np.empty((sum(sizes), len(self.t)))
+        idx = 0
+        for model, ts, ys, inputs, inputs_casadi in zip(
+            self.all_models,
+            self.all_ts,
+            self.all_ys,
+            self.all_inputs,
+            self.all_inputs_casadi,
+        ):
+            if ts.size == 0:
+                continue
+            key = tuple(variables)
+            vars_casadi = model._variables_casadi_fused.get(key)
+            if vars_casadi is None:
+                vars_pybamm = []
+                for variable in variables:
+                    var_pybamm = model.variables_and_events[variable]
+                    if isinstance(
+                        var_pybamm,
+                        (pybamm.ExplicitTimeIntegral, pybamm.DiscreteTimeSum),
+                    ):
+                        var_pybamm = var_pybamm.child
+                    vars_pybamm.append(var_pybamm)
+                # map over blocks of time points, with the same inputs for each
+                vars_casadi = self.process_casadi_vars(
+                    vars_pybamm, inputs, ys.shape
+                ).map("variables", "serial", _MAP_SIZE, [2], [])
+                model._variables_casadi_fused[key] = vars_casadi
+            entries[:, idx : idx + ts.size] = _evaluate_mapped(
+                vars_casadi, ts, ys, inputs_casadi
+            )
+            idx += ts.size
+
+        start = 0
+        for var, size in zip(processed_variables, sizes):
+            var.initialise(
+                np.reshape(
+                    entries[start : start + size], var._shape(var.t_pts), order="F"
+                )
+            )
+            start += size
+
+    def process_casadi_vars(self, vars_pybamm, inputs, ys_shape):
+        """
+        Create a single casadi function that returns the (dense) values of several
+        variables stacked into one column, sharing their common subexpressions.
+        """
+        t_MX = casadi.MX.sym("t")
+        y_MX = casadi.MX.sym("y", ys_shape[0])
+        inputs_MX_dict = {
+            key: casadi.MX.sym("input", value.shape[0]) for key, value in inputs.items()
+        }
+        inputs_MX = casadi.vertcat(*[p for p in inputs_MX_dict.values()])
+        converter = pybamm.CasadiConverter()
+        vars_sym = [
+            casadi.densify(
+                casadi.reshape(
+                    converter.convert(var_pybamm, t_MX, y_MX, None, inputs_MX_dict),
+                    -1,
+                    1,
+                )
+            )
+            for var_pybamm in vars_pybamm
+        ]
+
+        opts = {
+            "cse": True,
+            "inputs_check": False,
+            "is_diff_in": [False, False, False],
+            "is_diff_out": [False],
+            "regularity_check": False,
+            "error_on_fail": False,
+            "enable_jacobian": False,
+        }
+        vars_casadi = casadi.Function(
+            "variables",
+            [t_MX, y_MX, inputs_MX],
+            [casadi.vertcat(*vars_sym)],
+            opts,
+        )
+
+        # Some variables, like interpolants, cannot be expanded
+        try:
+            return vars_casadi.expand()
+        except RuntimeError as error:
+            if "'eval_sx' not defined for" not in str(error):
+                raise error  # pragma: no cover
+            return vars_casadi
+
     def process_casadi_var(self, var_pybamm, inputs, ys_shape):
         t_MX = casadi.MX.sym("t")
         y_MX = casadi.MX.sym("y", ys_shape[0])
@@ -762,6 +892,8 @@ class Solution:
                 variables = [variables]
             # otherwise, save only the variables specified
             data_long_names = {}
+            # observe the new variables together
+            self.update([name for name in variables if name not in self._variables])
             for name in variables:
                 data_long_names[name] = self[name].data
         if len(data_long_names) == 0:
@@ -825,6 +957,8 @@ class Solution:
         data : str, optional
             str if 'csv' or 'json' is chosen and filename is None, otherwise None
         """
+        import pandas as pd
+
         data = self.get_data_dict(variables=variables, short_names=short_names)
 
         if to_format == "pickle":
@@ -904,6 +1038,7 @@ class Solution:
             new_sol._termination = other.termination
             new_sol._t_event = other._t_event
             new_sol._y_event = other._y_event
+            new_sol._statistics = self._statistics + other._statistics
             return new_sol
 
         # Update list of sub-solutions
@@ -972,6 +1107,7 @@ class Solution:
                 and getattr(other, attr, None) is not None
             ):
                 setattr(new_sol, attr, getattr(self, attr) + getattr(other, attr))
+        new_sol._statistics = self._statistics + other._statistics
 
         # Set sub_solutions
         new_sol._sub_solutions = self.sub_solutions + other.sub_solutions
@@ -1015,6 +1151,7 @@ class Solution:
         new_sol.solve_time = self.solve_time
         new_sol.integration_time = self.integration_time
         new_sol.set_up_time = self.set_up_time
+        new_sol._statistics = self._statistics.copy()
 
         # copy over variables which were derived at the solver stage
         if self._variables and all(
@@ -1140,6 +1277,7 @@ def make_cycle_solution(
     cycle_solution.solve_time = sum_sols.solve_time
     cycle_solution.integration_time = sum_sols.integration_time
     cycle_solution.set_up_time = sum_sols.set_up_time
+    cycle_solution._statistics = sum_sols._statistics
 
     cycle_solution.steps = step_solutions
 
@@ -1155,3 +1293,40 @@ def make_cycle_solution(
         cycle_solution = None
 
     return cycle_solution, cycle_summary_variables, cycle_first_state
+
+
+def _evaluate_mapped(function, ts, ys, inputs):
+    """
+    Evaluate a casadi function that is mapped over a block of time points at all of
+    the time points of a sub-solution, one block at a time. The arguments are read
+    from and the output is written to numpy arrays directly, and the last block is
+    padded by repeating the last time point.
+    """
+    if isinstance(ys, casadi.DM):
+        ys = ys.full()
+    if isinstance(inputs, casadi.DM):
+        inputs = inputs.full()
+    inputs = np.ascontiguousarray(inputs, dtype=float).ravel()
+    n_map = function.size2_in(0)
+    out = np.empty((function.size1_out(0), ts.size), order="F")
+
+    buffer, evaluate = function.buffer()
+    buffer.set_arg(2, memoryview(inputs))
+    for start in range(0, ts.size, n_map):
+        stop = min(start + n_map, ts.size)
+        t_block = np.ascontiguousarray(ts[start:stop], dtype=float)
+        y_block = np.asfortranarray(ys[:, start:stop], dtype=float)
+        if stop - start < n_map:
+            pad = n_map - (stop - start)
+            t_block = np.pad(t_block, (0, pad), mode="edge")
+            y_block = np.asfortranarray(np.pad(y_block, ((0, 0), (0, pad)), "edge"))
+            out_block = np.empty((out.shape[0], n_map), order="F")
+        else:
+            out_block = out[:, start:stop]
+        buffer.set_arg(0, memoryview(t_block))
+        buffer.set_arg(1, memoryview(y_block.ravel(order="F")))
+        buffer.set_res(0, memoryview(out_block.ravel(order="F")))
+        evaluate()
+        if stop - start < n_map:
+            out[:, start:stop] = out_block[:, : stop - start]
+    return out
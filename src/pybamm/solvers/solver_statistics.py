@@ -0,0 +1,123 @@
+#
+# Statistics of a solve
+#
+import pybamm
+
+
+class SolverStatistics:
+    """
+    Statistics of the solver calls that produced a solution, available as
+    :attr:`pybamm.Solution.statistics`. Statistics that a solver does not report are
+    None. Adding solutions (e.g. the steps of an experiment) adds their statistics.
+
+    The counters are:
+
+    - n_steps: the number of internal time steps taken by the integrator
+    - n_rhs_evaluations: the number of evaluations of the model equations
+    - n_jacobian_evaluations: the number of evaluations of the Jacobian
+    - n_nonlinear_iterations: the number of nonlinear (Newton) iterations
+    - n_error_test_failures: the number of steps rejected by the local error test
+
+    and the times, in seconds, are:
+
+    - set_up_time: setting up the model and the initial conditions
+    - consistent_initialisation_time: making the initial conditions consistent, at
+      the start (as part of the set-up) and after each discontinuity
+    - solve_time: solving the model, which includes the three times below
+    - integration_time: running the integrator
+    - event_location_time: locating the events that terminated the integration
+      (only for :class:`pybamm.CasadiSolver`), including creating and running the
+      integrators used to do so
+    - post_processing_time: creating the solution from the integrator output and
+      identifying the termination reason
+
+    Parameters
+    ----------
+    **statistics
+        Initial values of the statistics, e.g. ``n_steps=10``.
+    """
+
+    counters = (
+        "n_steps",
+        "n_rhs_evaluations",
+        "n_jacobian_evaluations",
+        "n_nonlinear_iterations",
+        "n_error_test_failures",
+    )
+    times = (
+        "set_up_time",
+        "consistent_initialisation_time",
+        "solve_time",
+        "integration_time",
+        "event_location_time",
+        "post_processing_time",
+    )
+
+    def __init__(self, **statistics):
+        for name in self.counters + self.times:
+            setattr(self, name, None)
+        self.update(**statistics)
+
+    def _check_names(self, statistics):
+        for name in statistics:
+            if name not in self.counters + self.times:
+                raise ValueError(f"'{name}' is not a solver statistic")
+
+    @staticmethod
+    def _value(value):
+        if isinstance(value, pybamm.TimerTime):
+            return value.value
+        return value
+
+    def update(self, **statistics):
+        """Set the values of some statistics."""
+        self._check_names(statistics)
+        for name, value in statistics.items():
+            setattr(self, name, self._value(value))
+
+    def add(self, **statistics):
+        """Add to the values of some statistics (None values are ignored)."""
+        self._check_names(statistics)
+        for name, value in statistics.items():
+            value = self._value(value)
+            if value is None:
+                continue
+            current = getattr(self, name)
+            setattr(self, name, value if current is None else current + value)
+
+    @property
+    def total_time(self):
+        """The sum of the set-up and solve times"""
+        if self.set_up_time is None and self.solve_time is None:
+            return None
+        return (self.set_up_time or 0) + (self.solve_time or 0)
+
+    def as_dict(self):
+        """Return the statistics as a dictionary."""
+        return {name: getattr(self, name) for name in self.counters + self.times}
+
+    def copy(self):
+        return SolverStatistics(**self.as_dict())
+
+    def __add__(self, other):
+        if other is None:
+            return self.copy()
+        if not isinstance(other, SolverStatistics):
+            return NotImplemented
+        new_statistics = self.copy()
+        new_statistics.add(**other.as_dict())
+        return new_statistics
+
+    def __radd__(self, other):
+        # allows using `sum` on a list of statistics
+        if other is None or other == 0:
+            return self.copy()
+        return NotImplemented
+
+    def __repr__(self):
+        statistics = ", ".join(
+            f"{name}={value!r}"
+            for name, value in self.as_dict().items()
+            if value is not None
+        )
+        return f"pybamm.SolverStatistics({statistics})"
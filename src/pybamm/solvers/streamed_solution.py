@@ -0,0 +1,337 @@
+#
+# Solution of an experiment whose cycles are stored on disk
+#
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+import pybamm
+
+
+def detach_state(state):
+    """
+    Copy a solution containing a single state (e.g. the ``last_state`` of a cycle) so
+    that the copy does not keep the arrays of the original solution alive.
+
+    Parameters
+    ----------
+    state : :class:`pybamm.Solution` or :class:`pybamm.EmptySolution`
+        The state to copy
+
+    Returns
+    -------
+    :class:`pybamm.Solution` or :class:`pybamm.EmptySolution`
+        The copied state
+    """
+    if state is None or isinstance(state, pybamm.EmptySolution):
+        return state
+    all_yps = state.all_yps
+    if all_yps is not None:
+        all_yps = [np.array(yp) for yp in all_yps]
+    new_state = pybamm.Solution(
+        [np.array(t) for t in state.all_ts],
+        [np.array(y) for y in state.all_ys],
+        state.all_models,
+        state.all_inputs,
+        state.t_event,
+        state.y_event,
+        state.termination,
+        all_yps=all_yps,
+        check_solution=False,
+    )
+    new_state.solve_time = state.solve_time
+    new_state.integration_time = state.integration_time
+    new_state.set_up_time = state.set_up_time
+    new_state._statistics = state._statistics.copy()
+    return new_state
+
+
+class StoredCycles(Sequence):
+    """
+    Read-only sequence of the cycles of a :class:`pybamm.StreamedSolution`. Each
+    cycle is loaded from disk when it is accessed, and only the most recently
+    accessed cycle is kept in memory.
+    """
+
+    def __init__(self, streamed_solution):
+        self._streamed_solution = streamed_solution
+        self._cached = (None, None)
+
+    def __len__(self):
+        return len(self._streamed_solution._paths)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        path = self._streamed_solution._paths[index]
+        if path is None:
+            # only the summary variables of this cycle were saved
+            return None
+        if self._cached[0] != path:
+            self._cached = (path, self._streamed_solution._load_cycle(path, index))
+        return self._cached[1]
+
+
+class StreamedSolution:
+    """
+    Solution of an experiment whose cycles are stored on disk as they are completed,
+    so that the memory used by a long experiment does not grow with the number of
+    cycles. This is usually created by :class:`pybamm.callbacks.StreamingCallback`
+    rather than directly.
+
+    Each cycle is saved to a separate ``.npz`` file containing the times and states
+    of every step. The summary variables, the first state of each cycle and the last
+    state of the experiment are kept in memory. Cycles are read back on demand
+    through :attr:`StreamedSolution.cycles`, and variables are assembled one cycle at
+    a time through :meth:`StreamedSolution.__getitem__`.
+
+    Parameters
+    ----------
+    directory : str or :class:`pathlib.Path`
+        The directory in which the cycles are stored. It is created if it does not
+        exist.
+    compress : bool, optional
+        Whether to compress the stored cycles. Default is False.
+    overwrite : bool, optional
+        Whether to remove the cycles stored in `directory` by a previous experiment.
+        If False (default), an error is raised if `directory` already contains
+        stored cycles. Other files in `directory` are never removed.
+    """
+
+    def __init__(self, directory, compress=False, overwrite=False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        existing_paths = sorted(self.directory.glob("cycle_*.npz"))
+        if existing_paths and not overwrite:
+            raise ValueError(
+                f"Directory '{self.directory}' already contains stored cycles (e.g. "
+                f"'{existing_paths[0].name}'). Use a different directory, or pass "
+                "overwrite=True to remove them."
+            )
+        for path in existing_paths:
+            path.unlink()
+        self.compress = compress
+        self._paths = []
+        self._models = []
+        self._cycles = StoredCycles(self)
+        self._summary_variables = None
+        self.all_summary_variables = []
+        self.all_first_states = []
+        self.last_state = None
+        self.initial_start_time = None
+
+    @property
+    def cycles(self):
+        """The cycles of the experiment, loaded from disk when accessed"""
+        return self._cycles
+
+    @property
+    def summary_variables(self):
+        return self._summary_variables
+
+    @property
+    def first_state(self):
+        return self.all_first_states[0]
+
+    @property
+    def termination(self):
+        """Reason for termination"""
+        return self.last_state.termination
+
+    @property
+    def t(self):
+        """Times of all the stored cycles"""
+        return self._concatenate(cycle.t for cycle in self._stored_cycles())
+
+    def update_summary_variables(self, all_summary_variables):
+        self.all_summary_variables = all_summary_variables
+        self._summary_variables = pybamm.SummaryVariables(
+            self.first_state, cycle_summary_variables=all_summary_variables
+        )
+
+    def __getitem__(self, key):
+        """
+        Read the data of a variable over all of the stored cycles. Each cycle is
+        loaded and processed in turn, so only one cycle is held in memory at a time.
+
+        Unlike :meth:`pybamm.Solution.__getitem__`, which returns a
+        :class:`pybamm.ProcessedVariable`, this returns the data of the variable at
+        the solution times only. Use ``cycles[i][key]`` for the processed variable of
+        a single cycle, or :meth:`StreamedSolution.to_solution` for that of the whole
+        experiment.
+
+        Parameters
+        ----------
+        key : str
+            The name of the variable
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The data of the variable, with time along the last axis
+        """
+        return self._concatenate(cycle[key].data for cycle in self._stored_cycles())
+
+    def _stored_cycles(self):
+        return (cycle for cycle in self.cycles if cycle is not None)
+
+    def _concatenate(self, arrays):
+        """Join data from consecutive cycles, skipping repeated time points"""
+        data = []
+        t_end = None
+        for cycle, array in zip(self._stored_cycles(), arrays):
+            if t_end is not None and cycle.t[0] == t_end:
+                array = array[..., 1:]
+            data.append(array)
+            t_end = cycle.t[-1]
+        if not data:
+            return np.array([])
+        return np.concatenate(data, axis=-1)
+
+    def append_cycle(self, cycle_solution, cycle_number):
+        """
+        Write a cycle to disk.
+
+        Parameters
+        ----------
+        cycle_solution : :class:`pybamm.Solution` or None
+            The solution of the cycle, with its step solutions in ``steps``. If None,
+            only the summary variables of this cycle are kept.
+        cycle_number : int
+            The number of the cycle in the experiment, used to name the file
+        """
+        if cycle_solution is None:
+            self._paths.append(None)
+            return
+        if cycle_solution.variables_returned or cycle_solution.has_sensitivities():
+            raise NotImplementedError(
+                "Cycles with sensitivities or with only output variables returned "
+                "cannot be streamed to disk"
+            )
+
+        arrays = {"n_steps": np.array(len(cycle_solution.steps))}
+        for i, step in enumerate(cycle_solution.steps):
+            prefix = f"step_{i}"
+            if step.termination is not None:
+                arrays[f"{prefix}_termination"] = np.array(step.termination)
+            if isinstance(step, pybamm.EmptySolution):
+                arrays[f"{prefix}_empty_t"] = np.asarray(step.t)
+                continue
+            arrays[f"{prefix}_n_sub"] = np.array(len(step.all_ts))
+            for attr in ["t_event", "y_event"]:
+                if getattr(step, attr) is not None:
+                    arrays[f"{prefix}_{attr}"] = np.asarray(getattr(step, attr))
+            for j, (t, y, model, inputs) in enumerate(
+                zip(step.all_ts, step.all_ys, step.all_models, step.all_inputs)
+            ):
+                sub_prefix = f"{prefix}_{j}"
+                arrays[f"{sub_prefix}_t"] = t
+                arrays[f"{sub_prefix}_y"] = np.asarray(y)
+                if step.all_yps is not None:
+                    arrays[f"{sub_prefix}_yp"] = np.asarray(step.all_yps[j])
+                arrays[f"{sub_prefix}_model"] = np.array(self._model_index(model))
+                arrays[f"{sub_prefix}_input_names"] = np.array(list(inputs), dtype=str)
+                for k, value in enumerate(inputs.values()):
+                    arrays[f"{sub_prefix}_input_{k}"] = np.asarray(value)
+
+        path = self.directory / f"cycle_{cycle_number:06d}.npz"
+        save = np.savez_compressed if self.compress else np.savez
+        save(path, **arrays)
+        self._paths.append(path)
+
+    def _model_index(self, model):
+        # models are shared between steps and cycles, so they are kept in memory
+        for i, stored_model in enumerate(self._models):
+            if stored_model is model:
+                return i
+        self._models.append(model)
+        return len(self._models) - 1
+
+    def _load_cycle(self, path, index):
+        """Read a cycle from disk, as a :class:`pybamm.Solution` with its steps"""
+        with np.load(path, allow_pickle=False) as data:
+            steps = [self._load_step(data, f"step_{i}") for i in range(data["n_steps"])]
+        cycle_solution = steps[0].copy()
+        for step in steps[1:]:
+            cycle_solution = cycle_solution + step
+        cycle_solution.steps = steps
+        if index < len(self.all_summary_variables):
+            cycle_solution.cycle_summary_variables = self.all_summary_variables[index]
+        return cycle_solution
+
+    def _load_step(self, data, prefix):
+        termination = None
+        if f"{prefix}_termination" in data:
+            termination = str(data[f"{prefix}_termination"])
+        if f"{prefix}_empty_t" in data:
+            return pybamm.EmptySolution(termination, t=data[f"{prefix}_empty_t"])
+        all_ts, all_ys, all_yps, all_models, all_inputs = [], [], [], [], []
+        for j in range(data[f"{prefix}_n_sub"]):
+            sub_prefix = f"{prefix}_{j}"
+            all_ts.append(data[f"{sub_prefix}_t"])
+            all_ys.append(data[f"{sub_prefix}_y"])
+            if f"{sub_prefix}_yp" in data:
+                all_yps.append(data[f"{sub_prefix}_yp"])
+            all_models.append(self._models[data[f"{sub_prefix}_model"]])
+            names = data[f"{sub_prefix}_input_names"]
+            all_inputs.append(
+                {
+                    str(name): data[f"{sub_prefix}_input_{k}"]
+                    for k, name in enumerate(names)
+                }
+            )
+        t_event, y_event = (
+            data[key] if key in data else None
+            for key in [f"{prefix}_t_event", f"{prefix}_y_event"]
+        )
+        return pybamm.Solution(
+            all_ts,
+            all_ys,
+            all_models,
+            all_inputs,
+            t_event,
+            y_event,
+            termination,
+            all_yps=all_yps or None,
+            check_solution=False,
+        )
+
+    def to_solution(self):
+        """
+        Load all of the stored cycles into a single :class:`pybamm.Solution`. Note
+        that this holds the whole experiment in memory.
+
+        Returns
+        -------
+        :class:`pybamm.Solution`
+            The solution of the stored cycles, with the cycles and summary variables
+            of the experiment
+
+        Raises
+        ------
+        ValueError
+            If no cycle has been stored, e.g. if only the summary variables of the
+            cycles were kept
+        """
+        if all(path is None for path in self._paths):
+            raise ValueError(
+                "No cycle has been stored, so there is no solution to load. Only the "
+                "summary variables of the cycles were kept."
+            )
+        solution = None
+        cycles = []
+        for index, path in enumerate(self._paths):
+            cycle = None if path is None else self._load_cycle(path, index)
+            if cycle is not None:
+                solution = solution + cycle
+            cycles.append(cycle)
+        solution.cycles = cycles
+        if self.all_summary_variables:
+            solution.update_summary_variables(self.all_summary_variables)
+        solution.all_first_states = self.all_first_states
+        solution.initial_start_time = self.initial_start_time
+        return solution
@@ -103,6 +103,19 @@ class FiniteVolume(pybamm.SpatialMethod):
 
         return out
 
+    @staticmethod
+    def _repeated_matrix(sub_matrix, repeats):
+        """
+        Repeat a matrix on the diagonal for each node in the secondary dimensions.
+        Only the submatrix is stored if it is repeated, see
+        :class:`pybamm.BlockDiagonalMatrix`.
+        """
+        if repeats > 1:
+            return pybamm.BlockDiagonalMatrix(sub_matrix, repeats)
+        # Convert to csr_matrix so that we can take the index (row-slicing), which is
+        # not supported by the default sparse formats
+        return pybamm.Matrix(csr_matrix(sub_matrix))
+
     def gradient_matrix(self, domain, domains):
         """
         Gradient matrix for finite volumes in the appropriate domain.
@@ -121,24 +134,25 @@ class FiniteVolume(pybamm.SpatialMethod):
         # Create appropriate submesh by combining submeshes in primary domain
         submesh = self.mesh[domain]
 
+        # number of repeats
+        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
+
+        # return the matrix if it has already been built for this mesh
+        key = ("FiniteVolume.gradient_matrix", submesh, second_dim_repeats)
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
         # Create 1D matrix using submesh
         n = submesh.npts
         e = 1 / submesh.d_nodes
         sub_matrix = diags([-e, e], [0, 1], shape=(n - 1, n))
 
-        # number of repeats
-        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
-
-        # generate full matrix from the submatrix
-        # Convert to csr_matrix so that we can take the index (row-slicing), which is
-        # not supported by the default kron format
-        # Note that this makes column-slicing inefficient, but this should not be an
-        # issue
-        matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
+        # repeat the submatrix for each node in secondary dimensions
+        matrix = self._repeated_matrix(sub_matrix, second_dim_repeats)
         if getattr(submesh, "length", None) is not None:
-            return pybamm.Matrix(matrix) * 1 / submesh.length
-        else:
-            return pybamm.Matrix(matrix)
+            matrix = matrix * 1 / submesh.length
+        return self._cache_operator(key, matrix)
 
     def divergence(self, symbol, discretised_symbol, boundary_conditions):
         """Matrix-vector multiplication to implement the divergence operator.
@@ -183,6 +197,15 @@ class FiniteVolume(pybamm.SpatialMethod):
         # Create appropriate submesh by combining submeshes in domain
         submesh = self.mesh[domains["primary"]]
 
+        # repeat matrix for each node in secondary dimensions
+        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
+
+        # return the matrix if it has already been built for this mesh
+        key = ("FiniteVolume.divergence_matrix", submesh, second_dim_repeats)
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
         # check coordinate system
         if submesh.coord_sys in ["cylindrical polar", "spherical polar"]:
             r_edges_left = submesh.edges[:-1]
@@ -200,23 +223,16 @@ class FiniteVolume(pybamm.SpatialMethod):
         n = submesh.npts + 1
         sub_matrix = diags([-e, e], [0, 1], shape=(n - 1, n))
 
-        # repeat matrix for each node in secondary dimensions
-        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
-        # generate full matrix from the submatrix
-        # Convert to csr_matrix so that we can take the index (row-slicing), which is
-        # not supported by the default kron format
-        # Note that this makes column-slicing inefficient, but this should not be an
-        # issue
-        matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
+        # repeat the submatrix for each node in secondary dimensions
+        matrix = self._repeated_matrix(sub_matrix, second_dim_repeats)
         if getattr(submesh, "length", None) is not None:
             if submesh.coord_sys == "spherical polar":
-                return pybamm.Matrix(matrix) * (1 / submesh.length**3)
+                matrix = matrix * (1 / submesh.length**3)
             elif submesh.coord_sys == "cylindrical polar":
-                return pybamm.Matrix(matrix) * (1 / (submesh.length**2))
+                matrix = matrix * (1 / (submesh.length**2))
             else:
-                return pybamm.Matrix(matrix) * (1 / submesh.length)
-        else:
-            return pybamm.Matrix(matrix)
+                matrix = matrix * (1 / submesh.length)
+        return self._cache_operator(key, matrix)
 
     def laplacian(self, symbol, discretised_symbol, boundary_conditions):
         """
@@ -272,32 +288,11 @@ class FiniteVolume(pybamm.SpatialMethod):
         domain = child.domains[integration_dimension]
         submesh = self.mesh[domain]
 
-        # check coordinate system
-        if submesh.coord_sys in ["cylindrical polar", "spherical polar"]:
-            r_edges_left = submesh.edges[:-1]
-            r_edges_right = submesh.edges[1:]
-            if submesh.coord_sys == "spherical polar":
-                d_edges = 4 * np.pi * (r_edges_right**3 - r_edges_left**3) / 3
-            elif submesh.coord_sys == "cylindrical polar":
-                d_edges = 2 * np.pi * (r_edges_right**2 - r_edges_left**2) / 2
-        else:
-            d_edges = submesh.d_edges
         possible_dimensions = ["primary", "secondary", "tertiary", "quaternary"]
         if integration_dimension == "primary":
-            # Create appropriate submesh by combining submeshes in domain
-            submesh = self.mesh[domains["primary"]]
-
-            # Create vector of ones for primary domain submesh
-
-            if vector_type == "row":
-                d_edges = d_edges[np.newaxis, :]
-            elif vector_type == "column":
-                d_edges = d_edges[:, np.newaxis]
-
             # repeat matrix for each node in secondary dimensions
             second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
-            # generate full matrix from the submatrix
-            matrix = kron(eye(second_dim_repeats), d_edges)
+            repeats_key = (second_dim_repeats,)
         elif integration_dimension in possible_dimensions[1:]:
             this_dimension_index = possible_dimensions.index(integration_dimension)
             # get lower dimensions and the corresponding domains, i.e. if integration_dimension is "secondary",
@@ -315,11 +310,46 @@ class FiniteVolume(pybamm.SpatialMethod):
                     n_lower_pts *= lower_submesh.npts + 1
                 else:
                     n_lower_pts *= lower_submesh.npts
-            int_matrix = hstack([d_edge * eye(n_lower_pts) for d_edge in d_edges])
-            # Higher dimensions should be tiled, so repeat the matrix for each higher dimension.
             higher_repeats = self._get_auxiliary_domain_repeats(
                 {k: v for k, v in domains.items() if (k in higher_dimensions)}
             )
+            repeats_key = (n_lower_pts, higher_repeats)
+
+        # return the matrix if it has already been built for this mesh
+        key = (
+            "FiniteVolume.definite_integral_matrix",
+            submesh,
+            vector_type,
+            integration_dimension,
+            *repeats_key,
+        )
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
+        # check coordinate system
+        if submesh.coord_sys in ["cylindrical polar", "spherical polar"]:
+            r_edges_left = submesh.edges[:-1]
+            r_edges_right = submesh.edges[1:]
+            if submesh.coord_sys == "spherical polar":
+                d_edges = 4 * np.pi * (r_edges_right**3 - r_edges_left**3) / 3
+            elif submesh.coord_sys == "cylindrical polar":
+                d_edges = 2 * np.pi * (r_edges_right**2 - r_edges_left**2) / 2
+        else:
+            d_edges = submesh.d_edges
+        if integration_dimension == "primary":
+            # Create vector of ones for primary domain submesh
+
+            if vector_type == "row":
+                d_edges = d_edges[np.newaxis, :]
+            elif vector_type == "column":
+                d_edges = d_edges[:, np.newaxis]
+
+            # generate full matrix from the submatrix
+            matrix = kron(eye(second_dim_repeats), d_edges)
+        elif integration_dimension in possible_dimensions[1:]:
+            int_matrix = hstack([d_edge * eye(n_lower_pts) for d_edge in d_edges])
+            # Higher dimensions should be tiled, so repeat the matrix for each higher dimension.
             matrix = kron(eye(higher_repeats), int_matrix)
         # generate full matrix from the submatrix
         # Convert to csr_matrix so that we can take the index (row-slicing), which is
@@ -334,7 +364,7 @@ class FiniteVolume(pybamm.SpatialMethod):
                 matrix = matrix * submesh.length**2
             else:
                 matrix = matrix * submesh.length
-        return matrix
+        return self._cache_operator(key, matrix)
 
     def indefinite_integral(self, child, discretised_child, direction):
         """Implementation of the indefinite integral operator."""
@@ -444,6 +474,17 @@ class FiniteVolume(pybamm.SpatialMethod):
         n = submesh.npts
         second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
 
+        # return the matrix if it has already been built for this mesh
+        key = (
+            "FiniteVolume.indefinite_integral_matrix_edges",
+            submesh,
+            second_dim_repeats,
+            direction,
+        )
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
         du_n = submesh.d_nodes
         if direction == "forward":
             du_entries = [du_n] * (n - 1)
@@ -469,7 +510,7 @@ class FiniteVolume(pybamm.SpatialMethod):
         if hasattr(submesh, "length"):
             matrix = matrix * submesh.length
 
-        return pybamm.Matrix(matrix)
+        return self._cache_operator(key, pybamm.Matrix(matrix))
 
     def indefinite_integral_matrix_nodes(self, domains, direction):
         """
@@ -496,6 +537,17 @@ class FiniteVolume(pybamm.SpatialMethod):
         n = submesh.npts
         second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
 
+        # return the matrix if it has already been built for this mesh
+        key = (
+            "FiniteVolume.indefinite_integral_matrix_nodes",
+            submesh,
+            second_dim_repeats,
+            direction,
+        )
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
         du_n = submesh.d_edges
         du_entries = [du_n] * n
         if direction == "forward":
@@ -511,7 +563,7 @@ class FiniteVolume(pybamm.SpatialMethod):
         if hasattr(submesh, "length"):
             matrix = matrix * submesh.length
 
-        return pybamm.Matrix(matrix)
+        return self._cache_operator(key, pybamm.Matrix(matrix))
 
     def delta_function(self, symbol, discretised_symbol):
         """
@@ -588,15 +640,11 @@ class FiniteVolume(pybamm.SpatialMethod):
 
         left_sub_matrix = np.zeros((1, left_npts))
         left_sub_matrix[0][left_npts - 1] = 1
-        left_matrix = pybamm.Matrix(
-            csr_matrix(kron(eye(second_dim_repeats), left_sub_matrix))
-        )
+        left_matrix = self._repeated_matrix(left_sub_matrix, second_dim_repeats)
 
         right_sub_matrix = np.zeros((1, right_npts))
         right_sub_matrix[0][0] = 1
-        right_matrix = pybamm.Matrix(
-            csr_matrix(kron(eye(second_dim_repeats), right_sub_matrix))
-        )
+        right_matrix = self._repeated_matrix(right_sub_matrix, second_dim_repeats)
 
         # Finite volume derivative
         # Remove domains to avoid clash
@@ -730,13 +778,9 @@ class FiniteVolume(pybamm.SpatialMethod):
         sub_matrix = vstack([left_ghost_vector, eye(n), right_ghost_vector])
 
         # repeat matrix for secondary dimensions
-        # Convert to csr_matrix so that we can take the index (row-slicing), which is
-        # not supported by the default kron format
-        # Note that this makes column-slicing inefficient, but this should not be an
-        # issue
-        matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
+        matrix = self._repeated_matrix(sub_matrix, second_dim_repeats)
 
-        new_symbol = pybamm.Matrix(matrix) @ discretised_symbol + bcs_vector
+        new_symbol = matrix @ discretised_symbol + bcs_vector
 
         return new_symbol, domain
 
@@ -839,13 +883,9 @@ class FiniteVolume(pybamm.SpatialMethod):
         sub_matrix = vstack([left_vector, eye(n), right_vector])
 
         # repeat matrix for secondary dimensions
-        # Convert to csr_matrix so that we can take the index (row-slicing), which is
-        # not supported by the default kron format
-        # Note that this makes column-slicing inefficient, but this should not be an
-        # issue
-        matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
+        matrix = self._repeated_matrix(sub_matrix, second_dim_repeats)
 
-        new_gradient = pybamm.Matrix(matrix) @ discretised_gradient + bcs_vector
+        new_gradient = matrix @ discretised_gradient + bcs_vector
 
         return new_gradient
 
@@ -1100,14 +1140,10 @@ class FiniteVolume(pybamm.SpatialMethod):
                     raise NotImplementedError
 
         # Generate full matrix from the submatrix
-        # Convert to csr_matrix so that we can take the index (row-slicing), which is
-        # not supported by the default kron format
-        # Note that this makes column-slicing inefficient, but this should not be an
-        # issue
-        matrix = csr_matrix(kron(eye(repeats), sub_matrix))
+        matrix = self._repeated_matrix(sub_matrix, repeats)
 
         # Return boundary value with domain given by symbol
-        matrix = pybamm.Matrix(matrix) * multiplicative
+        matrix = matrix * multiplicative
         boundary_value = matrix @ discretised_child
         boundary_value.copy_domains(symbol)
 
@@ -1146,10 +1182,10 @@ class FiniteVolume(pybamm.SpatialMethod):
         # Create a sparse matrix with a 1 at the index
         sub_matrix = csr_matrix(([1], ([0], [index])), shape=(1, mesh.npts))
         # repeat across auxiliary domains
-        matrix = csr_matrix(kron(eye(repeats), sub_matrix))
+        matrix = self._repeated_matrix(sub_matrix, repeats)
 
         # Index into the discretised child
-        out = pybamm.Matrix(matrix) @ discretised_child
+        out = matrix @ discretised_child
 
         # `EvaluateAt` removes domain
         out.clear_domains()
@@ -50,6 +50,29 @@ class SpatialMethod:
     def mesh(self):
         return self._mesh
 
+    def _get_cached_operator(self, key):
+        """
+        Returns the operator matrix stored under `key` in the operator cache of the
+        mesh, or None if it has not been built yet. The cache is shared by all the
+        spatial methods (and so all the discretisations) that use the same mesh.
+        """
+        operator_cache = getattr(self.mesh, "operator_cache", None)
+        if operator_cache is None:
+            return None
+        return operator_cache.get(key)
+
+    def _cache_operator(self, key, operator):
+        """
+        Stores an operator matrix under `key` in the operator cache of the mesh, and
+        returns it. The key must identify the operator, e.g. by the name of the
+        method that builds it, the submesh and the number of auxiliary domain
+        repeats.
+        """
+        operator_cache = getattr(self.mesh, "operator_cache", None)
+        if operator_cache is not None:
+            operator_cache[key] = operator
+        return operator
+
     def spatial_variable(self, symbol):
         """
         Convert a :class:`pybamm.SpatialVariable` node to a linear algebra object that
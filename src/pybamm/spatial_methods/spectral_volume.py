@@ -153,6 +153,20 @@ class SpectralVolume(pybamm.FiniteVolume):
         """
         submesh = self.mesh[domains["primary"]]
 
+        # number of repeats
+        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
+
+        # return the matrix if it has already been built for this mesh
+        key = (
+            "SpectralVolume.cv_boundary_reconstruction_matrix",
+            submesh,
+            second_dim_repeats,
+            self.order,
+        )
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
         # Obtain the basic reconstruction matrix.
         recon_sub_matrix = self.cv_boundary_reconstruction_sub_matrix()
 
@@ -161,9 +175,6 @@ class SpectralVolume(pybamm.FiniteVolume):
         n = submesh.npts // self.order
         sub_matrix = csr_matrix(kron(eye(n), recon_sub_matrix))
 
-        # number of repeats
-        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
-
         # generate full matrix from the submatrix
         # Convert to csr_matrix so that we can take the index
         # (row-slicing), which is not supported by the default kron
@@ -171,7 +182,7 @@ class SpectralVolume(pybamm.FiniteVolume):
         # but this should not be an issue.
         matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
 
-        return pybamm.Matrix(matrix)
+        return self._cache_operator(key, pybamm.Matrix(matrix))
 
     def chebyshev_differentiation_matrices(self, noe, dod):
         """
@@ -302,6 +313,20 @@ class SpectralVolume(pybamm.FiniteVolume):
         """
         submesh = self.mesh[domain]
 
+        # number of repeats
+        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
+
+        # return the matrix if it has already been built for this mesh
+        key = (
+            "SpectralVolume.gradient_matrix",
+            submesh,
+            second_dim_repeats,
+            self.order,
+        )
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
         # Obtain the Chebyshev differentiation matrix.
         # Flip it, since it is defined for the Chebyshev
         # collocation points in descending order.
@@ -354,9 +379,6 @@ class SpectralVolume(pybamm.FiniteVolume):
             sub_matrix[-d - 1, -d - 1 :] = f * sub_matrix_raw[-d - 1, -d - 1 :]
             sub_matrix[-d:, -d - 1 :] = sub_matrix_raw[-d:, -d - 1 :]
 
-        # number of repeats
-        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
-
         # generate full matrix from the submatrix
         # Convert to csr_matrix so that we can take the index
         # (row-slicing), which is not supported by the default kron
@@ -364,7 +386,7 @@ class SpectralVolume(pybamm.FiniteVolume):
         # but this should not be an issue.
         matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
 
-        return pybamm.Matrix(matrix)
+        return self._cache_operator(key, pybamm.Matrix(matrix))
 
     def penalty_matrix(self, domains):
         """
@@ -385,6 +407,20 @@ class SpectralVolume(pybamm.FiniteVolume):
         """
         submesh = self.mesh[domains["primary"]]
 
+        # number of repeats
+        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
+
+        # return the matrix if it has already been built for this mesh
+        key = (
+            "SpectralVolume.penalty_matrix",
+            submesh,
+            second_dim_repeats,
+            self.order,
+        )
+        cached_matrix = self._get_cached_operator(key)
+        if cached_matrix is not None:
+            return cached_matrix
+
         # Create 1D matrix using submesh
         n = submesh.npts
         d = self.order
@@ -398,9 +434,6 @@ class SpectralVolume(pybamm.FiniteVolume):
             ]
         )
 
-        # number of repeats
-        second_dim_repeats = self._get_auxiliary_domain_repeats(domains)
-
         # generate full matrix from the submatrix
         # Convert to csr_matrix so that we can take the index
         # (row-slicing), which is not supported by the default kron
@@ -408,7 +441,7 @@ class SpectralVolume(pybamm.FiniteVolume):
         # this should not be an issue.
         matrix = csr_matrix(kron(eye(second_dim_repeats), sub_matrix))
 
-        return pybamm.Matrix(matrix)
+        return self._cache_operator(key, pybamm.Matrix(matrix))
 
     # def spectral_volume_internal_neumann_condition(
     #    self, left_symbol_disc, right_symbol_disc, left_mesh, right_mesh
@@ -1,4 +1,3 @@
-from posthog import Posthog
 import pybamm
 import sys
 
@@ -12,23 +11,36 @@ class MockTelemetry:
         pass
 
 
-if pybamm.config.check_opt_out():
-    _posthog = MockTelemetry()
-else:  # pragma: no cover
-    _posthog = Posthog(
-        # this is the public, write only API key, so it's ok to include it here
-        project_api_key="phc_acTt7KxmvBsAxaE0NyRd5WfJyNxGvBq1U9HnlQSztmb",
-        host="https://us.i.posthog.com",
-    )
-    _posthog.log.setLevel("CRITICAL")
+# the client is only created when first needed, since importing posthog is slow
+_posthog = None
+
+
+def _get_client():
+    global _posthog
+    if _posthog is None:
+        if pybamm.config.check_opt_out():
+            _posthog = MockTelemetry()
+        else:  # pragma: no cover
+            from posthog import Posthog
+
+            _posthog = Posthog(
+                # this is the public, write only API key, so it's ok to include it here
+                project_api_key="phc_acTt7KxmvBsAxaE0NyRd5WfJyNxGvBq1U9HnlQSztmb",
+                host="https://us.i.posthog.com",
+            )
+            _posthog.log.setLevel("CRITICAL")
+    return _posthog
 
 
 def disable():
+    global _posthog
+    if _posthog is None:
+        _posthog = MockTelemetry()
     _posthog.disabled = True
 
 
 def capture(event):  # pragma: no cover
-    if pybamm.config.is_running_tests() or _posthog.disabled:
+    if pybamm.config.is_running_tests() or _get_client().disabled:
         return
 
     if pybamm.config.check_opt_out():
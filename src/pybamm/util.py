@@ -186,6 +186,302 @@ class FuzzyDict(dict):
         return FuzzyDict(super().copy())
 
 
+class LazyFuzzyDict(FuzzyDict):
+    """
+    A :class:`FuzzyDict` whose values are processed when they are first accessed.
+
+    The dictionary stores unprocessed values, and replaces each one by the result of
+    a pipeline of processing steps, each called as ``process(key, value)``, the first
+    time it is accessed by key. Further steps can be added with :meth:`then`, which
+    does not process any value. Methods that return all the values (e.g.
+    :meth:`values`, :meth:`items`, comparisons and pickling) process all the
+    remaining values first, except that a dictionary returned by :meth:`detached`
+    is pickled without processing any value. Values set after creation are assumed
+    to be processed already.
+
+    Parameters
+    ----------
+    unprocessed : dict, optional
+        The unprocessed values
+    process : callable, optional
+        The function used to process a value, called with its key and the
+        unprocessed value
+    deferred_symbols : list, optional
+        For processing steps that change which symbols the values contain (e.g.
+        setting parameter values), symbols that contain the same symbols as the
+        processed values, which are used instead of the unprocessed values by
+        :meth:`values_without_processing`
+
+    Examples
+    --------
+    >>> d = pybamm.LazyFuzzyDict({"a": 1, "b": 2}, lambda key, value: 10 * value)
+    >>> d.is_processed("a")
+    False
+    >>> d["a"]
+    10
+    >>> d.is_processed("a")
+    True
+    >>> d = d.then(lambda key, value: value + 1)
+    >>> d["a"], d["b"]
+    (11, 21)
+    """
+
+    def __init__(self, unprocessed=None, process=None, deferred_symbols=None):
+        super().__init__(unprocessed or {})
+        self._pipeline = []
+        # index of the next step of the pipeline to apply to each unprocessed value
+        self._next_step = {}
+        # symbols standing in for the values processed by each step, by index
+        self._deferred_symbols = {}
+        if process is not None:
+            self._add_step(process, deferred_symbols, self.keys())
+
+    def _add_step(self, process, deferred_symbols, keys):
+        index = len(self._pipeline)
+        self._pipeline.append(process)
+        for key in keys:
+            self._next_step.setdefault(key, index)
+        if deferred_symbols is not None:
+            self._deferred_symbols[index] = list(deferred_symbols)
+
+    def then(self, process, deferred_symbols=None):
+        """
+        Add a processing step, applied after the existing ones.
+
+        Parameters
+        ----------
+        process : callable
+            The function used to process a value, called with its key and the
+            value processed by the existing steps
+        deferred_symbols : list, optional
+            See :class:`LazyFuzzyDict`
+
+        Returns
+        -------
+        :class:`LazyFuzzyDict`
+            A new dictionary, with the same values as this one and the extra step
+        """
+        new = self.copy()
+        new._add_step(process, deferred_symbols, new.keys())
+        return new
+
+    @property
+    def pipeline(self):
+        """The processing steps, in the order in which they are applied"""
+        return tuple(self._pipeline)
+
+    def detached(self):
+        """
+        A copy of this dictionary that only keeps the processed values and the keys
+        of the other values, without their processing steps, e.g. to pickle a model
+        whose variables are processed lazily without processing all of them. The
+        unprocessed values and a step to process them must be given with
+        :meth:`attach` before any of these values is accessed.
+
+        Returns
+        -------
+        :class:`LazyFuzzyDict`
+            A new dictionary, with the processed values of this one
+        """
+        new = LazyFuzzyDict()
+        first_step = min(self._next_step.values(), default=len(self._pipeline))
+        deferred_symbols = []
+        for key, value in dict.items(self):
+            if key in self._next_step:
+                value = None
+                new._next_step[key] = 0
+            dict.__setitem__(new, key, value)
+        for index in sorted(self._deferred_symbols):
+            if index >= first_step:
+                deferred_symbols.extend(self._deferred_symbols[index])
+        new._pipeline = [None]
+        if deferred_symbols:
+            new._deferred_symbols[0] = deferred_symbols
+        return new
+
+    def attach(self, unprocessed, process):
+        """
+        Give the unprocessed values of a dictionary returned by :meth:`detached`,
+        and the step that processes them.
+
+        Parameters
+        ----------
+        unprocessed : dict
+            The unprocessed values, which must include those of all the keys whose
+            values have not been processed
+        process : callable
+            The function used to process a value, called with its key and the
+            unprocessed value
+
+        Returns
+        -------
+        :class:`LazyFuzzyDict`
+            A new dictionary, with the values of this one and the given step
+        """
+        if not self.is_detached:
+            raise ValueError("Only a detached LazyFuzzyDict can be attached")
+        new = self.copy()
+        for key in new._next_step:
+            dict.__setitem__(new, key, unprocessed[key])
+        new._pipeline = [process]
+        return new
+
+    @property
+    def is_detached(self):
+        """Whether the processing steps have been detached, see :meth:`detached`"""
+        return self._pipeline == [None]
+
+    def is_processed(self, key):
+        """Whether the value of `key` has been processed"""
+        return key in self and key not in self._next_step
+
+    @property
+    def n_unprocessed(self):
+        """The number of values that have not been processed yet"""
+        return len(self._next_step)
+
+    def _process_item(self, key):
+        if self.is_detached:
+            raise ValueError(
+                f"Cannot process '{key}' since the processing steps have been "
+                "detached, see LazyFuzzyDict.attach"
+            )
+        value = dict.__getitem__(self, key)
+        for process in self._pipeline[self._next_step[key] :]:
+            value = process(key, value)
+        dict.__setitem__(self, key, value)
+        del self._next_step[key]
+
+    def process_all(self):
+        """Process all the values that have not been processed yet"""
+        # process in insertion order, so that the processing is deterministic
+        for key in [key for key in self.keys() if key in self._next_step]:
+            self._process_item(key)
+
+    def stored_values(self):
+        """
+        The values as they are stored, without processing them, i.e. processed or
+        unprocessed depending on whether they have been accessed.
+        """
+        return dict.values(self)
+
+    def values_without_processing(self):
+        """
+        Values that contain the same symbols (e.g. parameters) as the processed
+        values, without processing any value. These are the stored values, except
+        that the unprocessed values of steps given `deferred_symbols` are replaced
+        by those symbols.
+        """
+        values = []
+        pending_steps = set()
+        for key, value in dict.items(self):
+            next_step = self._next_step.get(key)
+            if next_step is None:
+                values.append(value)
+                continue
+            steps = [index for index in self._deferred_symbols if index >= next_step]
+            if steps:
+                pending_steps.update(steps)
+            else:
+                values.append(value)
+        for index in sorted(pending_steps):
+            values.extend(self._deferred_symbols[index])
+        return values
+
+    def __getitem__(self, key):
+        if key in self._next_step:
+            self._process_item(key)
+            return dict.__getitem__(self, key)
+        value = super().__getitem__(key)
+        # the value of a renamed key (see FuzzyDict) may not have been processed yet
+        for other_key in self._next_step:
+            if dict.__getitem__(self, other_key) is value:
+                self._process_item(other_key)
+                return dict.__getitem__(self, other_key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._next_step.pop(key, None)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._next_step.pop(key, None)
+
+    def __iter__(self):
+        # overriding __iter__ makes dict(self) and {**self} use __getitem__
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self.process_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        self.process_all()
+        return super().__repr__()
+
+    def values(self):
+        self.process_all()
+        return super().values()
+
+    def items(self):
+        self.process_all()
+        return super().items()
+
+    def pop(self, key, *args):
+        if key in self._next_step:
+            self._process_item(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        self.process_all()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        self._next_step.clear()
+
+    def copy(self):
+        new = LazyFuzzyDict()
+        dict.update(new, dict.items(self))
+        new._pipeline = self._pipeline.copy()
+        new._next_step = self._next_step.copy()
+        new._deferred_symbols = self._deferred_symbols.copy()
+        return new
+
+    def __reduce__(self):
+        if self.is_detached:
+            # keep the keys of the values that have not been processed, see detached
+            state = {
+                "_pipeline": self._pipeline,
+                "_next_step": self._next_step,
+                "_deferred_symbols": self._deferred_symbols,
+            }
+            return (LazyFuzzyDict, (dict(dict.items(self)),), state)
+        # pickle as a FuzzyDict of the processed values, which does not depend on
+        # the processing steps
+        self.process_all()
+        return (FuzzyDict, (dict(dict.items(self)),))
+
+
 class Timer:
     """
     Provides accurate timing.
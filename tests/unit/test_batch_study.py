@@ -4,6 +4,7 @@ Tests for the batch_study.py
 
 import pytest
 import os
+import numpy as np
 import pybamm
 from tempfile import TemporaryDirectory
 
@@ -92,6 +93,62 @@ class TestBatchStudy:
             ]
             assert output_experiment in experiments_list
 
+    def test_solve_parallel(self, tmp_path):
+        spm = pybamm.lithium_ion.SPM()
+        spm_uniform = pybamm.lithium_ion.SPM({"particle": "uniform profile"})
+        exp = pybamm.Experiment(
+            [("Discharge at C/5 for 10 minutes", "Rest for 10 minutes")] * 2
+        )
+        bs = pybamm.BatchStudy(
+            models={"SPM": spm, "SPM uniform": spm_uniform},
+            solvers={
+                "casadi safe": pybamm.CasadiSolver(mode="safe"),
+                "idaklu": pybamm.IDAKLUSolver(),
+            },
+            experiments={"exp": exp},
+            output_variables={"voltage": ["Voltage [V]"]},
+            permutations=True,
+        )
+        bs.solve(nproc=2, save_dir=tmp_path)
+        assert bs.sims == []
+        assert len(bs.results) == 4
+        with pytest.raises(ValueError, match="separate processes"):
+            bs.plot(show_plot=False)
+
+        # results are in the same order as the serial simulations
+        names = [
+            (result.names["models"], result.names["solvers"]) for result in bs.results
+        ]
+        assert names == [
+            ("SPM", "casadi safe"),
+            ("SPM", "idaklu"),
+            ("SPM uniform", "casadi safe"),
+            ("SPM uniform", "idaklu"),
+        ]
+        for result in bs.results:
+            assert result.names["experiments"] == "exp"
+            assert result.names["geometries"] is None
+            assert result["Voltage [V]"].shape == result.t.shape
+            assert len(result.summary_variables["Cycle number"]) == 2
+            solution = result.load()
+            np.testing.assert_array_equal(solution.t, result.t)
+
+        bs_serial = pybamm.BatchStudy(
+            models={"SPM": spm},
+            solvers={"idaklu": pybamm.IDAKLUSolver()},
+            experiments={"exp": exp},
+        )
+        bs_serial.solve()
+        np.testing.assert_allclose(
+            bs.results[1]["Voltage [V]"],
+            bs_serial.sims[0].solution["Voltage [V]"].entries,
+        )
+
+        # without saving
+        bs.solve(nproc=2)
+        with pytest.raises(ValueError, match="not saved"):
+            bs.results[0].load()
+
     def test_create_gif(self):
         with TemporaryDirectory() as dir_name:
             bs = pybamm.BatchStudy({"spm": pybamm.lithium_ion.SPM()})
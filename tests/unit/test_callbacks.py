@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 import pybamm
 import os
@@ -111,3 +112,50 @@ class TestCallbacks:
         callback.on_experiment_start(logs)
         with open("test_callback.log") as f:
             assert f.read() == ""
+
+    def test_streaming_callback(self, tmp_path):
+        model = pybamm.lithium_ion.SPM()
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C for 10 minutes", "Charge at 1C for 10 minutes")] * 4
+        )
+        sol = pybamm.Simulation(model, experiment=experiment).solve(save_at_cycles=2)
+
+        callback = callbacks.StreamingCallback(tmp_path)
+        sim = pybamm.Simulation(model, experiment=experiment)
+        streamed_sol = sim.solve(callbacks=callback, save_at_cycles=2)
+        assert streamed_sol is callback.solution
+        assert isinstance(streamed_sol, pybamm.StreamedSolution)
+        # the third cycle is not saved, so only its summary variables are kept
+        assert len(list(tmp_path.glob("cycle_*.npz"))) == 3
+        assert len(streamed_sol.cycles) == 4
+        assert streamed_sol.cycles[2] is None
+
+        np.testing.assert_array_equal(streamed_sol.t, sol.t)
+        np.testing.assert_allclose(
+            streamed_sol["Voltage [V]"], sol["Voltage [V]"].data, rtol=1e-12
+        )
+        np.testing.assert_allclose(
+            streamed_sol.summary_variables["Capacity [A.h]"],
+            sol.summary_variables["Capacity [A.h]"],
+        )
+        assert streamed_sol.termination == sol.termination
+        assert streamed_sol.last_state.t[0] == sol.t[-1]
+        for cycle, streamed_cycle in zip(sol.cycles, streamed_sol.cycles):
+            if cycle is None:
+                continue
+            assert len(streamed_cycle.steps) == len(cycle.steps)
+            np.testing.assert_array_equal(
+                streamed_cycle["Current [A]"].data, cycle["Current [A]"].data
+            )
+
+        with pytest.raises(ValueError, match="StreamingCallback"):
+            sim.solve(callbacks=callback, starting_solution=sol)
+
+        # the stored cycles are not removed by a new experiment unless asked to
+        sim = pybamm.Simulation(model, experiment=experiment)
+        with pytest.raises(ValueError, match="already contains stored cycles"):
+            sim.solve(callbacks=callbacks.StreamingCallback(tmp_path))
+        assert len(list(tmp_path.glob("cycle_*.npz"))) == 3
+        callback = callbacks.StreamingCallback(tmp_path, overwrite=True)
+        sim.solve(callbacks=callback, save_at_cycles=4)
+        assert len(list(tmp_path.glob("cycle_*.npz"))) == 2
@@ -1287,3 +1287,125 @@ class TestDiscretise:
             pybamm.ModelError, match="Variable 'b' should have expression"
         ):
             disc.process_model(model, inplace=False)
+
+    def test_reuse_discretised_symbols(self):
+        c = pybamm.Variable("c", domain=["negative electrode"])
+        d = pybamm.Variable("d")
+        e = pybamm.Variable("e")
+        flux = pybamm.grad(c)
+        shared = pybamm.div(flux)
+
+        def make_model(extra_first, bc_value):
+            model = pybamm.BaseModel()
+            rhs = {c: shared, d: -d}
+            if extra_first:
+                model.rhs = {e: -e, **rhs}
+            else:
+                model.rhs = {**rhs, e: -e}
+            model.initial_conditions = {c: 3, d: 1, e: 2}
+            model.boundary_conditions = {
+                c: {"left": (0, "Neumann"), "right": (bc_value, "Neumann")}
+            }
+            model.variables = {"Flux": flux, "d": d}
+            return model
+
+        disc = get_discretisation_for_testing()
+        disc = pybamm.Discretisation(
+            disc.mesh, disc.spatial_methods, reuse_discretised_symbols=True
+        )
+        disc.process_model(make_model(False, 0), inplace=False)
+        disc_flux = disc._discretised_symbols[flux]
+        disc_d = disc._discretised_symbols[d]
+
+        # same slices and boundary conditions: symbols are reused
+        model = disc.process_model(make_model(False, 0), inplace=False)
+        assert model.variables["Flux"] is disc_flux
+        assert model.variables["d"] is disc_d
+
+        # changing a boundary condition only rediscretises symbols that use it
+        model = disc.process_model(make_model(False, 1), inplace=False)
+        assert model.variables["Flux"] is not disc_flux
+        assert model.variables["d"] is disc_d
+
+        # changing the slices rediscretises the affected variables
+        model = disc.process_model(make_model(True, 1), inplace=False)
+        assert model.variables["d"] is not disc_d
+        y0 = model.concatenated_initial_conditions.evaluate()
+        assert model.variables["d"].evaluate(y=y0) == 1
+
+        # compare with a fresh discretisation
+        fresh_model = get_discretisation_for_testing().process_model(
+            make_model(True, 1), inplace=False
+        )
+        np.testing.assert_array_equal(
+            model.concatenated_rhs.evaluate(y=y0),
+            fresh_model.concatenated_rhs.evaluate(y=y0),
+        )
+
+        # symbols are not reused by default
+        disc = get_discretisation_for_testing()
+        disc.process_model(make_model(False, 0), inplace=False)
+        disc_flux = disc._discretised_symbols[flux]
+        model = disc.process_model(make_model(False, 0), inplace=False)
+        assert model.variables["Flux"] is not disc_flux
+
+    def test_lazy_variables(self):
+        c = pybamm.Variable("c", domain=["negative electrode"])
+        d = pybamm.Variable("d")
+        e = pybamm.Variable("e")
+        u = pybamm.InputParameter("u")
+
+        def make_model(extra_first):
+            model = pybamm.BaseModel()
+            rhs = {c: pybamm.div(pybamm.grad(c)), d: -d}
+            if extra_first:
+                model.rhs = {e: -e, **rhs}
+            else:
+                model.rhs = {**rhs, e: -e}
+            model.initial_conditions = {c: 3, d: 1, e: 2}
+            model.boundary_conditions = {
+                c: {"left": (0, "Neumann"), "right": (0, "Neumann")}
+            }
+            model.variables = {"Flux": pybamm.grad(c), "d times u": d * u}
+            return model
+
+        disc = get_discretisation_for_testing()
+        eager_model = disc.process_model(make_model(False), inplace=False)
+
+        disc = get_discretisation_for_testing()
+        disc = pybamm.Discretisation(
+            disc.mesh, disc.spatial_methods, lazy_variables=True
+        )
+        model = disc.process_model(make_model(False), inplace=False)
+        assert isinstance(model.variables, pybamm.LazyFuzzyDict)
+        # the state variables are added, as for eager discretisation
+        assert set(model.variables) == set(eager_model.variables)
+        assert model.variables.n_unprocessed == 5
+
+        # finding the input parameters does not discretise the variables
+        assert model.input_parameters == [u]
+        assert model.variables.n_unprocessed == 5
+
+        # processing another model, with different slices, does not change how the
+        # variables of the first model are discretised
+        other_model = disc.process_model(make_model(True), inplace=False)
+        y0 = model.concatenated_initial_conditions.evaluate()
+        for name in ["Flux", "d times u"]:
+            assert not model.variables.is_processed(name)
+            np.testing.assert_array_equal(
+                model.variables[name].evaluate(y=y0, inputs={"u": 2}),
+                eager_model.variables[name].evaluate(y=y0, inputs={"u": 2}),
+            )
+            assert model.variables.is_processed(name)
+        assert model.variables.n_unprocessed == 3
+        assert other_model.variables.n_unprocessed == 5
+        other_y0 = other_model.concatenated_initial_conditions.evaluate()
+        assert other_model.variables["d times u"].evaluate(
+            y=other_y0, inputs={"u": 2}
+        ) == pytest.approx(2)
+
+        # the variables are discretised when the model is solved
+        solution = pybamm.ScipySolver().solve(model, [0, 1], inputs={"u": 2})
+        np.testing.assert_allclose(
+            solution["d times u"].entries, 2 * np.exp(-solution.t), rtol=1e-3
+        )
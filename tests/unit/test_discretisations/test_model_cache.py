@@ -0,0 +1,206 @@
+#
+# Tests for the on-disk model cache
+#
+import os
+import subprocess
+import sys
+
+import pytest
+import numpy as np
+
+import pybamm
+
+
+class TestModelCache:
+    def _key(self, cache, model=None, parameter_values=None, var_pts=None):
+        model = model or pybamm.lithium_ion.SPM()
+        parameter_values = parameter_values or model.default_parameter_values
+        return cache.key(
+            model,
+            parameter_values,
+            model.default_geometry,
+            model.default_submesh_types,
+            var_pts or model.default_var_pts,
+            model.default_spatial_methods,
+        )
+
+    def test_key(self, tmp_path):
+        cache = pybamm.ModelCache(tmp_path)
+        key = self._key(cache)
+        # same inputs, new objects
+        assert self._key(cache) == key
+
+        # different options
+        model = pybamm.lithium_ion.SPM({"thermal": "lumped"})
+        assert self._key(cache, model=model) != key
+
+        # different parameter values
+        parameter_values = pybamm.ParameterValues("Chen2020")
+        assert self._key(cache, parameter_values=parameter_values) != key
+        parameter_values = pybamm.lithium_ion.SPM().default_parameter_values
+        parameter_values["Current function [A]"] = 2
+        assert self._key(cache, parameter_values=parameter_values) != key
+
+        # different mesh
+        var_pts = pybamm.lithium_ion.SPM().default_var_pts
+        var_pts["r_n"] = 7
+        assert self._key(cache, var_pts=var_pts) != key
+
+    def test_key_custom_model(self, tmp_path):
+        cache = pybamm.ModelCache(tmp_path)
+
+        def make_model(rate):
+            model = pybamm.BaseModel()
+            v = pybamm.Variable("v")
+            model.rhs = {v: -rate * v}
+            model.initial_conditions = {v: 1}
+            return model
+
+        assert self._key(cache, model=make_model(1)) == self._key(
+            cache, model=make_model(1)
+        )
+        assert self._key(cache, model=make_model(1)) != self._key(
+            cache, model=make_model(2)
+        )
+
+    def test_key_variables(self, tmp_path):
+        cache = pybamm.ModelCache(tmp_path)
+
+        def make_model(k):
+            model = pybamm.BaseModel()
+            v = pybamm.Variable("v")
+            model.rhs = {v: -v}
+            model.initial_conditions = {v: 1}
+            model.variables = {"out": k * v}
+            return model
+
+        # only the expression of a variable changes
+        assert self._key(cache, model=make_model(2)) != self._key(
+            cache, model=make_model(5)
+        )
+
+        # models built through the same cache keep their own variables
+        outputs = []
+        for k in [2, 5]:
+            sim = pybamm.Simulation(
+                make_model(k),
+                geometry={},
+                parameter_values=pybamm.ParameterValues({}),
+                submesh_types={},
+                var_pts={},
+                spatial_methods={},
+                solver=pybamm.ScipySolver(),
+                model_cache=cache,
+            )
+            outputs.append(sim.solve([0, 1])["out"].entries[0])
+        assert cache.misses == 2
+        assert outputs == [2, 5]
+
+    def test_save_load_clear(self, tmp_path):
+        cache = pybamm.ModelCache(tmp_path)
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v")
+        model.rhs = {v: -v}
+        model.initial_conditions = {v: 1}
+
+        key = self._key(cache, model=model, parameter_values=pybamm.ParameterValues({}))
+        assert key not in cache
+        assert cache.load(key) is None
+        assert cache.misses == 1
+
+        with pytest.raises(pybamm.ModelError, match="discretised"):
+            cache.save(key, model)
+
+        disc = pybamm.Discretisation()
+        disc.process_model(model)
+        cache.save(key, model)
+        assert key in cache
+        loaded_model, mesh = cache.load(key)
+        assert cache.hits == 1
+        assert mesh is None
+        assert loaded_model.is_discretised
+        assert loaded_model.len_rhs == 1
+
+        cache.clear()
+        assert key not in cache
+
+    def test_simulation_build(self, tmp_path):
+        cache = pybamm.ModelCache(tmp_path)
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), model_cache=cache)
+        sol = sim.solve([0, 600])
+        assert cache.misses == 1
+
+        sim_cached = pybamm.Simulation(
+            pybamm.lithium_ion.SPM(), model_cache=str(tmp_path)
+        )
+        sol_cached = sim_cached.solve([0, 600])
+        assert sim_cached._model_cache.hits == 1
+        assert sim_cached.mesh is not None
+        assert sim_cached._disc.mesh is sim_cached.mesh
+        # the parameters are only set once the parameterised model is accessed
+        assert sim_cached._model_with_set_params is None
+        np.testing.assert_array_equal(
+            sol["Voltage [V]"].entries, sol_cached["Voltage [V]"].entries
+        )
+        assert sim_cached._disc.y_slices.keys() == sim._disc.y_slices.keys()
+        assert sim_cached.model is sim_cached.model_with_set_params
+        assert not sim_cached.model.is_discretised
+        assert sim_cached.model.parameters == []
+
+        # changing the parameter values misses the cache
+        parameter_values = pybamm.ParameterValues("Marquis2019")
+        parameter_values["Current function [A]"] = 1
+        sim_other = pybamm.Simulation(
+            pybamm.lithium_ion.SPM(),
+            parameter_values=parameter_values,
+            model_cache=cache,
+        )
+        sim_other.build()
+        assert cache.misses == 2
+
+    def test_simulation_build_lazy_variables(self, tmp_path):
+        # variables that are not processed when the model is built are also left
+        # unprocessed in the cache
+        cache = pybamm.ModelCache(tmp_path)
+        sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), model_cache=cache)
+        sim.build()
+        assert isinstance(sim.built_model.variables, pybamm.LazyFuzzyDict)
+        assert sim.built_model.variables.n_unprocessed > 0
+
+        name = "Negative particle surface concentration [mol.m-3]"
+        for lazy_variables in [True, False]:
+            sim_cached = pybamm.Simulation(
+                pybamm.lithium_ion.SPM(),
+                model_cache=cache,
+                lazy_variables=lazy_variables,
+            )
+            sim_cached.build()
+            variables = sim_cached.built_model.variables
+            assert isinstance(variables, pybamm.LazyFuzzyDict)
+            assert (variables.n_unprocessed > 0) is lazy_variables
+            assert variables[name] == sim.built_model.variables[name]
+        assert cache.hits == 2
+
+    def test_simulation_build_in_new_process(self, tmp_path):
+        # symbols are hashed differently in every process, so the variables of a
+        # model loaded by another process are discretised again in that process
+        code = (
+            "import sys, pybamm; "
+            "sim = pybamm.Simulation(pybamm.lithium_ion.SPM(), model_cache=sys.argv[1]); "
+            "sol = sim.solve([0, 600]); "
+            "print(sim._model_cache.hits, "
+            "*sol['Voltage [V]'].entries[[0, -1]], "
+            "*sol['Negative particle surface concentration [mol.m-3]'].entries[[0, -1], -1])"
+        )
+        outputs = [
+            subprocess.run(
+                [sys.executable, "-c", code, str(tmp_path)],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYBAMM_DISABLE_TELEMETRY": "true"},
+            ).stdout.split()
+            for _ in range(2)
+        ]
+        assert [output[0] for output in outputs] == ["0", "1"]
+        assert outputs[0][1:] == outputs[1][1:]
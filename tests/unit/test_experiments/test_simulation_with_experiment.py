@@ -527,6 +527,35 @@ class TestSimulationExperiment:
         # Summary variables are not None
         assert sol.summary_variables["Capacity [A.h]"] is not None
 
+    def test_slowest_steps(self):
+        experiment = pybamm.Experiment(
+            [("Discharge at 1C until 3.3V", "Charge at 1C until 4.1 V")] * 2
+        )
+        model = pybamm.lithium_ion.SPM()
+        sim = pybamm.Simulation(model, experiment=experiment)
+        with pytest.raises(ValueError, match="No step statistics"):
+            sim.slowest_steps()
+        sol = sim.solve(solver=pybamm.CasadiSolver("fast with events"))
+
+        steps = sim.slowest_steps(n=3)
+        assert len(steps) == 3
+        assert list(steps["total_time"]) == sorted(steps["total_time"], reverse=True)
+        steps = sim.slowest_steps(n=None)
+        assert len(steps) == 4
+        assert set(zip(steps["cycle"], steps["step"])) == {
+            (1, 1),
+            (1, 2),
+            (2, 1),
+            (2, 2),
+        }
+        assert "Charge at 1C until 4.1 V" in list(steps["operating conditions"])
+
+        # the statistics of the steps add up to those of the cycles and solution
+        for cycle_num, cycle in enumerate(sol.cycles, start=1):
+            cycle_steps = steps[steps["cycle"] == cycle_num]
+            assert cycle_steps["n_steps"].sum() == cycle.statistics.n_steps
+        assert steps["n_rhs_evaluations"].sum() == sol.statistics.n_rhs_evaluations
+
     def test_cycle_summary_variables(self):
         # Test cycle_summary_variables works for different combinations of data and
         # function OCPs
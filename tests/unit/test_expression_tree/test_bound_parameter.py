@@ -0,0 +1,39 @@
+#
+# Tests for the BoundParameter class
+#
+import casadi
+import numpy as np
+import pytest
+
+import pybamm
+
+
+class TestBoundParameter:
+    def test_bound_parameter(self):
+        a = pybamm.BoundParameter(2, "a")
+        assert a.evaluate() == 2
+        assert str(a) == "a"
+        assert not a.is_constant()
+        assert a.create_copy() is a
+        with pytest.raises(ValueError, match="new children"):
+            a.create_copy(new_children=[pybamm.Scalar(1)])
+
+        # not simplified away, unlike a scalar
+        expr = 3 * a
+        assert isinstance(expr, pybamm.Multiplication)
+        assert expr.evaluate() == 6
+
+        # changing the value does not change the id
+        a_id = a.id
+        a.value = 4
+        assert a.id == a_id
+        assert expr.evaluate() == 12
+
+    def test_convert(self):
+        a = pybamm.BoundParameter(2, "a")
+        expr = a * pybamm.StateVector(slice(0, 1))
+        y = casadi.MX.sym("y")
+        casadi_fn = casadi.Function("f", [y], [expr.to_casadi(y=y)])
+        assert casadi_fn(3) == 6
+        python_fn = pybamm.EvaluatorPython(expr)
+        np.testing.assert_array_equal(python_fn(y=np.array([[3]])), 6)
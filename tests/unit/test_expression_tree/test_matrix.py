@@ -58,3 +58,83 @@ class TestMatrix:
         assert arr.to_json() == json_dict
 
         assert pybamm.Matrix._from_json(json_dict) == arr
+
+
+class TestBlockDiagonalMatrix:
+    def setup_method(self):
+        self.block = np.array([[1.0, 2.0, 0.0], [0.0, 3.0, 4.0]])
+        self.mat = pybamm.BlockDiagonalMatrix(csr_matrix(self.block), 3)
+        self.full = np.kron(np.eye(3), self.block)
+
+    def test_block_diagonal_matrix(self):
+        assert self.mat.repeats == 3
+        np.testing.assert_array_equal(self.mat.block.toarray(), self.block)
+        assert self.mat.shape == (6, 9)
+        assert self.mat.ndim == 2
+        assert self.mat.size == 54
+        assert self.mat.name == "Block diagonal matrix (6, 9)"
+        np.testing.assert_array_equal(self.mat.entries.toarray(), self.full)
+        np.testing.assert_array_equal(self.mat.evaluate().toarray(), self.full)
+        assert self.mat.evaluate_for_shape().shape == (6, 9)
+
+        # dense and list blocks
+        for block in [self.block, self.block.tolist()]:
+            mat = pybamm.BlockDiagonalMatrix(block, 3)
+            np.testing.assert_array_equal(mat.entries.toarray(), self.full)
+
+        # the id depends on the block and the number of repeats
+        assert pybamm.BlockDiagonalMatrix(csr_matrix(self.block), 3) == self.mat
+        assert pybamm.BlockDiagonalMatrix(csr_matrix(self.block), 2) != self.mat
+        assert pybamm.BlockDiagonalMatrix(csr_matrix(2 * self.block), 3) != self.mat
+        assert self.mat.create_copy() == self.mat
+
+    def test_matmul(self):
+        for x in [np.arange(9.0).reshape(9, 1), np.arange(27.0).reshape(9, 3)]:
+            np.testing.assert_array_equal(self.mat.matmul(x), self.full @ x)
+            np.testing.assert_array_equal(
+                (self.mat @ pybamm.Matrix(x)).evaluate(), self.full @ x
+            )
+        y = pybamm.StateVector(slice(0, 9))
+        y_eval = np.linspace(1, 2, 9)
+        np.testing.assert_allclose(
+            (self.mat @ y).evaluate(y=y_eval), (self.full @ y_eval)[:, np.newaxis]
+        )
+        # jacobian keeps the block structure
+        jac = (self.mat @ y).jac(y)
+        np.testing.assert_array_equal(jac.evaluate().toarray(), self.full)
+
+    def test_simplifications(self):
+        block = self.block
+        for expr, expected in [
+            (2 * self.mat, 2 * block),
+            (self.mat * 2, 2 * block),
+            (self.mat / 2, block / 2),
+            (-self.mat, -block),
+            (pybamm.Vector([1.0, 2.0] * 3) * self.mat, np.array([[1], [2]]) * block),
+        ]:
+            assert isinstance(expr, pybamm.BlockDiagonalMatrix)
+            assert expr.repeats == 3
+            np.testing.assert_array_equal(expr.block.toarray(), expected)
+
+        other = pybamm.BlockDiagonalMatrix(np.ones((3, 2)), 3)
+        expr = self.mat @ other
+        assert isinstance(expr, pybamm.BlockDiagonalMatrix)
+        np.testing.assert_array_equal(expr.block, block @ np.ones((3, 2)))
+
+        # a vector that does not repeat with the blocks gives a full matrix
+        expr = pybamm.Vector(np.arange(6.0)) * self.mat
+        assert not isinstance(expr, pybamm.BlockDiagonalMatrix)
+        np.testing.assert_array_equal(
+            expr.evaluate().toarray(), np.arange(6.0)[:, np.newaxis] * self.full
+        )
+
+        assert pybamm.is_matrix_zero(pybamm.BlockDiagonalMatrix(np.zeros((2, 2)), 3))
+        assert not pybamm.is_matrix_zero(self.mat)
+        assert not pybamm.is_matrix_one(pybamm.BlockDiagonalMatrix(np.ones((2, 2)), 3))
+        assert pybamm.is_matrix_one(pybamm.BlockDiagonalMatrix(np.ones((2, 2)), 1))
+
+    def test_to_from_json(self):
+        for mat in [self.mat, pybamm.BlockDiagonalMatrix(self.block, 3)]:
+            json_dict = mat.to_json()
+            assert json_dict["repeats"] == 3
+            assert pybamm.BlockDiagonalMatrix._from_json(json_dict) == mat
@@ -101,6 +101,22 @@ class TestCasadiConverter:
             pybamm_y_dot.to_casadi(casadi_t, casadi_y, casadi_y_dot), casadi_y_dot
         )
 
+    def test_convert_block_diagonal_matrix(self):
+        casadi_y = casadi.MX.sym("y", 8)
+        pybamm_y = pybamm.StateVector(slice(0, 8))
+        y_eval = np.linspace(1, 2, 8)
+        block = np.arange(6.0).reshape(3, 2)
+        mat = pybamm.BlockDiagonalMatrix(block, 4)
+        expr = mat @ pybamm_y
+        f = casadi.Function("f", [casadi_y], [expr.to_casadi(y=casadi_y)])
+        np.testing.assert_allclose(
+            f(y_eval).full(), np.kron(np.eye(4), block) @ y_eval[:, np.newaxis]
+        )
+        # the block diagonal matrix on its own
+        np.testing.assert_array_equal(
+            casadi.evalf(mat.to_casadi()).full(), np.kron(np.eye(4), block)
+        )
+
     def test_special_functions(self):
         a = pybamm.Array(np.array([1, 2, 3, 4, 5]))
         self.assert_casadi_equal(pybamm.max(a).to_casadi(), casadi.MX(5), evalf=True)
@@ -343,6 +359,26 @@ class TestCasadiConverter:
             casadi_inputs["Input 2"] * casadi_y,
         )
 
+    def test_reuse_converted_symbols(self):
+        y = casadi.MX.sym("y", 2)
+        sv = pybamm.StateVector(slice(0, 2))
+        shared = pybamm.exp(sv) * 2
+        converter = pybamm.CasadiConverter()
+        first = converter.convert(shared + 1, None, y, None, {})
+        assert converter.n_converted == 6
+        assert converter.n_reused == 0
+
+        # the shared subexpression is converted once and reused in both expressions
+        second = converter.convert(shared - sv, None, y, None, {})
+        assert converter.n_converted == 7
+        assert converter.n_reused == 2
+        y_val = np.array([1, 2])
+        f = casadi.Function("f", [y], [first, second])
+        np.testing.assert_allclose(f(y_val)[0].full().flatten(), 2 * np.exp(y_val) + 1)
+        np.testing.assert_allclose(
+            f(y_val)[1].full().flatten(), 2 * np.exp(y_val) - y_val
+        )
+
     def test_errors(self):
         y = pybamm.StateVector(slice(0, 10))
         with pytest.raises(
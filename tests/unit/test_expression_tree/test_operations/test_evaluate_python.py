@@ -10,6 +10,7 @@ import numpy as np
 import scipy.sparse
 from collections import OrderedDict
 import re
+import pickle
 
 if pybamm.has_jax():
     import jax
@@ -445,6 +446,101 @@ class TestEvaluate:
             result = evaluator(t=t, y=y)
             np.testing.assert_allclose(result, expr.evaluate(t=t, y=y))
 
+    def test_evaluator_python_batch(self):
+        a = pybamm.StateVector(slice(0, 1))
+        b = pybamm.StateVector(slice(1, 3))
+        v = pybamm.StateVector(slice(0, 3))
+        A = pybamm.Matrix(scipy.sparse.csr_matrix(np.array([[1, 0, 2], [0, 4, 0]])))
+        u = pybamm.InputParameter("u")
+        t_eval = np.array([0.5, 1, 2, 3])
+        y_eval = np.array([[2, 1, 0, -1], [3, 3, 2, 1], [4, 2, 1, 0]], dtype=float)
+
+        exprs = [
+            a * b + pybamm.t,
+            A @ v * pybamm.t + u,
+            pybamm.exp(b) / a,
+            pybamm.NumpyConcatenation(a, pybamm.Vector([5, 6]), pybamm.t * b),
+            pybamm.maximum(b, pybamm.Vector([2.5, 2.5])),
+            pybamm.min(v) + pybamm.max(A @ v),
+            pybamm.Index(A @ v, 1),
+            pybamm.t * pybamm.Vector([1, 2]),
+            pybamm.Vector([1, 2]),
+            pybamm.Scalar(3),
+            # a matrix that depends on y, so evaluated one time at a time
+            (a * A) @ v,
+        ]
+        for expr in exprs:
+            evaluator = pybamm.EvaluatorPython(expr)
+            result = evaluator.evaluate_batch(t_eval, y_eval, inputs={"u": 2})
+            expected = np.hstack(
+                [
+                    np.reshape(expr.evaluate(t, y_eval[:, i], inputs={"u": 2}), (-1, 1))
+                    for i, t in enumerate(t_eval)
+                ]
+            )
+            assert result.shape == expected.shape
+            np.testing.assert_allclose(result, expected)
+
+        # a scalar time is used for all the states
+        evaluator = pybamm.EvaluatorPython(a * b + pybamm.t)
+        np.testing.assert_allclose(
+            evaluator.evaluate_batch(1, y_eval), y_eval[0] * y_eval[1:] + 1
+        )
+
+        # the batched evaluator survives pickling
+        evaluator = pickle.loads(pickle.dumps(evaluator))
+        np.testing.assert_allclose(
+            evaluator.evaluate_batch(t_eval, y_eval), y_eval[0] * y_eval[1:] + t_eval
+        )
+
+        # matrix-valued symbols cannot be evaluated in batch
+        with pytest.raises(NotImplementedError, match="evaluate to a matrix"):
+            pybamm.to_python(a * A, batched=True)
+        with pytest.raises(ValueError, match="evaluate to a vector"):
+            pybamm.EvaluatorPython(a * A).evaluate_batch(t_eval, y_eval)
+
+    def test_evaluator_python_block_diagonal_matrix(self):
+        y = pybamm.StateVector(slice(0, 8))
+        y_eval = np.linspace(1, 2, 16).reshape(8, 2)
+        t_eval = np.array([0, 1])
+        for block in [
+            np.arange(6.0).reshape(3, 2),
+            scipy.sparse.csr_matrix(np.arange(6.0).reshape(3, 2)),
+        ]:
+            expr = pybamm.exp(pybamm.BlockDiagonalMatrix(block, 4) @ y)
+            evaluator = pybamm.EvaluatorPython(expr)
+            for i in range(2):
+                np.testing.assert_allclose(
+                    evaluator(y=y_eval[:, i]), expr.evaluate(y=y_eval[:, [i]])
+                )
+            np.testing.assert_allclose(
+                evaluator.evaluate_batch(t_eval, y_eval),
+                np.hstack([expr.evaluate(y=y_eval[:, [i]]) for i in range(2)]),
+            )
+
+        # dense blocks are multiplied without building the full matrix
+        constant_symbols = OrderedDict()
+        variable_symbols = OrderedDict()
+        pybamm.find_symbols(
+            pybamm.BlockDiagonalMatrix(block.toarray(), 4) @ y,
+            constant_symbols,
+            variable_symbols,
+        )
+        (value,) = constant_symbols.values()
+        np.testing.assert_array_equal(value, block.toarray())
+        assert "np.matmul" in next(reversed(variable_symbols.values()))
+
+    @pytest.mark.skipif(not pybamm.has_jax(), reason="jax or jaxlib is not installed")
+    def test_evaluator_jax_block_diagonal_matrix(self):
+        y = pybamm.StateVector(slice(0, 8))
+        y_eval = np.linspace(1, 2, 8)
+        block = scipy.sparse.csr_matrix(np.arange(6.0).reshape(3, 2))
+        expr = pybamm.exp(pybamm.BlockDiagonalMatrix(block, 4) @ y)
+        evaluator = pybamm.EvaluatorJax(expr)
+        np.testing.assert_allclose(
+            evaluator(y=y_eval), expr.evaluate(y=y_eval[:, np.newaxis])
+        )
+
     @pytest.mark.skipif(not pybamm.has_jax(), reason="jax or jaxlib is not installed")
     def test_find_symbols_jax(self):
         # test sparse conversion
@@ -0,0 +1,121 @@
+#
+# Tests for the adaptive mesh refinement
+#
+import pytest
+import numpy as np
+
+import pybamm
+
+
+@pytest.fixture()
+def model():
+    return pybamm.lithium_ion.SPM()
+
+
+@pytest.fixture()
+def parameter_values(model):
+    parameter_values = model.default_parameter_values
+    parameter_values["Current function [A]"] = (
+        5 * parameter_values["Nominal cell capacity [A.h]"]
+    )
+    return parameter_values
+
+
+var_pts = {"x_n": 5, "x_s": 5, "x_p": 5, "r_n": 5, "r_p": 5}
+variables = [
+    "Negative particle concentration [mol.m-3]",
+    "Positive particle concentration [mol.m-3]",
+]
+
+
+class TestAdaptiveMeshRefinement:
+    def test_gradient(self, model, parameter_values):
+        amr = pybamm.AdaptiveMeshRefinement(
+            model,
+            variables,
+            parameter_values=parameter_values,
+            var_pts=var_pts,
+            rtol=5e-2,
+            max_iterations=3,
+        )
+        solution = amr.solve([0, 500])
+        assert solution.t[-1] == 500
+
+        # the particles are refined, the electrodes are not
+        assert amr.var_pts["r_n"] > 5
+        assert amr.var_pts["r_p"] > 5
+        assert amr.var_pts["x_n"] == 5
+        assert 2 <= len(amr.history) <= 4
+        assert amr.history[0]["var_pts"] == {"r_n": 5, "r_p": 5}
+        errors = [entry["errors"]["r_n"] for entry in amr.history]
+        assert errors[-1] < errors[0]
+
+        # the final mesh is user supplied, with the smallest cells near the surface
+        generator = amr.submesh_types["negative particle"]
+        assert generator.submesh_type == pybamm.UserSupplied1DSubMesh
+        submesh = amr.simulation.mesh["negative particle"]
+        assert submesh.npts == amr.var_pts["r_n"]
+        np.testing.assert_array_equal(submesh.edges, generator.submesh_params["edges"])
+        assert submesh.edges[0] == 0
+        assert submesh.d_edges[-1] < submesh.d_edges[0]
+
+        # no refinement is needed with a large tolerance
+        amr = pybamm.AdaptiveMeshRefinement(
+            model,
+            variables,
+            parameter_values=parameter_values,
+            var_pts=var_pts,
+            rtol=1,
+        )
+        amr.solve([0, 500])
+        assert len(amr.history) == 1
+        assert amr.var_pts == var_pts
+
+    def test_richardson(self, model, parameter_values):
+        amr = pybamm.AdaptiveMeshRefinement(
+            model,
+            variables,
+            parameter_values=parameter_values,
+            var_pts=var_pts,
+            indicator="richardson",
+            rtol=1e-4,
+            max_iterations=2,
+            max_pts=8,
+            spatial_variables=["r_n"],
+        )
+        amr.solve([0, 500])
+        assert amr.var_pts["r_n"] == 8
+        assert amr.var_pts["r_p"] == 5
+        # the refinement stops when the largest number of points is reached
+        assert len(amr.history) == 2
+        assert list(amr.history[0]["errors"]) == ["r_n"]
+        assert amr.history[0]["errors"]["r_n"] > 1e-4
+
+    def test_richardson_electrode_and_particle(self):
+        # the particle concentration also depends on x, whose number of points is
+        # refined for the electrolyte concentration
+        amr = pybamm.AdaptiveMeshRefinement(
+            pybamm.lithium_ion.DFN(),
+            [
+                "Electrolyte concentration [mol.m-3]",
+                "Negative particle concentration [mol.m-3]",
+            ],
+            var_pts={"x_n": 5, "x_s": 3, "x_p": 5, "r_n": 5, "r_p": 5},
+            indicator="richardson",
+            rtol=1e-3,
+            max_iterations=1,
+        )
+        solution = amr.solve([0, 600])
+        assert solution.t[-1] == 600
+        assert list(amr.history[0]["errors"]) == ["x_n", "x_s", "x_p", "r_n"]
+        assert amr.history[0]["errors"]["x_n"] > 1e-3
+        assert amr.history[0]["errors"]["r_n"] > 1e-3
+        assert amr.var_pts["x_n"] > 5
+        assert amr.var_pts["r_n"] > 5
+        assert amr.var_pts["r_p"] == 5
+        c_s_n = amr.simulation.solution["Negative particle concentration [mol.m-3]"]
+        assert c_s_n.entries.shape[:2] == (amr.var_pts["r_n"], amr.var_pts["x_n"])
+
+    def test_exceptions(self, model):
+        with pytest.raises(ValueError, match="indicator must be"):
+            pybamm.AdaptiveMeshRefinement(model, variables, indicator="bad")
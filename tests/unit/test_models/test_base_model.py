@@ -12,6 +12,7 @@ import sys
 import casadi
 import numpy as np
 from numpy import testing
+from tests import get_mesh_for_testing
 
 import pybamm
 
@@ -1278,3 +1279,88 @@ class TestBaseModel:
         new_model = pybamm.load_model("test_base_model.json")
 
         os.remove("test_base_model.json")
+
+    def test_rebind_parameters(self):
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v")
+        k = pybamm.Parameter("k")
+        model.rhs = {v: -k * v}
+        model.initial_conditions = {v: pybamm.Parameter("v0")}
+        model.variables = {"v": v, "2v": 2 * v, "kv": k * v}
+        parameter_values = pybamm.ParameterValues({"k": 1, "v0": 1})
+        parameter_values.rebindable_parameters = ["k"]
+        parameter_values.process_model(model)
+        pybamm.Discretisation().process_model(model)
+
+        solver = pybamm.ScipySolver(rtol=1e-8, atol=1e-8)
+        t_eval = np.linspace(0, 1, 10)
+        solution = solver.solve(model, t_eval)
+        solution["2v"].entries
+        solution["kv"].entries
+        np.testing.assert_allclose(solution.y[0], np.exp(-t_eval), rtol=1e-6)
+        set_up = solver._model_set_up[model]
+
+        # only the variables that use the parameter are discarded
+        model.rebind_parameters({"k": 2})
+        assert list(model._variables_casadi) == ["2v"]
+        solution = solver.solve(model, t_eval)
+        assert solver._model_set_up[model] is not set_up
+        np.testing.assert_allclose(solution.y[0], np.exp(-2 * t_eval), rtol=1e-6)
+        np.testing.assert_allclose(
+            solution["kv"].entries, 2 * np.exp(-2 * t_eval), rtol=1e-6
+        )
+
+        # the model is not set up again if no parameter has changed
+        set_up = solver._model_set_up[model]
+        solver.solve(model, t_eval)
+        assert solver._model_set_up[model] is set_up
+
+        # stepping uses the new values too
+        model.rebind_parameters({"k": 3})
+        step_solution = solver.step(None, model, 1, npts=10)
+        np.testing.assert_allclose(step_solution.y[0, -1], np.exp(-3), rtol=1e-6)
+
+        with pytest.raises(pybamm.ModelError, match="not a rebindable parameter"):
+            model.rebind_parameters({"v0": 2})
+
+    def test_initial_state_from(self):
+        mesh = get_mesh_for_testing()
+        disc = pybamm.Discretisation(
+            mesh, {"negative electrode": pybamm.FiniteVolume()}
+        )
+
+        # model to step from
+        model_from = pybamm.BaseModel()
+        a = pybamm.Variable("a", domain="negative electrode", scale=2, reference=1)
+        b = pybamm.Variable("b")
+        model_from.rhs = {a: -a, b: -b}
+        model_from.initial_conditions = {a: 3, b: 1}
+        model_from.variables = {"a": a, "b": b, "2b": 2 * b}
+        disc.process_model(model_from)
+        solution = pybamm.ScipySolver().solve(model_from, [0, 1])
+
+        # model to step to: shares "a" with a different scale and reference, swaps
+        # the order of the states and initialises "c" from a variable of model_from
+        model_to = pybamm.BaseModel()
+        c = pybamm.Variable("2b")
+        a = pybamm.Variable("a", domain="negative electrode", scale=5, reference=-2)
+        model_to.rhs = {c: -c, a: -a}
+        model_to.initial_conditions = {c: 1, a: 1}
+        model_to.variables = {"a": a, "2b": c}
+        disc = pybamm.Discretisation(
+            mesh, {"negative electrode": pybamm.FiniteVolume()}
+        )
+        disc.process_model(model_to)
+
+        y0 = model_to.initial_state_from(solution)
+        _, ics = model_to.set_initial_conditions_from(solution, return_type="ics")
+        np.testing.assert_allclose(y0, ics.evaluate(0, inputs={}), rtol=1e-12)
+        np.testing.assert_allclose(
+            5 * y0[1:, 0] - 2, solution["a"].entries[:, -1], rtol=1e-12
+        )
+
+        # the map between the two models is only computed once
+        state_transfer = model_to._state_transfers[model_from]
+        assert [var for var, _ in state_transfer.other_states] == [c]
+        model_to.initial_state_from(solution)
+        assert model_to._state_transfers[model_from] is state_transfer
@@ -78,6 +78,38 @@ class TestElectrodeSOH:
         assert sol["Up(y_0) - Un(x_0)"] == pytest.approx(Vmin, abs=1e-05)
         assert sol["Q"] == pytest.approx(Q, abs=1e-05)
 
+    def test_solve_batch(self):
+        param = pybamm.LithiumIonParameters()
+        parameter_values = pybamm.ParameterValues("Mohtat2020")
+
+        esoh_solver = pybamm.lithium_ion.ElectrodeSOHSolver(parameter_values, param)
+
+        Q_n = parameter_values.evaluate(param.n.Q_init)
+        Q_p = parameter_values.evaluate(param.p.Q_init)
+        Q_Li = parameter_values.evaluate(param.Q_Li_particles_init)
+
+        inputs_list = [
+            {"Q_Li": Q_Li * scale, "Q_n": Q_n, "Q_p": Q_p * scale}
+            for scale in [0.9, 0.95, 1]
+        ]
+        assert esoh_solver.solve_batch([]) == []
+        sols = esoh_solver.solve_batch(inputs_list)
+        assert len(sols) == 3
+        for inputs, sol in zip(inputs_list, sols):
+            expected = esoh_solver.solve(inputs)
+            assert sol.keys() == expected.keys()
+            for key in sol:
+                assert sol[key] == pytest.approx(expected[key], abs=1e-05)
+
+        # infeasible inputs are passed on to solve, which raises the error
+        with pytest.raises(ValueError, match="outside the range"):
+            esoh_solver.solve_batch(
+                [*inputs_list, {"Q_Li": 2 * (Q_n + Q_p), "Q_n": Q_n, "Q_p": Q_p}]
+            )
+
+        with pytest.raises(KeyError, match="Input parameter 'Q_Li' not found"):
+            esoh_solver.solve_batch([{"Q_n": Q_n, "Q_p": Q_p}])
+
     def test_error(self):
         param = pybamm.LithiumIonParameters()
         parameter_values = pybamm.ParameterValues("Ai2020")
@@ -192,6 +224,12 @@ class TestElectrodeSOHMSMR:
         # Check feasibility checks can be performed successfully
         esoh_solver._check_esoh_feasible(inputs)
 
+        # Check the batched solve agrees
+        sol_batch = esoh_solver.solve_batch([inputs])[0]
+        assert sol_batch.keys() == sol.keys()
+        for key in sol:
+            assert sol_batch[key] == pytest.approx(sol[key], abs=1e-05)
+
     def test_known_solution_cell_capacity(self, options):
         param = pybamm.LithiumIonParameters(options)
         parameter_values = pybamm.ParameterValues("MSMR_Example")
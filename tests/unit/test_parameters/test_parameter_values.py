@@ -982,6 +982,54 @@ class TestParameterValues:
         V = new_model.variables["Voltage [V]"]
         assert not V.has_symbol_of_classes(pybamm.Parameter)
 
+    def test_process_model_lazy_variables(self):
+        model = pybamm.BaseModel()
+        a = pybamm.Parameter("a")
+        b = pybamm.Parameter("b")
+        var = pybamm.Variable("var")
+        model.rhs = {var: -a * var}
+        model.initial_conditions = {var: 1}
+        # "b" and "c" are only used in the variables
+        c = pybamm.FunctionParameter("c", {"x": var})
+        model.variables = {"var": var, "b_var": b * var, "c_var": c}
+
+        parameter_values = pybamm.ParameterValues(
+            {"a": 1, "b": "[input]", "c": lambda x: 2 * x + pybamm.Parameter("a")}
+        )
+        new_model = parameter_values.process_model(
+            model, inplace=False, lazy_variables=True
+        )
+        assert isinstance(new_model.variables, pybamm.LazyFuzzyDict)
+        assert new_model.variables.n_unprocessed == 3
+        # the input parameters are found without processing the variables
+        assert new_model.input_parameters == [pybamm.InputParameter("b")]
+        assert new_model.parameters == [pybamm.InputParameter("b")]
+        assert new_model.variables.n_unprocessed == 3
+
+        # the variables are processed with the parameter values at the time the
+        # model was processed
+        parameter_values.update({"a": 5})
+        assert new_model.variables["b_var"] == pybamm.InputParameter("b") * var
+        scalars = [
+            x.value
+            for x in new_model.variables["c_var"].pre_order()
+            if isinstance(x, pybamm.Scalar)
+        ]
+        assert 1 in scalars and 5 not in scalars
+        assert new_model.variables.n_unprocessed == 1
+
+        # processing a lazy model chains the processing
+        model.variables = pybamm.LazyFuzzyDict(
+            {"var": 2 * var, "a_var": a * var}, lambda name, symbol: -symbol
+        )
+        new_model = parameter_values.process_model(
+            model, inplace=False, lazy_variables=True
+        )
+        assert new_model.variables.n_unprocessed == 2
+        assert new_model.variables["a_var"] == pybamm.Negate(
+            pybamm.Scalar(5, name="a") * var
+        )
+
     def test_process_empty_model(self):
         model = pybamm.BaseModel()
         parameter_values = pybamm.ParameterValues({"a": 1, "b": 2, "c": 3, "d": 42})
@@ -1038,3 +1086,27 @@ class TestParameterValues:
         )
         pv = [i for i in parameter_values]
         assert len(pv) == 5, "Should have 5 keys"
+
+    def test_rebindable_parameters(self):
+        parameter_values = pybamm.ParameterValues({"a": 1, "b": 2, "c": "[input]"})
+        a = pybamm.Parameter("a")
+        b = pybamm.FunctionParameter("b", {"x": pybamm.Scalar(1)})
+        assert isinstance(parameter_values.process_symbol(a), pybamm.Scalar)
+
+        # changing the rebindable parameters clears the processed symbols
+        parameter_values.rebindable_parameters = ["a", "b"]
+        assert parameter_values.rebindable_parameters == {"a", "b"}
+        processed_a = parameter_values.process_symbol(a)
+        assert isinstance(processed_a, pybamm.BoundParameter)
+        assert processed_a.name == "a"
+        assert isinstance(parameter_values.process_symbol(b), pybamm.BoundParameter)
+        assert isinstance(parameter_values.process_symbol(a + 1), pybamm.Addition)
+        assert parameter_values.copy().rebindable_parameters == {"a", "b"}
+
+        parameter_values.rebindable_parameters = ["c"]
+        with pytest.raises(TypeError, match="cannot be rebound"):
+            parameter_values.process_symbol(pybamm.Parameter("c"))
+        with pytest.raises(TypeError, match="cannot be rebound"):
+            parameter_values.process_symbol(
+                pybamm.FunctionParameter("c", {"x": pybamm.Scalar(1)})
+            )
@@ -84,6 +84,31 @@ class TestSimulation:
         with pytest.raises(ValueError, match="starting_solution"):
             sim.solve(starting_solution=sol)
 
+    def test_solve_lazy_variables(self):
+        model = pybamm.lithium_ion.SPM()
+        parameter_values = model.default_parameter_values
+        # the nominal capacity is only used in the variables
+        parameter_values["Nominal cell capacity [A.h]"] = "[input]"
+        inputs = {"Nominal cell capacity [A.h]": 2}
+        sim = pybamm.Simulation(model, parameter_values=parameter_values)
+        sim.build()
+        variables = sim.built_model.variables
+        assert isinstance(variables, pybamm.LazyFuzzyDict)
+        assert variables.n_unprocessed == len(variables)
+        assert [p.name for p in sim.built_model.input_parameters] == [
+            "Nominal cell capacity [A.h]"
+        ]
+        sol = sim.solve([0, 600], inputs=inputs)
+
+        sim_eager = pybamm.Simulation(
+            model, parameter_values=parameter_values, lazy_variables=False
+        )
+        sim_eager.build()
+        assert not isinstance(sim_eager.built_model.variables, pybamm.LazyFuzzyDict)
+        sol_eager = sim_eager.solve([0, 600], inputs=inputs)
+        for name in ["Voltage [V]", "C-rate"]:
+            np.testing.assert_allclose(sol[name].data, sol_eager[name].data)
+
     def test_solve_remove_independent_variables_from_rhs(self):
         sim = pybamm.Simulation(
             pybamm.lithium_ion.SPM(),
@@ -345,6 +370,76 @@ class TestSimulation:
             sim.solution.all_inputs[0]["Current function [A]"], 1
         )
 
+    def test_sweep(self):
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        param.update({"Current function [A]": "[input]"})
+        sim = pybamm.Simulation(
+            model, parameter_values=param, output_variables=["Voltage [V]"]
+        )
+        t_eval = np.linspace(0, 600, 7)
+        outputs = sim.sweep(t_eval, {"Current function [A]": [1, 2]})
+        assert outputs["Voltage [V]"].shape == (2, 7)
+
+        sol = sim.solve(t_eval=t_eval, inputs={"Current function [A]": 2})
+        np.testing.assert_allclose(
+            outputs["Voltage [V]"][1], sol["Voltage [V]"].entries, rtol=1e-5
+        )
+        outputs = sim.sweep(
+            t_eval, {"Current function [A]": [1, 2]}, solver=pybamm.IDAKLUSolver()
+        )
+        np.testing.assert_allclose(
+            outputs["Voltage [V]"][1], sol["Voltage [V]"].entries, rtol=1e-4
+        )
+
+        sim = pybamm.Simulation(
+            model, experiment=pybamm.Experiment(["Discharge at 1C for 1 minute"])
+        )
+        with pytest.raises(NotImplementedError, match="experiments"):
+            sim.sweep(t_eval, {"Current function [A]": [1]}, ["Voltage [V]"])
+
+    def test_rebind_parameters(self):
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        param.rebindable_parameters = [
+            "Current function [A]",
+            "Ambient temperature [K]",
+        ]
+        sim = pybamm.Simulation(model, parameter_values=param)
+        with pytest.raises(ValueError, match="must be built"):
+            sim.rebind_parameters({"Current function [A]": 2})
+
+        t_eval = np.linspace(0, 600, 7)
+        sim.solve(t_eval)
+        built_model = sim.built_model
+        sim.rebind_parameters({"Current function [A]": 2})
+        sol = sim.solve(t_eval)
+        assert sim.built_model is built_model
+        assert sim.parameter_values["Current function [A]"] == 2
+        # the parameter values passed to the simulation are not changed
+        assert param["Current function [A]"] != 2
+
+        new_param = model.default_parameter_values
+        new_param["Current function [A]"] = 2
+        sol_new = pybamm.Simulation(model, parameter_values=new_param).solve(t_eval)
+        np.testing.assert_allclose(
+            sol["Voltage [V]"].entries, sol_new["Voltage [V]"].entries, rtol=1e-6
+        )
+
+        # experiment step models are rebound too
+        sim = pybamm.Simulation(
+            model,
+            parameter_values=param,
+            experiment=pybamm.Experiment(["Rest for 1 minute"]),
+        )
+        sim.build_for_experiment()
+        sim.rebind_parameters({"Ambient temperature [K]": 300})
+        for step_model in sim.steps_to_built_models.values():
+            nodes = step_model._find_bound_parameters(
+                step_model.variables_and_events.values()
+            )["Ambient temperature [K]"]
+            assert all(node.value == 300 for node in nodes)
+
     def test_solve_with_sensitivities(self):
         model = pybamm.lithium_ion.SPM()
         param = model.default_parameter_values
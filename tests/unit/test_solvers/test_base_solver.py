@@ -347,11 +347,87 @@ class TestBaseSolver:
         with pytest.raises(RuntimeError, match="already been initialised"):
             solver.solve(model2, t_eval=[0, 1])
 
+    @pytest.mark.parametrize(
+        "solver", [pybamm.ScipySolver(), pybamm.IDAKLUSolver()], ids=["scipy", "idaklu"]
+    )
+    def test_sweep(self, solver):
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v", domain="negative electrode")
+        a = pybamm.InputParameter("a")
+        b = pybamm.InputParameter("b")
+        model.rhs = {v: -a * v}
+        model.initial_conditions = {v: b}
+        model.variables = {"v": v, "v_av": pybamm.x_average(v)}
+        model.events = [pybamm.Event("v < 0.5", pybamm.x_average(v) - 0.5)]
+        geometry = {
+            "negative electrode": {
+                pybamm.standard_spatial_vars.x_n: {"min": 0, "max": 1}
+            }
+        }
+        mesh = pybamm.Mesh(
+            geometry,
+            {"negative electrode": pybamm.Uniform1DSubMesh},
+            {pybamm.standard_spatial_vars.x_n: 3},
+        )
+        disc = pybamm.Discretisation(
+            mesh, {"negative electrode": pybamm.FiniteVolume()}
+        )
+        disc.process_model(model)
+
+        t_eval = np.linspace(0, 1, 11)
+        table = np.array([[0.1, 1], [0.2, 2], [2, 1]])
+        outputs = solver.sweep(
+            model, t_eval, table, ["v", "v_av"], input_names=["a", "b"], chunk_size=2
+        )
+        assert outputs["v"].shape == (3, 3, 11)
+        expected = table[:, 1:] * np.exp(-table[:, :1] * t_eval)
+        np.testing.assert_allclose(outputs["v_av"][:2], expected[:2], rtol=1e-3)
+        np.testing.assert_allclose(outputs["v"][:2, 0], expected[:2], rtol=1e-3)
+
+        # the last row stops at the event, after which the outputs are NaN
+        t_event = np.log(2) / 2
+        assert np.all(np.isnan(outputs["v_av"][2, t_eval > t_event + 0.01]))
+
+        # the same in a pool of processes, with a dict of inputs
+        outputs_pool = solver.sweep(
+            model,
+            t_eval,
+            {"a": table[:, 0], "b": table[:, 1]},
+            ["v_av"],
+            nproc=2,
+        )
+        np.testing.assert_allclose(
+            outputs_pool["v_av"], outputs["v_av"], rtol=1e-3, equal_nan=True
+        )
+
+        # a failed row is NaN
+        with pytest.warns(pybamm.SolverWarning, match="1 of 1 sets of inputs"):
+            outputs = solver.sweep(model, t_eval, {"a": [1], "b": [0.1]}, ["v_av"])
+        assert np.all(np.isnan(outputs["v_av"]))
+
+        # a failed first chunk does not change the shape of the later ones
+        with pytest.warns(pybamm.SolverWarning, match="1 of 2 sets of inputs"):
+            outputs = solver.sweep(
+                model, t_eval, {"a": [1, 0.1], "b": [0.1, 1]}, ["v"], chunk_size=1
+            )
+        assert outputs["v"].shape == (2, 3, 11)
+        assert np.all(np.isnan(outputs["v"][0]))
+        np.testing.assert_allclose(outputs["v"][1, 0], expected[0], rtol=1e-3)
+
+        with pytest.raises(ValueError, match="input_names"):
+            solver.sweep(model, t_eval, table, ["v"])
+        with pytest.raises(pybamm.SolverError, match="No value provided for input 'b'"):
+            solver.sweep(model, t_eval, {"a": [1]}, ["v"])
+        with pytest.raises(ValueError, match="output variable"):
+            solver.sweep(model, t_eval, table, [], input_names=["a", "b"])
+
     def test_multiprocess_context(self):
         solver = pybamm.BaseSolver()
         assert solver.get_platform_context("Win") == "spawn"
         assert solver.get_platform_context("Linux") == "fork"
         assert solver.get_platform_context("Darwin") == "fork"
+        # no solver is needed to get the context
+        assert pybamm.BaseSolver.get_platform_context("Linux") == "fork"
 
     def test_sensitivities(self):
         def exact_diff_a(y, a, b):
@@ -30,6 +30,15 @@ class TestCasadiAlgebraicSolver:
         solution = solver.solve(model, np.linspace(0, 1, 10))
         np.testing.assert_array_equal(solution.y, -2)
 
+        # the rootfinder is reused while the model is unchanged
+        roots = solver._rootfinders[model][1]
+        solver.solve(model, np.linspace(0, 1, 10))
+        assert solver._rootfinders[model][1] is roots
+        solver.tol = 1e-8
+        solution = solver.solve(model, np.linspace(0, 1, 10))
+        assert solver._rootfinders[model][1] is not roots
+        np.testing.assert_array_equal(solution.y, -2)
+
     def test_simple_root_find_correct_initial_guess(self):
         # Simple system: a single algebraic equation
         var = pybamm.Variable("var")
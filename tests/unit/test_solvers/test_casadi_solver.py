@@ -105,6 +105,39 @@ class TestCasadiSolver:
         with pytest.raises(pybamm.SolverError, match="Maximum number of decreased"):
             solver.solve(model, [0, 10])
 
+    def test_integrators_maxbytes(self):
+        model = pybamm.BaseModel()
+        var = pybamm.Variable("var")
+        model.rhs = {var: -0.1 * var}
+        model.initial_conditions = {var: 1}
+        pybamm.Discretisation().process_model(model)
+
+        # unbound memory: an integrator is retained for each grid
+        solver = pybamm.CasadiSolver(mode="fast")
+        for t_end in [1, 2, 3]:
+            solver.solve(model, np.linspace(0, t_end, 10))
+        solver.solve(model, np.linspace(0, 1, 10))
+        stats = solver.integrator_stats
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 0)
+        assert (stats["models"], stats["integrators"]) == (1, 3)
+        nbytes_one = solver._integrators_nbytes(model, 1)
+        assert stats["nbytes"] == solver._integrators_nbytes(model, 3) > nbytes_one
+
+        # a budget for a single integrator: the least recently used are ejected
+        solver = pybamm.CasadiSolver(mode="fast", integrators_maxbytes=nbytes_one)
+        for t_end in [1, 2, 3]:
+            solution = solver.solve(model, np.linspace(0, t_end, 10))
+            np.testing.assert_allclose(
+                solution.y.full()[0], np.exp(-0.1 * solution.t), rtol=1e-4
+            )
+        stats = solver.integrator_stats
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (0, 3, 2)
+        assert (stats["integrators"], stats["nbytes"]) == (1, nbytes_one)
+        assert len(solver.integrators[model]) == 1
+        # the integrator of the last grid is kept
+        solver.solve(model, np.linspace(0, 3, 10))
+        assert solver.integrator_stats["hits"] == 1
+
     def test_model_solver_python(self):
         # Create model
         pybamm.set_logging_level("ERROR")
@@ -263,6 +296,75 @@ class TestCasadiSolver:
         np.testing.assert_array_less(solution.y.full()[0], 1.02 + 1e-10)
         np.testing.assert_array_almost_equal(solution.y[0, -1], 1.02, decimal=2)
 
+    @pytest.mark.parametrize("mode", ["safe", "safe without grid", "fast with events"])
+    def test_model_solver_events_interpolation(self, mode):
+        model = pybamm.BaseModel()
+        whole_cell = ["negative electrode", "separator", "positive electrode"]
+        var1 = pybamm.Variable("var1", domain=whole_cell)
+        var2 = pybamm.Variable("var2", domain=whole_cell)
+        model.rhs = {var1: 0.1 * var1}
+        model.algebraic = {var2: 2 * var1 - var2}
+        model.initial_conditions = {var1: 1, var2: 2}
+        model.events = [
+            pybamm.Event("var1 = 1.5", pybamm.min(1.5 - var1)),
+            pybamm.Event("var2 = 2.5", pybamm.min(2.5 - var2)),
+            pybamm.Event(
+                "var2 = 2.5 switch", pybamm.min(var2 - 3), pybamm.EventType.SWITCH
+            ),
+        ]
+        disc = get_discretisation_for_testing()
+        disc.process_model(model)
+
+        t_eval = np.linspace(0, 5, 100)
+        solution_grid = pybamm.CasadiSolver(mode=mode, rtol=1e-8, atol=1e-8).solve(
+            model, t_eval
+        )
+        solver = pybamm.CasadiSolver(
+            mode=mode, rtol=1e-8, atol=1e-8, event_location="interpolation"
+        )
+        solution = solver.solve(model, t_eval)
+
+        # the event is located on the trajectory (where var2 = 2.5 - 1e-5), as
+        # accurately as by integrating on a dense grid
+        t_event = 10 * np.log((2.5 - 1e-5) / 2)
+        np.testing.assert_allclose(solution.t_event[0], t_event, rtol=1e-5)
+        np.testing.assert_allclose(
+            solution.t_event[0], solution_grid.t_event[0], rtol=1e-7
+        )
+        np.testing.assert_allclose(
+            solution.y_event[:, 0],
+            np.repeat([np.exp(0.1 * t_event), 2 * np.exp(0.1 * t_event)], 100),
+            rtol=1e-5,
+        )
+        np.testing.assert_equal(solution.t_event[0], solution.t[-1])
+        assert solution.termination == "event: var2 = 2.5"
+        np.testing.assert_array_almost_equal(
+            solution.y.full()[0], np.exp(0.1 * solution.t), decimal=5
+        )
+
+        # the integrator without grid is the only one added to locate the event
+        if mode != "safe without grid":
+            assert "no grid" in solver.integrators[model]
+
+        # events that are nan between the two times around the event
+        model = pybamm.BaseModel()
+        var = pybamm.Variable("var")
+        model.rhs = {var: 0.1 * var}
+        model.initial_conditions = {var: 1}
+        model.events = [
+            pybamm.Event("event", 1.02 - var),
+            pybamm.Event("sqrt event", pybamm.sqrt(1.0199 - var)),
+        ]
+        solver = pybamm.CasadiSolver(
+            mode=mode, rtol=1e-8, atol=1e-8, event_location="interpolation"
+        )
+        solution = solver.solve(model, t_eval)
+        np.testing.assert_array_less(solution.y.full()[0], 1.02 + 1e-10)
+        np.testing.assert_array_almost_equal(solution.y[0, -1], 1.02, decimal=2)
+
+        with pytest.raises(ValueError, match="invalid event_location"):
+            pybamm.CasadiSolver(event_location="bad")
+
     def test_model_step(self):
         # Create model
         model = pybamm.BaseModel()
@@ -0,0 +1,122 @@
+#
+# Tests for models compiled ahead of time by the IDAKLU solver
+#
+import pytest
+import numpy as np
+
+import pybamm
+
+
+def spm_with_input():
+    model = pybamm.lithium_ion.SPM()
+    parameter_values = model.default_parameter_values
+    parameter_values["Current function [A]"] = "[input]"
+    sim = pybamm.Simulation(model, parameter_values=parameter_values)
+    sim.build()
+    return sim.built_model
+
+
+class TestCompiledModel:
+    def test_compile_and_solve(self, tmp_path):
+        model = spm_with_input()
+        inputs = {"Current function [A]": 1.5}
+        t_eval = [0, 3600]
+        t_interp = np.linspace(0, 3600, 50)
+
+        compiled_model = pybamm.IDAKLUSolver().compile(model, tmp_path, inputs=inputs)
+        assert compiled_model.input_names == ["Current function [A]"]
+        assert compiled_model.output_variables == []
+
+        # the model can be loaded from disk without the symbolic model
+        loaded_model = pybamm.CompiledModel(tmp_path)
+        assert loaded_model.name == model.name
+        sol = loaded_model.solve(t_eval, inputs=inputs, t_interp=t_interp)
+
+        solution = pybamm.IDAKLUSolver().solve(
+            model, t_eval, inputs=inputs, t_interp=t_interp
+        )
+        np.testing.assert_allclose(sol.t, solution.t)
+        np.testing.assert_allclose(sol.y, solution.y, rtol=1e-6, atol=1e-8)
+        assert sol.termination == solution.termination == "event: Minimum voltage [V]"
+        assert sol.inputs == inputs
+
+        # several sets of inputs
+        sols = loaded_model.solve(
+            t_eval,
+            inputs=[{"Current function [A]": 1}, {"Current function [A]": 2}],
+        )
+        assert len(sols) == 2
+        assert sols[1].t[-1] < sols[0].t[-1]
+
+        with pytest.raises(pybamm.SolverError, match="No value provided"):
+            loaded_model.solve(t_eval)
+        with pytest.raises(pybamm.SolverError, match="should have size 1"):
+            loaded_model.solve(t_eval, inputs={"Current function [A]": [1, 2]})
+
+    def test_output_variables_and_sensitivities(self, tmp_path):
+        model = spm_with_input()
+        inputs = {"Current function [A]": 1.0}
+        t_eval = [0, 1800]
+        t_interp = np.linspace(0, 1800, 20)
+        output_variables = [
+            "Voltage [V]",
+            "X-averaged negative particle concentration [mol.m-3]",
+        ]
+
+        solver = pybamm.IDAKLUSolver(output_variables=output_variables)
+        compiled_model = solver.compile(
+            model, tmp_path, inputs=inputs, calculate_sensitivities=True
+        )
+        assert compiled_model.output_variables == output_variables
+        assert compiled_model.sensitivity_names == ["Current function [A]"]
+        sol = compiled_model.solve(t_eval, inputs=inputs, t_interp=t_interp)
+        assert sol.y is None
+
+        solution = pybamm.IDAKLUSolver(output_variables=output_variables).solve(
+            model,
+            t_eval,
+            inputs=inputs,
+            t_interp=t_interp,
+            calculate_sensitivities=True,
+        )
+        for var in output_variables:
+            np.testing.assert_allclose(
+                np.squeeze(sol[var]), solution[var].data, rtol=1e-6
+            )
+        np.testing.assert_allclose(
+            sol.sensitivities["Voltage [V]"]["Current function [A]"].flatten(),
+            np.array(
+                solution["Voltage [V]"].sensitivities["Current function [A]"]
+            ).flatten(),
+            rtol=1e-5,
+        )
+        with pytest.raises(KeyError, match="not an output variable"):
+            sol["Time [s]"]
+
+    def test_compile_errors(self, tmp_path):
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v")
+        model.rhs = {v: -v}
+        model.initial_conditions = {v: 1}
+        model.convert_to_format = "jax"
+        with pytest.raises(pybamm.SolverError, match="convert_to_format"):
+            pybamm.IDAKLUSolver().compile(model, tmp_path)
+
+        model = pybamm.BaseModel()
+        model.rhs = {v: -v}
+        model.initial_conditions = {v: 1}
+        model.events = [
+            pybamm.Event("switch", pybamm.Scalar(1), pybamm.EventType.DISCONTINUITY)
+        ]
+        pybamm.Discretisation().process_model(model)
+        with pytest.raises(pybamm.SolverError, match="discontinuity events"):
+            pybamm.IDAKLUSolver().compile(model, tmp_path)
+
+        model = pybamm.BaseModel()
+        model.rhs = {v: -v}
+        model.initial_conditions = {v: 1}
+        pybamm.Discretisation().process_model(model)
+        with pytest.raises(pybamm.SolverError, match="Failed to compile"):
+            pybamm.IDAKLUSolver().compile(
+                model, tmp_path, compiler_flags=["-not-a-flag"]
+            )
@@ -0,0 +1,79 @@
+#
+# Tests for the ConsistentStateCache class
+#
+import pytest
+import numpy as np
+
+import pybamm
+
+
+class TestConsistentStateCache:
+    def test_lookup_and_store(self):
+        cache = pybamm.ConsistentStateCache(tol=0.1, maxsize=2)
+        model = pybamm.BaseModel()
+        other_model = pybamm.BaseModel()
+
+        assert cache.lookup(model, np.array([1.0, 1.0])) is None
+        cache.store(model, np.array([1.0, 1.0]), np.array([5.0]))
+        cache.store(model, np.array([1.0, 1.05]), np.array([6.0]))
+        assert len(cache) == 2
+
+        # the closest state within the tolerance is used
+        np.testing.assert_array_equal(cache.lookup(model, np.array([1.0, 1.04])), 6)
+        np.testing.assert_array_equal(cache.lookup(model, np.array([1.0, 0.99])), 5)
+        assert cache.lookup(model, np.array([2.0, 2.0])) is None
+
+        # states are not shared between models or inputs
+        assert cache.lookup(other_model, np.array([1.0, 1.0])) is None
+        assert cache.lookup(model, np.array([1.0, 1.0]), {"a": 1}) is None
+        cache.store(model, np.array([1.0, 1.0]), np.array([7.0]), {"a": 1})
+        np.testing.assert_array_equal(
+            cache.lookup(model, np.array([1.0, 1.0]), {"a": 1}), 7
+        )
+        assert (cache.hits, cache.misses) == (3, 4)
+
+        # the least recently used state was discarded
+        assert len(cache) == 2
+        np.testing.assert_array_equal(cache.lookup(model, np.array([1.0, 1.05])), 5)
+
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    @pytest.mark.parametrize("root_method", ["casadi", "lm"])
+    def test_solver_warm_start(self, root_method):
+        model = pybamm.BaseModel()
+        a = pybamm.Variable("a")
+        b = pybamm.Variable("b")
+        c = pybamm.Variable("c")
+        k = pybamm.InputParameter("k")
+        model.rhs = {a: -a, c: 1}
+        model.algebraic = {b: b**3 + b - k * a}
+        model.initial_conditions = {a: 1, b: 0, c: 0}
+        pybamm.Discretisation().process_model(model)
+
+        solver = pybamm.CasadiSolver(root_method=root_method, root_tol=1e-10)
+        cache = pybamm.ConsistentStateCache()
+        solver.consistent_state_cache = cache
+        solution = solver.solve(model, [0, 1], inputs={"k": 2})
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        # the same state is found again, starting from the cached state
+        solution_cached = solver.solve(model, [0, 1], inputs={"k": 2})
+        assert (cache.hits, cache.misses) == (1, 1)
+        np.testing.assert_allclose(
+            solution_cached.all_ys[0][:, 0], solution.all_ys[0][:, 0], rtol=1e-8
+        )
+
+        # "c" does not enter the algebraic equation so does not affect the lookup
+        model.y0 = np.array([[1.0], [100.0], [0.0]])
+        y0 = solver.calculate_consistent_state(model, inputs={"k": 2})
+        assert cache.hits == 2
+        np.testing.assert_allclose(np.ravel(y0), [1, 100, 1], rtol=1e-8)
+
+        # different inputs do not use the cached state
+        solver.solve(model, [0, 1], inputs={"k": 10})
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        with pytest.raises(TypeError, match="must be a pybamm.ConsistentStateCache"):
+            solver.consistent_state_cache = {}
@@ -0,0 +1,140 @@
+#
+# Tests for the JaxCompilationCache class
+#
+import warnings
+
+import pytest
+import numpy as np
+
+import pybamm
+from tests import get_mesh_for_testing
+
+
+def get_model(rate=1):
+    model = pybamm.BaseModel()
+    var = pybamm.Variable("var")
+    model.rhs = {var: -rate * var}
+    model.initial_conditions = {var: 1}
+    pybamm.Discretisation().process_model(model)
+    return model
+
+
+class TestJaxCompilationCache:
+    def test_key(self, tmp_path):
+        cache = pybamm.JaxCompilationCache(tmp_path)
+        solver = pybamm.ScipySolver(rtol=1e-6)
+        model = get_model()
+        solver.set_up(model)
+        key = cache.key(model, solver, np.linspace(0, 1, 10))
+
+        # the key only depends on the shape of t_eval
+        assert cache.key(model, solver, np.linspace(0, 2, 10)) == key
+        assert cache.key(model, solver, np.linspace(0, 1, 11)) != key
+        # the same equations give the same key
+        other_model = get_model()
+        solver.set_up(other_model)
+        assert cache.key(other_model, solver, np.linspace(0, 1, 10)) == key
+        # different equations, tolerances or batch sizes give different keys
+        other_model = get_model(rate=2)
+        solver.set_up(other_model)
+        assert cache.key(other_model, solver, np.linspace(0, 1, 10)) != key
+        assert cache.key(model, solver, np.linspace(0, 1, 10), batch_size=4) != key
+        solver.rtol = 1e-8
+        assert cache.key(model, solver, np.linspace(0, 1, 10)) != key
+
+    def test_track_and_clear(self, tmp_path):
+        cache = pybamm.JaxCompilationCache(tmp_path)
+        assert len(cache) == 0
+        assert cache.entries() == {}
+
+        def compile_and_solve(name):
+            # stands in for a jitted function, which writes to the cache on its
+            # first call
+            (tmp_path / name).write_bytes(b"compiled")
+            return name
+
+        solve = cache.track("a", compile_and_solve, {"model": "model a"})
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert "a" not in cache
+        assert solve("jit_solve_a") == "jit_solve_a"
+        assert "a" in cache
+        assert cache.entries()["a"] == {"model": "model a", "files": ["jit_solve_a"]}
+        # only the first call is recorded
+        solve("jit_solve_a_again")
+        assert cache.entries()["a"]["files"] == ["jit_solve_a"]
+
+        # a solve in the index is a hit, and is not wrapped
+        assert cache.track("a", compile_and_solve) is compile_and_solve
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        cache.track("b", compile_and_solve)("jit_solve_b")
+        assert len(cache) == 2
+        assert cache.nbytes == 3 * len(b"compiled")
+
+        # clearing a key removes its files only
+        cache.clear("a")
+        assert "a" not in cache and "b" in cache
+        assert not (tmp_path / "jit_solve_a").exists()
+        assert (tmp_path / "jit_solve_a_again").exists()
+        cache.clear("not a key")
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
+        assert list(tmp_path.iterdir()) == []
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    @pytest.mark.skipif(not pybamm.has_jax(), reason="jax or jaxlib is not installed")
+    def test_jax_solver(self, tmp_path):
+        model = pybamm.BaseModel()
+        model.convert_to_format = "jax"
+        domain = ["negative electrode", "separator", "positive electrode"]
+        var = pybamm.Variable("var", domain=domain)
+        model.rhs = {var: -pybamm.InputParameter("rate") * var}
+        model.initial_conditions = {var: 1}
+        mesh = get_mesh_for_testing()
+        disc = pybamm.Discretisation(mesh, {"macroscale": pybamm.FiniteVolume()})
+        disc.process_model(model)
+
+        cache = pybamm.JaxCompilationCache(tmp_path)
+        solver = pybamm.JaxSolver(rtol=1e-8, atol=1e-8, compilation_cache=cache)
+        t_eval = np.linspace(0, 5, 80)
+        solution = solver.solve(model, t_eval, inputs={"rate": 0.1})
+        np.testing.assert_allclose(
+            solution.y[0], np.exp(-0.1 * t_eval), rtol=1e-6, atol=1e-6
+        )
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert len(cache) == 1
+        (entry,) = cache.entries().values()
+        assert entry["t_eval_shape"] == [80]
+
+        # a new solver reuses the entry for different times of the same shape
+        solver = pybamm.JaxSolver(rtol=1e-8, atol=1e-8, compilation_cache=cache)
+        t_eval = np.linspace(0, 10, 80)
+        solution = solver.solve(model, t_eval, inputs={"rate": 0.1})
+        np.testing.assert_allclose(
+            solution.y[0], np.exp(-0.1 * t_eval), rtol=1e-6, atol=1e-6
+        )
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert len(cache) == 1
+
+    @pytest.mark.skipif(not pybamm.has_jax(), reason="jax or jaxlib is not installed")
+    def test_enable(self, tmp_path):
+        import jax
+
+        previous_dir = jax.config.jax_compilation_cache_dir
+        try:
+            cache = pybamm.JaxCompilationCache(tmp_path / "a")
+            cache.enable()
+            assert jax.config.jax_compilation_cache_dir == str(tmp_path / "a")
+            # enabling the same cache again does not warn
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                pybamm.JaxCompilationCache(tmp_path / "a").enable()
+
+            # replacing a directory that is already set warns
+            with pytest.warns(UserWarning, match="is replaced by"):
+                pybamm.JaxCompilationCache(tmp_path / "b").enable()
+            assert jax.config.jax_compilation_cache_dir == str(tmp_path / "b")
+        finally:
+            jax.config.update("jax_compilation_cache_dir", previous_dir)
@@ -200,6 +200,54 @@ class TestJaxSolver:
             solution.y[0], np.exp(-0.2 * solution.t), rtol=1e-6, atol=1e-6
         )
 
+    @pytest.mark.parametrize("method", ["RK45", "BDF"])
+    def test_model_solver_with_vmap_inputs(self, method):
+        model = pybamm.BaseModel()
+        model.convert_to_format = "jax"
+        domain = ["negative electrode", "separator", "positive electrode"]
+        var = pybamm.Variable("var", domain=domain)
+        model.rhs = {var: -pybamm.InputParameter("rate") * var}
+        model.initial_conditions = {var: 1}
+
+        mesh = get_mesh_for_testing()
+        spatial_methods = {"macroscale": pybamm.FiniteVolume()}
+        disc = pybamm.Discretisation(mesh, spatial_methods)
+        disc.process_model(model)
+
+        solver = pybamm.JaxSolver(method=method, rtol=1e-8, atol=1e-8, vmap_inputs=True)
+        t_eval = np.linspace(0, 5, 80)
+        rates = [0.1, 0.2, 0.3]
+        solutions = solver.solve(
+            model, t_eval, inputs=[{"rate": rate} for rate in rates]
+        )
+        for rate, solution in zip(rates, solutions):
+            np.testing.assert_allclose(
+                solution.y[0], np.exp(-rate * solution.t), rtol=1e-6, atol=1e-6
+            )
+
+        # the batch of 3 inputs is padded to 4, and the compiled function is reused
+        # for batches of the same rounded size
+        assert solver.batch_bucket(3) == 4
+        batched_solve = solver.get_batched_solve(model, t_eval, 3)
+        assert solver.get_batched_solve(model, t_eval, 4) is batched_solve
+        assert solver.get_batched_solve(model, t_eval, 5) is not batched_solve
+        y = batched_solve({"rate": np.array([0.1, 0.2, 0.3, 0.4])})
+        assert y.shape == (4, model.len_rhs, len(t_eval))
+        np.testing.assert_allclose(y[3, 0], np.exp(-0.4 * t_eval), rtol=1e-6, atol=1e-6)
+
+        # without vmap, the inputs are solved concurrently on any platform
+        solver = pybamm.JaxSolver(
+            method=method, rtol=1e-8, atol=1e-8, vmap_inputs=False
+        )
+        solutions = solver.solve(
+            model, t_eval, inputs=[{"rate": rate} for rate in rates]
+        )
+        assert len(solutions) == len(rates)
+        for rate, solution in zip(rates, solutions):
+            np.testing.assert_allclose(
+                solution.y[0], np.exp(-rate * solution.t), rtol=1e-6, atol=1e-6
+            )
+
     def test_get_solve(self):
         # Create model
         model = pybamm.BaseModel()
@@ -73,3 +73,29 @@ class TestLRUDict:
         with pytest.raises(KeyError):
             _ = d["b"]  # checks getitem()
         assert d.get("b") is None  # checks get()
+
+    def test_lrudict_maxbytes(self):
+        d = LRUDict(maxbytes=10)
+        d["a"] = 1
+        d["b"] = 2
+        # items count as 0 bytes until their size is set
+        assert d.nbytes == 0
+        d.set_nbytes("a", 4)
+        d.set_nbytes("b", 4)
+        assert d.nbytes == 8
+        d.get("a")
+        d["c"] = 3
+        d.set_nbytes("c", 4)
+        # the least recently used item is evicted
+        assert list(d.keys()) == ["a", "c"]
+        assert (d.nbytes, d.evictions) == (8, 1)
+        # the most recently used item is kept even if it is over the budget
+        d.set_nbytes("a", 20)
+        assert list(d.keys()) == ["a"]
+        assert (d.nbytes, d.evictions) == (20, 2)
+        d.pop("a")
+        assert d.nbytes == 0
+        d["d"] = 4
+        d.set_nbytes("d", 5)
+        d.clear()
+        assert d.nbytes == 0
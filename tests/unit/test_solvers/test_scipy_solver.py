@@ -397,6 +397,98 @@ class TestScipySolver:
             )
             np.testing.assert_allclose(solution.y[0], np.exp(-0.1 * solution.t))
 
+    @pytest.mark.parametrize("use_jacobian", [True, False])
+    def test_model_solver_sparse_jacobian_with_casadi(self, use_jacobian):
+        model = pybamm.BaseModel()
+        model.use_jacobian = use_jacobian
+        whole_cell = ["negative electrode", "separator", "positive electrode"]
+        var = pybamm.Variable("var", domain=whole_cell)
+        x = pybamm.SpatialVariable("x", domain=whole_cell)
+        model.rhs = {var: pybamm.div(pybamm.grad(var)) - var**2}
+        model.initial_conditions = {var: 1 + x}
+        model.boundary_conditions = {
+            var: {
+                "left": (pybamm.Scalar(0), "Neumann"),
+                "right": (pybamm.Scalar(0), "Neumann"),
+            }
+        }
+        mesh = get_mesh_for_testing()
+        disc = pybamm.Discretisation(mesh, {"macroscale": pybamm.FiniteVolume()})
+        disc.process_model(model)
+
+        solver = pybamm.ScipySolver(rtol=1e-8, atol=1e-8)
+        t_eval = np.linspace(0, 1, 10)
+        solution = solver.solve(model, t_eval)
+        reference = pybamm.CasadiSolver(rtol=1e-8, atol=1e-8).solve(model, t_eval)
+        np.testing.assert_allclose(solution.y, reference.y, rtol=1e-5)
+        if use_jacobian:
+            assert "jacobian colouring" not in solver._model_set_up[model]
+        else:
+            # the colouring of the Jacobian is calculated once for each model
+            colouring = solver._model_set_up[model]["jacobian colouring"]
+            # the finite volume Jacobian is tridiagonal, so needs three colours
+            assert colouring.n_colours == 3
+            solver.solve(model, t_eval)
+            assert solver._model_set_up[model]["jacobian colouring"] is colouring
+
+    def test_model_solver_vectorized_python(self):
+        whole_cell = ["negative electrode", "separator", "positive electrode"]
+        models = []
+        for convert_to_format in ["python", "casadi"]:
+            model = pybamm.BaseModel()
+            model.use_jacobian = False
+            model.convert_to_format = convert_to_format
+            var = pybamm.Variable("var", domain=whole_cell)
+            x = pybamm.SpatialVariable("x", domain=whole_cell)
+            model.rhs = {var: pybamm.div(pybamm.grad(var)) - var**2}
+            model.initial_conditions = {var: 1 + x}
+            model.boundary_conditions = {
+                var: {
+                    "left": (pybamm.Scalar(0), "Neumann"),
+                    "right": (pybamm.Scalar(0), "Neumann"),
+                }
+            }
+            mesh = get_mesh_for_testing()
+            disc = pybamm.Discretisation(mesh, {"macroscale": pybamm.FiniteVolume()})
+            disc.process_model(model)
+            models.append(model)
+        model, casadi_model = models
+
+        solver = pybamm.ScipySolver(rtol=1e-8, atol=1e-8)
+        t_eval = np.linspace(0, 1, 10)
+        solution = solver.solve(model, t_eval)
+        reference = pybamm.CasadiSolver(rtol=1e-8, atol=1e-8).solve(
+            casadi_model, t_eval
+        )
+        np.testing.assert_allclose(solution.y, reference.y, rtol=1e-5)
+        # the finite-difference Jacobian uses the batched evaluation of the model
+        assert model.rhs_eval._batched_python_str
+
+    def test_jacobian_colouring(self):
+        from pybamm.solvers.scipy_solver import JacobianColouring
+
+        J = np.array(
+            [
+                [1.0, 2.0, 0.0, 0.0],
+                [0.0, 3.0, 4.0, 0.0],
+                [5.0, 0.0, 0.0, 6.0],
+            ]
+        )
+        rows, cols = np.nonzero(J)
+        colouring = JacobianColouring(rows, cols, J.shape)
+        # no two columns of the same colour share a row
+        for row in J != 0:
+            colours = colouring.colours[row]
+            assert len(set(colours)) == len(colours)
+        assert colouring.n_colours == 2
+
+        def fun(t, y):
+            return J @ y**2
+
+        y = np.array([1.0, 2.0, 3.0, 4.0])
+        jacobian = colouring.jacobian(fun)(0, y)
+        np.testing.assert_allclose(jacobian.toarray(), J * 2 * y, rtol=1e-6)
+
     def test_model_solver_with_inputs_with_casadi(self):
         # Create model
         model = pybamm.BaseModel()
@@ -359,6 +359,47 @@ class TestSolution:
         np.testing.assert_array_equal(twoc_sol.entries, twoc_sol(solution.t))
         np.testing.assert_array_equal(twoc_sol.entries, 2 * c_sol.entries)
 
+    def test_update_several_variables(self):
+        model = pybamm.lithium_ion.SPM()
+        param = model.default_parameter_values
+        param.update({"Current function [A]": "[input]"})
+        sim = pybamm.Simulation(model, parameter_values=param)
+        # two sub-solutions, one of which is longer than a mapped block
+        sol = sim.solve(np.linspace(0, 600, 100), inputs={"Current function [A]": 1})
+        sol = sol + sim.solver.step(
+            sol.last_state,
+            sim.built_model,
+            100,
+            npts=10,
+            inputs={"Current function [A]": 2},
+        )
+        variables = [
+            "Voltage [V]",
+            "Electrolyte concentration [mol.m-3]",
+            "Negative particle concentration [mol.m-3]",
+            "Throughput capacity [A.h]",
+        ]
+        sol.update(variables)
+        assert all(sol[var].entries_raw_initialized for var in variables)
+        fused = sim.built_model._variables_casadi_fused
+        assert list(fused) == [tuple(sorted(variables))]
+        # the same variables in another order reuse the function
+        sol.copy().update(variables[::-1])
+        assert len(fused) == 1
+        assert fused.maxsize is not None
+        assert sim.built_model.new_copy()._variables_casadi_fused.maxsize == (
+            fused.maxsize
+        )
+
+        sim.built_model._variables_casadi.clear()
+        for var in variables:
+            expected = sol.copy()[var].entries
+            np.testing.assert_allclose(sol[var].entries, expected, rtol=1e-12)
+
+        # a single variable is observed on its own
+        sol.update(["Current [A]"])
+        assert not sol["Current [A]"].entries_raw_initialized
+
     def test_plot(self):
         model = pybamm.BaseModel()
         c = pybamm.Variable("c")
@@ -0,0 +1,75 @@
+#
+# Tests for the SolverStatistics class
+#
+import pytest
+import numpy as np
+
+import pybamm
+
+
+class TestSolverStatistics:
+    def test_add(self):
+        statistics = pybamm.SolverStatistics(n_steps=2, set_up_time=pybamm.TimerTime(1))
+        assert statistics.set_up_time == 1
+        assert statistics.n_rhs_evaluations is None
+        assert statistics.total_time == 1
+
+        other = pybamm.SolverStatistics(n_steps=3, n_rhs_evaluations=4, solve_time=2)
+        total = statistics + other
+        assert (total.n_steps, total.n_rhs_evaluations) == (5, 4)
+        assert total.total_time == 3
+        # the statistics that were added are unchanged
+        assert statistics.n_steps == 2
+
+        total = sum([statistics, other, None])
+        assert total.n_steps == 5
+        assert pybamm.SolverStatistics().total_time is None
+        assert repr(other) == (
+            "pybamm.SolverStatistics(n_steps=3, n_rhs_evaluations=4, solve_time=2)"
+        )
+
+        with pytest.raises(ValueError, match="not a solver statistic"):
+            pybamm.SolverStatistics(n_bad=1)
+
+    @pytest.mark.parametrize(
+        "solver",
+        [
+            pybamm.CasadiSolver(mode="safe"),
+            pybamm.CasadiSolver(mode="fast with events"),
+            pybamm.CasadiSolver(
+                mode="safe without grid", event_location="interpolation"
+            ),
+            pybamm.ScipySolver(),
+        ],
+    )
+    def test_solver_statistics(self, solver):
+        model = pybamm.BaseModel()
+        var = pybamm.Variable("var")
+        model.rhs = {var: -0.1 * var}
+        model.initial_conditions = {var: 1}
+        model.events = [pybamm.Event("var = 0.5", var - 0.5)]
+        pybamm.Discretisation().process_model(model)
+
+        solution = solver.solve(model, np.linspace(0, 10, 11))
+        statistics = solution.statistics
+        assert statistics.n_steps > 0
+        assert statistics.n_rhs_evaluations > 0
+        assert statistics.set_up_time == solution.set_up_time.value
+        assert statistics.solve_time == solution.solve_time.value
+        assert 0 < statistics.integration_time < statistics.solve_time
+        assert 0 < statistics.post_processing_time < statistics.solve_time
+        if isinstance(solver, pybamm.CasadiSolver):
+            assert statistics.n_nonlinear_iterations > 0
+            assert statistics.event_location_time > 0
+
+        # the statistics of the steps add up
+        first_step = solver.step(None, model, 2)
+        second_step = solver.step(first_step, model, 2, save=False)
+        steps = first_step + second_step
+        assert (
+            steps.statistics.n_rhs_evaluations
+            == first_step.statistics.n_rhs_evaluations
+            + second_step.statistics.n_rhs_evaluations
+        )
+        assert steps.copy().statistics.n_steps == steps.statistics.n_steps
+        assert steps.last_state.statistics.n_steps is None
@@ -0,0 +1,109 @@
+#
+# Tests for the StreamedSolution class
+#
+import pytest
+import numpy as np
+
+import pybamm
+
+
+def make_cycle(model, t0):
+    steps = [
+        pybamm.Solution(
+            np.array([t0, t0 + 1]), np.array([[t0, t0 + 1]]), model, {"a": 1}
+        ),
+        pybamm.EmptySolution("Event exceeded in initial conditions", t=t0 + 1),
+        pybamm.Solution(
+            np.array([t0 + 1, t0 + 2]),
+            np.array([[t0 + 1, t0 + 2]]),
+            model,
+            {"a": 2},
+            np.array([t0 + 2]),
+            np.array([t0 + 2]),
+            "event",
+        ),
+    ]
+    cycle_solution = steps[0] + steps[1] + steps[2]
+    cycle_solution.steps = steps
+    return cycle_solution
+
+
+class TestStreamedSolution:
+    def test_append_and_load_cycles(self, tmp_path):
+        model = pybamm.BaseModel()
+        v = pybamm.Variable("v")
+        model.rhs = {v: 1}
+        model.initial_conditions = {v: 0}
+        model.variables = {"2v": 2 * v}
+        pybamm.Discretisation().process_model(model)
+
+        # cycles from a previous experiment are only removed if asked to
+        (tmp_path / "cycle_000009.npz").touch()
+        (tmp_path / "results.csv").touch()
+        with pytest.raises(ValueError, match="already contains stored cycles"):
+            pybamm.StreamedSolution(tmp_path)
+        assert (tmp_path / "cycle_000009.npz").exists()
+        streamed_sol = pybamm.StreamedSolution(tmp_path, compress=True, overwrite=True)
+        assert list(tmp_path.iterdir()) == [tmp_path / "results.csv"]
+
+        streamed_sol.append_cycle(make_cycle(model, 0), 1)
+        streamed_sol.append_cycle(None, 2)
+        streamed_sol.append_cycle(make_cycle(model, 2), 3)
+        assert len(list(tmp_path.glob("cycle_*.npz"))) == 2
+        assert streamed_sol._models == [model]
+
+        cycles = streamed_sol.cycles
+        assert len(cycles) == 3
+        assert cycles[1] is None
+        assert cycles[-1] is cycles[2]
+        assert cycles[0:2][1] is None
+
+        cycle = cycles[0]
+        assert cycle.termination == "event"
+        assert cycle.steps[1].termination == "Event exceeded in initial conditions"
+        assert isinstance(cycle.steps[1], pybamm.EmptySolution)
+        assert cycle.steps[0].all_inputs[0]["a"] == 1
+        np.testing.assert_array_equal(cycle.steps[2].t_event, [2])
+        np.testing.assert_array_equal(cycle["2v"].data, [0, 2, 4])
+
+        # repeated time points between cycles are skipped
+        np.testing.assert_array_equal(streamed_sol.t, [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(streamed_sol["2v"], [0, 2, 4, 6, 8])
+
+        solution = streamed_sol.to_solution()
+        assert isinstance(solution, pybamm.Solution)
+        assert solution.cycles[1] is None
+        np.testing.assert_array_equal(solution.t, [0, 1, 2, 3, 4])
+
+    def test_errors(self, tmp_path):
+        model = pybamm.BaseModel()
+        streamed_sol = pybamm.StreamedSolution(tmp_path)
+        cycle_solution = pybamm.Solution(
+            np.array([0, 1]),
+            np.array([[0, 1]]),
+            model,
+            {},
+            all_sensitivities={"a": [np.zeros((2, 1))]},
+        )
+        cycle_solution.steps = [cycle_solution]
+        with pytest.raises(NotImplementedError, match="sensitivities"):
+            streamed_sol.append_cycle(cycle_solution, 1)
+
+        # no cycle stored
+        with pytest.raises(ValueError, match="No cycle has been stored"):
+            streamed_sol.to_solution()
+        streamed_sol.append_cycle(None, 1)
+        with pytest.raises(ValueError, match="No cycle has been stored"):
+            streamed_sol.to_solution()
+
+    def test_detach_state(self):
+        model = pybamm.BaseModel()
+        y = np.arange(4.0).reshape(1, 4)
+        solution = pybamm.Solution(np.arange(4.0), y, model, {})
+        state = pybamm.solvers.streamed_solution.detach_state(solution.last_state)
+        assert state.all_ys[0].base is None
+        np.testing.assert_array_equal(state.all_ys[0], [[3]])
+        assert state.t[0] == 3
+
+        empty = pybamm.EmptySolution()
+        assert pybamm.solvers.streamed_solution.detach_state(empty) is empty
@@ -632,3 +632,123 @@ class TestFiniteVolume:
 
         m = mesh["negative electrode"].npts
         np.testing.assert_array_equal(inner_disc.evaluate(y=y), np.zeros((n * m, 1)))
+
+    def test_block_diagonal_operators(self):
+        mesh = get_mesh_for_testing()
+        fin_vol = pybamm.FiniteVolume()
+        fin_vol.build(mesh)
+        domains = {"primary": ["negative electrode"]}
+        p2d_domains = {
+            "primary": ["negative particle"],
+            "secondary": ["negative electrode"],
+        }
+        n_r = mesh["negative particle"].npts
+        n_x = mesh["negative electrode"].npts
+
+        # operators repeated for each node in the secondary dimensions only store
+        # one block
+        grad = fin_vol.gradient_matrix("negative particle", p2d_domains)
+        assert isinstance(grad, pybamm.BlockDiagonalMatrix)
+        assert grad.repeats == n_x
+        assert grad.block.shape == (n_r - 1, n_r)
+        np.testing.assert_array_equal(
+            grad.evaluate().toarray(),
+            kron(eye(n_x), grad.block).toarray(),
+        )
+        div = fin_vol.divergence_matrix(p2d_domains)
+        assert isinstance(div, pybamm.BlockDiagonalMatrix)
+        assert div.shape == (n_x * n_r, n_x * (n_r + 1))
+        assert not isinstance(
+            fin_vol.gradient_matrix("negative electrode", domains),
+            pybamm.BlockDiagonalMatrix,
+        )
+
+        # discretised operators keep the block structure
+        var = pybamm.Variable("var", domains=p2d_domains)
+        disc = pybamm.Discretisation(mesh, {"negative particle": fin_vol})
+        disc.bcs = {
+            var: {
+                "left": (pybamm.Scalar(0), "Neumann"),
+                "right": (pybamm.Scalar(1), "Dirichlet"),
+            }
+        }
+        disc.set_variable_slices([var])
+        r = mesh["negative particle"].nodes
+        y = np.tile(r**2, n_x)
+        for expr in [pybamm.grad(var), pybamm.div(pybamm.grad(var))]:
+            expr_disc = disc.process_symbol(expr)
+            assert any(
+                isinstance(node, pybamm.BlockDiagonalMatrix)
+                for node in expr_disc.pre_order()
+            )
+            result = expr_disc.evaluate(None, y).reshape(n_x, -1)
+            np.testing.assert_allclose(result, np.tile(result[0], (n_x, 1)))
+
+    def test_operator_cache(self):
+        mesh = get_mesh_for_testing()
+        fin_vol = pybamm.FiniteVolume()
+        fin_vol.build(mesh)
+        domains = {"primary": ["negative electrode"]}
+        p2d_domains = {
+            "primary": ["negative particle"],
+            "secondary": ["negative electrode"],
+        }
+
+        # the same matrix node is returned for the same submesh and repeats
+        grad = fin_vol.gradient_matrix("negative electrode", domains)
+        assert fin_vol.gradient_matrix("negative electrode", domains) is grad
+        div = fin_vol.divergence_matrix(p2d_domains)
+        assert fin_vol.divergence_matrix(p2d_domains) is div
+        assert fin_vol.divergence_matrix(domains) is not div
+        for direction in ["forward", "backward"]:
+            matrix = fin_vol.indefinite_integral_matrix_edges(domains, direction)
+            assert fin_vol.indefinite_integral_matrix_edges(domains, direction) is (
+                matrix
+            )
+            matrix = fin_vol.indefinite_integral_matrix_nodes(domains, direction)
+            assert fin_vol.indefinite_integral_matrix_nodes(domains, direction) is (
+                matrix
+            )
+        assert fin_vol.indefinite_integral_matrix_edges(
+            domains, "forward"
+        ) is not fin_vol.indefinite_integral_matrix_edges(domains, "backward")
+
+        # the cache is shared by spatial methods using the same mesh
+        var = pybamm.Variable("var", domain="negative electrode")
+        integral = fin_vol.definite_integral_matrix(var)
+        other_fin_vol = pybamm.FiniteVolume()
+        other_fin_vol.build(mesh)
+        assert other_fin_vol.definite_integral_matrix(var) is integral
+        assert other_fin_vol.definite_integral_matrix(
+            var, vector_type="column"
+        ) is not (integral)
+        assert other_fin_vol.gradient_matrix("negative electrode", domains) is grad
+        # but not by spatial methods using a different mesh
+        other_fin_vol.build(get_mesh_for_testing())
+        other_grad = other_fin_vol.gradient_matrix("negative electrode", domains)
+        assert other_grad is not grad
+        np.testing.assert_array_equal(
+            other_grad.evaluate().toarray(), grad.evaluate().toarray()
+        )
+
+        # integrals in the secondary dimension only depend on the number of points in
+        # the primary dimension, which is the same in both particles
+        var = pybamm.Variable("var", domains=p2d_domains)
+        secondary_integral = fin_vol.definite_integral_matrix(
+            var, integration_dimension="secondary"
+        )
+        assert (
+            fin_vol.definite_integral_matrix(var, integration_dimension="secondary")
+            is secondary_integral
+        )
+        var = pybamm.Variable(
+            "var",
+            domains={
+                "primary": ["positive particle"],
+                "secondary": ["negative electrode"],
+            },
+        )
+        assert (
+            fin_vol.definite_integral_matrix(var, integration_dimension="secondary")
+            is secondary_integral
+        )
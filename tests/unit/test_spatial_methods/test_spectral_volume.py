@@ -628,3 +628,31 @@ class TestSpectralVolume:
         np.testing.assert_array_almost_equal(
             grad_eqn_disc.evaluate(None, linear_y), expected
         )
+
+    def test_operator_cache(self):
+        mesh = get_mesh_for_testing()
+        spectral_volume = pybamm.SpectralVolume()
+        spectral_volume.build(mesh)
+        domains = {"primary": ["negative electrode"]}
+
+        grad = spectral_volume.gradient_matrix("negative electrode", domains)
+        penalty = spectral_volume.penalty_matrix(domains)
+        reconstruction = spectral_volume.cv_boundary_reconstruction_matrix(domains)
+        other_spectral_volume = pybamm.SpectralVolume()
+        other_spectral_volume.build(mesh)
+        assert (
+            other_spectral_volume.gradient_matrix("negative electrode", domains) is grad
+        )
+        assert other_spectral_volume.penalty_matrix(domains) is penalty
+        assert (
+            other_spectral_volume.cv_boundary_reconstruction_matrix(domains)
+            is reconstruction
+        )
+
+        # the matrices depend on the order, and differ from the finite volume ones
+        other_spectral_volume = pybamm.SpectralVolume(order=3)
+        other_spectral_volume.build(mesh)
+        assert other_spectral_volume.penalty_matrix(domains) is not penalty
+        fin_vol = pybamm.FiniteVolume()
+        fin_vol.build(mesh)
+        assert fin_vol.gradient_matrix("negative electrode", domains) is not grad
@@ -1,6 +1,8 @@
 import pytest
 import importlib
 import os
+import pickle
+import subprocess
 import sys
 import pybamm
 import tempfile
@@ -26,6 +28,100 @@ class TestUtil:
         symbol = pybamm.Scalar(0)
         assert pybamm.is_constant_and_can_evaluate(symbol)
 
+    def test_lazy_fuzzy_dict(self):
+        calls = []
+
+        def process(key, value):
+            calls.append(key)
+            return 10 * value
+
+        d = pybamm.LazyFuzzyDict(
+            {"a": 1, "b": 2, "Positive particle diffusivity [m2.s-1]": 3}, process
+        )
+        assert isinstance(d, pybamm.FuzzyDict)
+        assert d.n_unprocessed == 3
+        assert list(d.stored_values()) == [1, 2, 3]
+        assert "a" in d and len(d) == 3
+
+        # values are processed once, when first accessed
+        assert d["a"] == 10
+        assert d["a"] == 10
+        assert calls == ["a"]
+        assert d.is_processed("a") and not d.is_processed("b")
+        assert not d.is_processed("c")
+        assert d.get("c", 0) == 0
+        with pytest.raises(KeyError, match="Best matches are"):
+            d["c"]
+        # including values of renamed keys
+        with pytest.warns(DeprecationWarning):
+            assert d["Positive electrode diffusivity [m2.s-1]"] == 30
+        assert d.n_unprocessed == 1
+
+        # copies and set values
+        d_copy = d.copy()
+        assert isinstance(d_copy, pybamm.LazyFuzzyDict)
+        d_copy.update({"d": 4})
+        assert d_copy["d"] == 4
+        assert "d" not in d
+        assert d_copy["b"] == 20
+        assert not d.is_processed("b")
+        d["b"] = 5
+        assert d["b"] == 5
+        assert d.n_unprocessed == 0
+
+        # further processing steps
+        d = pybamm.LazyFuzzyDict({"a": 1, "b": 2, "c": 3}, process)
+        assert d["a"] == 10
+        d_then = d.then(lambda key, value: value + 1, deferred_symbols=["x"])
+        assert len(d_then.pipeline) == 2 and len(d.pipeline) == 1
+        assert d_then.n_unprocessed == 3
+        assert d_then.values_without_processing() == ["x"]
+        assert d.values_without_processing() == [10, 2, 3]
+        assert d_then["a"] == 11
+        assert d_then["b"] == 21
+        assert d_then.values_without_processing() == [11, 21, "x"]
+        assert d_then.then(lambda key, value: -value)["c"] == -31
+        d_then["c"] = 0
+        assert d_then.values_without_processing() == [11, 21, 0]
+
+        # methods that return all the values process them first
+        d = pybamm.LazyFuzzyDict({"a": 1, "b": 2}, process)
+        assert list(d.values()) == [10, 20]
+        d = pybamm.LazyFuzzyDict({"a": 1, "b": 2}, process)
+        assert dict(d) == {"a": 10, "b": 20}
+        d = pybamm.LazyFuzzyDict({"a": 1, "b": 2}, process)
+        assert d == {"a": 10, "b": 20}
+        d = pybamm.LazyFuzzyDict({"a": 1, "b": 2}, process)
+        assert d.pop("a") == 10
+        assert d.n_unprocessed == 1
+
+        # pickling stores the processed values only
+        d = pybamm.LazyFuzzyDict({"a": 1, "b": 2}, process)
+        d_pickled = pickle.loads(pickle.dumps(d))
+        assert type(d_pickled) is pybamm.FuzzyDict
+        assert d_pickled == {"a": 10, "b": 20}
+
+        # unless the steps are detached, in which case only the processed values and
+        # the keys of the others are kept
+        d = pybamm.LazyFuzzyDict({"a": 1, "b": 2, "c": 3}, process)
+        assert d["a"] == 10
+        d = d.then(lambda key, value: value + 1, deferred_symbols=["x"])
+        assert d["a"] == 11
+        assert d["b"] == 21
+        d_detached = d.detached()
+        assert d_detached.is_detached and not d.is_detached
+        d_pickled = pickle.loads(pickle.dumps(d_detached))
+        assert type(d_pickled) is pybamm.LazyFuzzyDict
+        assert d_pickled.n_unprocessed == 1
+        assert d_pickled.is_processed("b") and not d_pickled.is_processed("c")
+        assert d_pickled.values_without_processing() == [11, 21, "x"]
+        with pytest.raises(ValueError, match="processing steps have been detached"):
+            d_pickled["c"]
+        d_attached = d_pickled.attach({"c": 4}, lambda key, value: -value)
+        assert d_attached == {"a": 11, "b": 21, "c": -4}
+        with pytest.raises(ValueError, match="Only a detached"):
+            d_attached.attach({"c": 4}, process)
+
     def test_fuzzy_dict(self):
         d = pybamm.FuzzyDict(
             {
@@ -116,9 +212,12 @@ class TestUtil:
             ):
                 pybamm.util.import_optional_dependency(import_pkg)
 
-        # Restore optional dependencies
+        # Restore optional dependencies, unloading those that were not imported yet
         for import_pkg in present_optional_import_deps:
-            sys.modules[import_pkg] = modules[import_pkg]
+            if modules[import_pkg] is None:
+                sys.modules.pop(import_pkg)
+            else:
+                sys.modules[import_pkg] = modules[import_pkg]
 
     def test_pybamm_import(self):
         optional_distribution_deps = get_optional_distribution_deps("pybamm")
@@ -135,10 +234,11 @@ class TestUtil:
                 sys.modules[module_name] = None
 
         # Unload pybamm and its sub-modules
+        pybamm_modules = {}
         for module_name in list(sys.modules.keys()):
             base_module_name = module_name.split(".")[0]
             if base_module_name == "pybamm":
-                sys.modules.pop(module_name)
+                pybamm_modules[module_name] = sys.modules.pop(module_name)
 
         # Test pybamm is still importable
         try:
@@ -151,6 +251,46 @@ class TestUtil:
             # Restore optional dependencies and their sub-modules
             for module_name, module in modules.items():
                 sys.modules[module_name] = module
+            # Restore the original pybamm modules, which the other tests use
+            for module_name in list(sys.modules.keys()):
+                if module_name.split(".")[0] == "pybamm":
+                    sys.modules.pop(module_name)
+            sys.modules.update(pybamm_modules)
+
+    def test_pybamm_import_is_lazy(self):
+        # Import pybamm in a new interpreter, since it is already imported here
+        slow_modules = [
+            "sympy",
+            "pandas",
+            "xarray",
+            "matplotlib",
+            "posthog",
+            "pooch",
+            "skfem",
+            "jax",
+            "pybamm.plotting.quick_plot",
+            "pybamm.solvers.jax_solver",
+        ]
+        code = (
+            "import sys, pybamm; "
+            f"print([m for m in {slow_modules} if m in sys.modules])"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYBAMM_DISABLE_TELEMETRY": "true"},
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_lazy_imports(self):
+        assert pybamm.QuickPlot.__module__ == "pybamm.plotting.quick_plot"
+        assert pybamm.JaxSolver.__module__ == "pybamm.solvers.jax_solver"
+        assert pybamm.DataLoader.__module__ == "pybamm.pybamm_data"
+        assert {"QuickPlot", "JaxSolver", "ScikitFiniteElement"} <= set(dir(pybamm))
+        with pytest.raises(AttributeError, match="has no attribute 'NotAClass'"):
+            pybamm.NotAClass
 
     def test_optional_dependencies(self):
         optional_distribution_deps = get_optional_distribution_deps("pybamm")